@@ -1 +1 @@
-__version__ = "2.2.4"
+__version__ = "2.16.0"
@@ -5,11 +5,14 @@ from gemd.enumeration.origin import Origin
 from gemd.entity.setters import validate_list
 from gemd.entity.file_link import FileLink
 from gemd.entity.link_by_uid import LinkByUID
-from gemd.entity.bounds_validation import get_validation_level, WarningLevel
+from gemd.entity.bounds_validation import get_validation_level, WarningLevel, \
+    _deferred_validation
 
-from typing import Optional, Union, Iterable, List, Type
+from typing import Optional, Union, Iterable, List, Tuple, Type, TypeVar
 from abc import abstractmethod
 
+T = TypeVar('T')
+
 
 class BaseAttribute(DictSerializable):
     """
@@ -66,6 +69,40 @@ class BaseAttribute(DictSerializable):
             else:
                 raise ValueError(message)
 
+    @staticmethod
+    def _check_all(attributes: List["BaseAttribute"]) -> List[str]:
+        """Check attributes against their templates at once, grouped by template."""
+        messages = []
+        for template, pairs, passed in BaseAttribute._check_groups((None, x) for x in attributes):
+            messages.extend(f"template.bounds {template.bounds} does not contain value {x.value}"
+                            for (_, x), ok in zip(pairs, passed) if not ok)
+        return messages
+
+    @staticmethod
+    def _check_groups(pairs: Iterable[Tuple[T, "BaseAttribute"]]
+                      ) -> List[Tuple[AttributeTemplate, List[Tuple[T, "BaseAttribute"]],
+                                      List[bool]]]:
+        """
+        Check the values of attributes against their templates, a template at a time.
+
+        Each attribute is paired with an owner, for the caller's reference.  Attributes
+        without a template object or a value are not checked.  Each group is returned with its
+        template, its pairs and whether each value is in bounds.
+        """
+        by_template = {}
+        for owner, attribute in pairs:
+            template = attribute.template
+            if isinstance(template, AttributeTemplate) and attribute.value is not None:
+                by_template.setdefault(id(template), (template, []))[1].append((owner, attribute))
+
+        return [(template, group, template.bounds._contains_each([x.value for _, x in group]))
+                for template, group in by_template.values()]
+
+    def _defer_check(self) -> bool:
+        """Record this attribute to be checked later, if validation is deferred."""
+        return get_validation_level() != WarningLevel.IGNORE \
+            and _deferred_validation(BaseAttribute._check_all, id(self), self)
+
     @property
     def value(self) -> BaseValue:
         """Get the value."""
@@ -77,7 +114,7 @@ class BaseAttribute(DictSerializable):
         if value is None:
             self._value = None
         elif isinstance(value, BaseValue):
-            if self.template is not None:
+            if self.template is not None and not self._defer_check():
                 self._check(self.template, value)
             self._value = value
         else:
@@ -94,7 +131,8 @@ class BaseAttribute(DictSerializable):
         if template is None:
             self._template = None
         elif isinstance(template, (self._template_type(), LinkByUID)):
-            if self.value is not None and isinstance(template, AttributeTemplate):
+            if self.value is not None and isinstance(template, AttributeTemplate) \
+                    and not self._defer_check():
                 self._check(template, self.value)
             self._template = template
         else:
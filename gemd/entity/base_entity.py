@@ -1,5 +1,6 @@
 """Base class for all entities."""
-from typing import TypeVar, Optional, Union, Iterable, List, Set, FrozenSet, MutableMapping, Dict
+from typing import TypeVar, Optional, Union, Iterable, List, Set, FrozenSet, MutableMapping, \
+    Dict, Generator, Tuple
 
 from gemd.entity.dict_serializable import DictSerializable
 from gemd.entity.has_dependencies import HasDependencies
@@ -128,10 +129,28 @@ class BaseEntity(DictSerializable):
 
         The cache uses ternary logic to communicate state.  True or False indicate a completed
         evaluation.  If the cache contains None, this indicates that we have not yet completed
-        an evaluation in an earlier frame of the stack.
+        an evaluation in an earlier frame of the stack.  The comparison uses an explicit
+        stack, so arbitrarily deep material histories can be compared.
         """
+        from gemd.util.impl import _trampoline
+
         if cache is None:
             cache = {}
+        return _trampoline(lambda pair: BaseEntity._equals_steps(*pair, cache=cache),
+                           (this, that))
+
+    @staticmethod
+    def _equals_steps(this: "BaseEntity",
+                      that: "BaseEntity",
+                      *,
+                      cache: Dict[FrozenSet, Optional[bool]]
+                      ) -> Generator[Tuple, Optional[bool], Optional[bool]]:
+        """
+        One level of :func:`_cached_equals`, as a generator for the explicit stack.
+
+        Rather than recursing to compare a pair of nested entities, the pair is yielded and the
+        result of comparing them is sent back.
+        """
         cache_key = frozenset((id(this), id(that)))
         if cache_key in cache:
             return cache[cache_key]
@@ -155,7 +174,7 @@ class BaseEntity(DictSerializable):
             this_value = this_dict[key]
             that_value = that_dict[key]
             if isinstance(this_value, BaseEntity) and isinstance(that_value, BaseEntity):
-                if BaseEntity._cached_equals(this_value, that_value, cache=cache) is False:
+                if (yield this_value, that_value) is False:
                     cache[cache_key] = False  # Mark as failed
                     return False
             elif isinstance(this_value, Iterable) and isinstance(that_value, Iterable) \
@@ -181,7 +200,7 @@ class BaseEntity(DictSerializable):
                     if isinstance(x, BaseEntity):
                         for i_found, y in enumerate(that_list):
                             # Unless something really broke, y is a BaseEntity
-                            result = BaseEntity._cached_equals(x, y, cache=cache)
+                            result = yield x, y
                             if result is True:
                                 found = True
                                 break
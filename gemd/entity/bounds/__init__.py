@@ -1,5 +1,6 @@
 """Bounds on a value."""
 # flake8: noqa
+from .base_bounds import ContainmentCacheInfo, memoized_containment
 from .categorical_bounds import CategoricalBounds
 from .composition_bounds import CompositionBounds
 from .integer_bounds import IntegerBounds
@@ -7,4 +8,4 @@ from .molecular_structure_bounds import MolecularStructureBounds
 from .real_bounds import RealBounds
 
 __all__ = ["RealBounds", "IntegerBounds", "CategoricalBounds", "CompositionBounds",
-           "MolecularStructureBounds"]
+           "MolecularStructureBounds", "ContainmentCacheInfo", "memoized_containment"]
@@ -1,17 +1,185 @@
 """Base class for all bounds."""
 from abc import abstractmethod
-from typing import TypeVar, Union
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Hashable, Iterator, List, NamedTuple, Optional, Sequence, \
+    Set, TypeVar, Union
 
 from gemd.entity.dict_serializable import DictSerializable
 
-__all__ = ["BaseBounds"]
+__all__ = ["BaseBounds", "ContainmentCacheInfo", "memoized_containment"]
 BaseBoundsType = TypeVar("BaseBoundsType", bound="BaseBounds")
 BaseValueType = TypeVar("BaseValueType", bound="BaseValue")  # noqa: F821
 
 
+class ContainmentCacheInfo(NamedTuple):
+    """Statistics for a :func:`memoized_containment` context, as for ``functools.lru_cache``."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _ContainmentMemo:
+    """A thread-safe LRU map from (contains routine, bounds, value) fingerprints to results."""
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.results = OrderedDict()
+        self.lock = Lock()
+
+    def cache_info(self) -> ContainmentCacheInfo:
+        """Report the hits, misses and size of the memo."""
+        with self.lock:
+            return ContainmentCacheInfo(hits=self.hits, misses=self.misses,
+                                        maxsize=self.maxsize, currsize=len(self.results))
+
+
+_MEMO: ContextVar[Optional[_ContainmentMemo]] = ContextVar("memoized_containment", default=None)
+
+
+@contextmanager
+def memoized_containment(maxsize: int = 4096) -> Iterator[_ContainmentMemo]:
+    """
+    Provide a context in which the results of ``contains`` on any bounds are remembered.
+
+    Large datasets tend to check the same values against the same bounds over and over, e.g.
+    thousands of runs at ``NominalReal(25, 'degC')`` against one condition template.  Within
+    this context, each result is looked up by a fingerprint of the bounds and the value, built
+    from their contents rather than their identities, so equal values share one entry and a
+    bounds that is mutated (e.g., by :meth:`~gemd.entity.bounds.real_bounds.RealBounds.update`)
+    is never answered from its old contents.  The least recently used results are dropped once
+    there are `maxsize` of them.
+
+    Like the validation level, the memo is local to the thread or asyncio task that entered the
+    context.  Nested contexts share the outermost memo, whatever their `maxsize`.
+
+    Parameters
+    ----------
+    maxsize: int
+        How many results to keep
+
+    Yields
+    ------
+    The memo, whose ``cache_info()`` reports its hits, misses and size as a
+    :class:`ContainmentCacheInfo`.
+
+    """
+    memo = _MEMO.get()
+    if memo is not None:
+        yield memo
+        return
+    token = _MEMO.set(_ContainmentMemo(maxsize))
+    try:
+        yield _MEMO.get()
+    finally:
+        _MEMO.reset(token)
+
+
+_ATOMS = frozenset({str, int, float, bool, type(None)})
+_DEEP_TYPES: Set[type] = set()  # Classes with sets, dicts or lists among their fields
+
+
+def _fingerprint(obj: Any) -> Hashable:
+    """
+    Summarize the contents of a bounds or value object, for memo keys.
+
+    Bounds and values hold only primitives and containers of them, so their fields are used
+    as they are.  Classes with unhashable fields are noted in ``_DEEP_TYPES`` the first time
+    that they are met, and get a :func:`_deep_fingerprint` from then on.
+    """
+    cls = type(obj)
+    if cls in _DEEP_TYPES:
+        return _deep_fingerprint(obj)
+    fields = getattr(obj, "__dict__", None)
+    if fields is None:  # e.g., None, which bounds contain nothing of
+        return obj
+    return cls, tuple(fields.items())
+
+
+def _deep_fingerprint(obj: Any) -> Hashable:
+    """Summarize the contents of an object, freezing any sets, dicts or lists within it."""
+    if type(obj) in _ATOMS:
+        return obj
+    if isinstance(obj, DictSerializable):
+        return type(obj), tuple((key, _deep_fingerprint(value))
+                                for key, value in vars(obj).items())
+    if isinstance(obj, (list, tuple)):
+        return tuple(_deep_fingerprint(x) for x in obj)
+    if isinstance(obj, (set, frozenset)):
+        return frozenset(obj)  # Whose elements are hashable already
+    if isinstance(obj, dict):
+        return frozenset((key, _deep_fingerprint(value)) for key, value in obj.items())
+    return obj
+
+
+def _is_deep(obj: Any) -> bool:
+    """Whether an object has unhashable fields, and so needs a deep fingerprint."""
+    try:
+        hash(_fingerprint(obj))
+        return False
+    except TypeError:
+        return isinstance(obj, DictSerializable)
+
+
+def _memoized(contains: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    """Consult the memo of the current :func:`memoized_containment` context, if any."""
+    @wraps(contains)
+    def wrapper(self, bounds):
+        memo = _MEMO.get()
+        if memo is None:
+            return contains(self, bounds)
+        key = (contains, _fingerprint(self), _fingerprint(bounds))
+        with memo.lock:
+            try:
+                result = memo.results.get(key)
+            except TypeError:  # A set, dict or list within
+                _DEEP_TYPES.update(type(x) for x in (self, bounds) if _is_deep(x))
+                try:
+                    key = (contains, _fingerprint(self), _fingerprint(bounds))
+                    result = memo.results.get(key)
+                except TypeError:  # Nothing to be done for, e.g., arrays
+                    key = result = None
+            if result is not None:
+                memo.hits += 1
+                memo.results.move_to_end(key)
+                return result
+        result = contains(self, bounds)
+        if key is not None:
+            with memo.lock:
+                memo.misses += 1
+                memo.results[key] = result
+                if len(memo.results) > memo.maxsize:
+                    memo.results.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def _is_vectorized(values: Any) -> bool:
+    """Whether a batch of values is a NumPy or pandas object, whose operations are elementwise."""
+    from gemd.entity.util import array_like
+
+    return isinstance(values, array_like()) and not isinstance(values, (list, tuple))
+
+
 class BaseBounds(DictSerializable):
     """Base class for bounds, including RealBounds and CategoricalBounds."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each implementation is wrapped, and keyed separately, since they chain through super()
+        if "contains" in vars(cls):
+            cls.contains = _memoized(cls.contains)
+
     @abstractmethod
     def contains(self, bounds: Union[BaseBoundsType, BaseValueType]):
         """
@@ -40,6 +208,23 @@ class BaseBounds(DictSerializable):
             return True
         raise TypeError('{} is not a Bounds object'.format(bounds))
 
+    def _contains_each(self, values: Sequence[BaseValueType]) -> List[bool]:
+        """
+        Check whether each of many values is contained, with the same answers as `contains`.
+
+        Values that :meth:`_screenable` reduces to a plain number or label are checked
+        together by the ``contains_many`` method of the subclass, and the rest one at a time.
+        """
+        raw = [self._screenable(value) for value in values]
+        batch = [x for x in raw if x is not None]
+        screened = iter(self.contains_many(batch) if batch else ())
+        return [self.contains(value) if x is None else bool(next(screened))
+                for value, x in zip(values, raw)]
+
+    def _screenable(self, value: BaseValueType) -> Optional[Any]:
+        """The number or label that ``contains_many`` can check in place of value, if any."""
+        return None
+
     @abstractmethod
     def union(self, *others: Union[BaseBoundsType, BaseValueType]) -> BaseBoundsType:
         """
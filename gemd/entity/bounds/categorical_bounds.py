@@ -1,6 +1,6 @@
 from typing import TypeVar, Any, Union, Set, Optional, Iterable, Dict
 
-from gemd.entity.bounds.base_bounds import BaseBounds
+from gemd.entity.bounds.base_bounds import BaseBounds, _is_vectorized
 from gemd.entity.util import array_like
 
 __all__ = ["CategoricalBounds"]
@@ -75,6 +75,42 @@ class CategoricalBounds(BaseBounds, typ="categorical_bounds"):
 
         return bounds.categories.issubset(self.categories)
 
+    def contains_many(self,
+                      values: Iterable[str]):
+        """
+        Check whether each of many category labels is one of the allowed categories.
+
+        This screens raw labels without building a value object for each, in a single
+        vectorized operation if they are a NumPy array or a pandas object.  NumPy and pandas
+        are optional; see :func:`~gemd.entity.util.array_like`.
+
+        Parameters
+        ----------
+        values: numpy.ndarray, pandas.Series, or Iterable[str]
+            The labels to check.
+
+        Returns
+        -------
+        numpy.ndarray, pandas.Series, or List[bool]
+            Whether each label is contained by this bounds: a boolean mask of the same type
+            for NumPy and pandas input, and a list otherwise.
+
+        """
+        categories = self.categories
+        if _is_vectorized(values):
+            if hasattr(values, "isin"):  # pandas
+                return values.isin(categories)
+            import numpy as np
+
+            return np.isin(values, list(categories))
+        return [x in categories for x in values]
+
+    def _screenable(self, value: BaseValueType) -> Optional[str]:
+        """Nominal values are screened as plain labels."""
+        if getattr(value, "typ", None) == "nominal_categorical":
+            return value.category
+        return None
+
     def union(self,
               *others: Union[CategoricalBoundsType, CategoricalValueType]
               ) -> CategoricalBoundsType:
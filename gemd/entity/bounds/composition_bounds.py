@@ -1,5 +1,5 @@
 """Bounds a composition to have a specified set of components."""
-from gemd.entity.bounds.base_bounds import BaseBounds
+from gemd.entity.bounds.base_bounds import BaseBounds, _is_vectorized
 from gemd.entity.util import array_like
 
 from typing import TypeVar, Union, Set, Iterable
@@ -76,6 +76,38 @@ class CompositionBounds(BaseBounds, typ="composition_bounds"):
 
         return bounds.components.issubset(self.components)
 
+    def contains_many(self,
+                      values: Iterable[Iterable[str]]):
+        """
+        Check whether each of many collections of components has only allowed components.
+
+        This screens raw compositions without building a value object for each.  Every
+        collection is checked with a single set operation; if they are in a NumPy array or a
+        pandas object, the results are gathered into a mask of the same kind.  NumPy and
+        pandas are optional; see :func:`~gemd.entity.util.array_like`.
+
+        Parameters
+        ----------
+        values: numpy.ndarray, pandas.Series, or Iterable[Iterable[str]]
+            The collections of component names to check, e.g., sets, or dicts from the
+            components to their quantities.
+
+        Returns
+        -------
+        numpy.ndarray, pandas.Series, or List[bool]
+            Whether each collection is contained by this bounds: a boolean mask of the same
+            type for NumPy and pandas input, and a list otherwise.
+
+        """
+        check = self.components.issuperset
+        if _is_vectorized(values):
+            if hasattr(values, "map"):  # pandas
+                return values.map(check).astype(bool)
+            import numpy as np
+
+            return np.fromiter(map(check, values), dtype=bool, count=len(values))
+        return list(map(check, values))
+
     def union(self,
               *others: Union[CompositionBoundsType, CompositionValueType]
               ) -> CompositionBoundsType:
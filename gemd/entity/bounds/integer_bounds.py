@@ -1,8 +1,8 @@
 """Bounds an integer to be between two values."""
 from math import isfinite
-from typing import TypeVar, Union
+from typing import Iterable, Optional, TypeVar, Union
 
-from gemd.entity.bounds.base_bounds import BaseBounds
+from gemd.entity.bounds.base_bounds import BaseBounds, _is_vectorized
 
 __all__ = ["IntegerBounds"]
 IntegerBoundsType = TypeVar("IntegerBoundsType", bound="IntegerBounds")
@@ -90,6 +90,38 @@ class IntegerBounds(BaseBounds, typ="integer_bounds"):
 
         return bounds.lower_bound >= self.lower_bound and bounds.upper_bound <= self.upper_bound
 
+    def contains_many(self,
+                      values: Iterable[int]):
+        """
+        Check whether each of many numbers is an integer within this range.
+
+        This screens raw numbers without building a value object for each, in a single
+        vectorized operation if they are a NumPy array or a pandas object.  NumPy and pandas
+        are optional; see :func:`~gemd.entity.util.array_like`.
+
+        Parameters
+        ----------
+        values: numpy.ndarray, pandas.Series, or Iterable[int]
+            The numbers to check.  Those with a fractional part (or NaN) are never contained.
+
+        Returns
+        -------
+        numpy.ndarray, pandas.Series, or List[bool]
+            Whether each number is contained by this bounds: a boolean mask of the same type
+            for NumPy and pandas input, and a list otherwise.
+
+        """
+        lower, upper = self.lower_bound, self.upper_bound
+        if _is_vectorized(values):
+            return (values >= lower) & (values <= upper) & (values % 1 == 0)
+        return [lower <= x <= upper and x % 1 == 0 for x in values]
+
+    def _screenable(self, value: BaseValueType) -> Optional[int]:
+        """Nominal values are screened as plain numbers."""
+        if getattr(value, "typ", None) == "nominal_integer":
+            return value.nominal
+        return None
+
     def union(self,
               *others: Union[IntegerBoundsType, IntegerValueType]
               ) -> IntegerBoundsType:
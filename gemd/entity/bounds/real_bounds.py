@@ -1,15 +1,19 @@
 """Bound a real number to be between two values."""
-from math import isfinite
-from typing import TypeVar, Union
+from math import inf, isfinite
+from typing import Iterable, Optional, TypeVar, Union
 
-from gemd.entity.bounds.base_bounds import BaseBounds
+from gemd.entity.bounds.base_bounds import BaseBounds, _is_vectorized
+from gemd.entity.bounds_validation import is_trusted_construction
 import gemd.units as units
+from gemd.units.impl import _conversion_factor, _is_convertible, _Incompatible
 
 __all__ = ["RealBounds"]
 RealBoundsType = TypeVar("RealBoundsType", bound="RealBounds")
 BaseValueType = TypeVar("BaseValueType", bound="BaseValue")  # noqa: F821
 ContinuousValueType = TypeVar("ContinuousValueType", bound="ContinuousValue")  # noqa: F821
 
+_RELATIVE_SLACK = 1e-9  # Base unit comparisons closer than this are redone in the value's units
+
 
 class RealBounds(BaseBounds, typ="real_bounds"):
     """
@@ -78,7 +82,10 @@ class RealBounds(BaseBounds, typ="real_bounds"):
         if default_units is None:
             raise ValueError("Real bounds must have units. "
                              "Use an empty string for a dimensionless quantity.")
-        self._default_units = units.parse_units(default_units, return_unit=False)
+        if isinstance(default_units, str) and is_trusted_construction():
+            self._default_units = default_units  # Already in canonical form
+        else:
+            self._default_units = units.parse_units(default_units, return_unit=False)
 
     def contains(self, bounds: Union[BaseBounds, BaseValueType]) -> bool:
         """
@@ -102,20 +109,84 @@ class RealBounds(BaseBounds, typ="real_bounds"):
             True if the other object is contained by this bounds.
 
         """
-        from gemd.entity.value.base_value import BaseValue
-
-        if not super().contains(bounds):
-            return False
-        if isinstance(bounds, BaseValue):
-            bounds = bounds._to_bounds()
-        if not isinstance(bounds, RealBounds):
+        to_range = getattr(bounds, "_to_range", None)  # Only ContinuousValues have one
+        if to_range is not None:
+            lower, upper, units_ = to_range()  # Avoid building a RealBounds
+        elif isinstance(bounds, RealBounds):
+            lower, upper, units_ = bounds.lower_bound, bounds.upper_bound, bounds.default_units
+        else:
+            super().contains(bounds)  # Raises a TypeError for anything but bounds and values
             return False
 
-        lower, upper = self._convert_bounds(bounds.default_units)
-        if lower is None:
+        if units_ == self.default_units:
+            return lower >= self.lower_bound and upper <= self.upper_bound
+
+        factor = _conversion_factor(units_, self.default_units)
+        if isinstance(factor, _Incompatible):
+            return False  # Including radians/counts vs. dimensionless, degC vs. delta_degC
+        if factor is None:  # Offset or logarithmic units, which only Pint can convert
+            self_lower, self_upper = self._convert_bounds(units_)
+            return lower >= self_lower and upper <= self_upper
+
+        # Compare in base units, so that the endpoints needn't be converted through Pint
+        _, ratio, offset = units.get_base_units(self.default_units)
+        _, other_ratio, other_offset = units.get_base_units(units_)
+        self_lower = self.lower_bound * ratio + offset
+        self_upper = self.upper_bound * ratio + offset
+        other_lower = lower * other_ratio + other_offset
+        other_upper = upper * other_ratio + other_offset
+        # Rounding in base units mustn't change the answer, so near misses are checked exactly
+        slack = _RELATIVE_SLACK * max(abs(self_lower), abs(self_upper), abs(offset),
+                                      abs(other_lower), abs(other_upper), abs(other_offset))
+        if other_lower >= self_lower + slack and other_upper <= self_upper - slack:
+            return True
+        if other_lower < self_lower - slack or other_upper > self_upper + slack:
             return False
 
-        return bounds.lower_bound >= lower and bounds.upper_bound <= upper
+        self_lower, self_upper = self._convert_bounds(units_)
+        return lower >= self_lower and upper <= self_upper
+
+    def contains_many(self,
+                      values: Iterable[float],
+                      units: Optional[str] = None):
+        """
+        Check whether each of many numbers, all in the same units, is within this range.
+
+        This screens raw magnitudes without building a value object for each.  The bounds
+        are converted into the units of the numbers once, and then compared against all of
+        them, in a single vectorized operation if they are a NumPy array or a pandas object.
+        NumPy and pandas are optional; see :func:`~gemd.entity.util.array_like`.
+
+        Parameters
+        ----------
+        values: numpy.ndarray, pandas.Series, or Iterable[float]
+            The magnitudes to check.  NaN is never contained.
+        units: str, optional
+            The units of the magnitudes.  Default: the default units of this bounds.
+
+        Returns
+        -------
+        numpy.ndarray, pandas.Series, or List[bool]
+            Whether each number is contained by this bounds: a boolean mask of the same type
+            for NumPy and pandas input, and a list otherwise.  If the units cannot be
+            converted into the default units, nothing is contained.
+
+        """
+        if units is None or units == self.default_units:
+            lower, upper = self.lower_bound, self.upper_bound
+        elif _is_convertible(units, self.default_units):
+            lower, upper = self._convert_bounds(units)
+        else:
+            lower, upper = inf, -inf  # An empty range
+        if _is_vectorized(values):
+            return (values >= lower) & (values <= upper)
+        return [lower <= x <= upper for x in values]
+
+    def _screenable(self, value: BaseValueType) -> Optional[float]:
+        """Nominal values in the default units are screened as plain numbers."""
+        if getattr(value, "typ", None) == "nominal_real" and value.units == self.default_units:
+            return value.nominal
+        return None
 
     def union(self,
               *others: Union[RealBoundsType, ContinuousValueType]
@@ -1,7 +1,12 @@
 from enum import IntEnum
 from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional
 
-__all__ = ["WarningLevel", "get_validation_level", "set_validation_level", "validation_level"]
+from gemd.entity.dict_serializable import logger
+
+__all__ = ["WarningLevel", "get_validation_level", "set_validation_level", "validation_level",
+           "is_trusted_construction", "trusted_construction", "deferred_validation"]
 
 
 class WarningLevel(IntEnum):
@@ -19,27 +24,148 @@ class WarningLevel(IntEnum):
     FATAL = 2
 
 
+# The level for any thread or asyncio task that is not within a validation_level context
 BOUNDS_VALIDATION = WarningLevel.WARNING
 
+# Context-local, so that e.g. a trusted bulk load in one thread or asyncio task does not change
+# validation for the others.  New threads start from the defaults; asyncio tasks inherit the
+# state of the context they were created in.  The level is unset outside of validation_level.
+_VALIDATION_LEVEL: ContextVar[WarningLevel] = ContextVar("validation_level")
+_TRUSTED_CONSTRUCTION: ContextVar[bool] = ContextVar("trusted_construction", default=False)
+
+
+class _Deferred(NamedTuple):
+    """The state of the outermost deferred_validation context."""
+
+    pending: Dict[Callable, Dict[Hashable, Any]]  # Batch check -> items, keyed to drop repeats
+    violations: List[str]
+
+
+_DEFERRED: ContextVar[Optional[_Deferred]] = ContextVar("deferred_validation", default=None)
+
 
 def get_validation_level() -> WarningLevel:
-    """Return the value of the BOUNDS_VALIDATION."""
-    return BOUNDS_VALIDATION
+    """Return the validation level of the current thread or asyncio task."""
+    return _VALIDATION_LEVEL.get(BOUNDS_VALIDATION)
 
 
 def set_validation_level(level: WarningLevel):
-    """Set the value of the BOUNDS_VALIDATION."""
+    """
+    Set the validation level for the whole process.
+
+    This is the default level, in every thread and asyncio task, including those started
+    later.  Only the :func:`validation_level` context manager sets a level locally; if this is
+    called within one, the new level also applies for the rest of that context.
+    """
     global BOUNDS_VALIDATION
     BOUNDS_VALIDATION = WarningLevel(level)
+    if _VALIDATION_LEVEL.get(None) is not None:
+        _VALIDATION_LEVEL.set(BOUNDS_VALIDATION)
 
 
 @contextmanager
 def validation_level(level: WarningLevel):
     """Provide a context for setting a WarningLevel locally."""
-    global BOUNDS_VALIDATION
-    # Swap values and store
-    old_value, BOUNDS_VALIDATION = BOUNDS_VALIDATION, WarningLevel(level)
-    yield old_value  # Since we know the new level, the old one may be useful
+    old_value = get_validation_level()
+    token = _VALIDATION_LEVEL.set(WarningLevel(level))
+    try:
+        yield old_value  # Since we know the new level, the old one may be useful
+    finally:
+        # Restore previous value
+        _VALIDATION_LEVEL.reset(token)
+
+
+def is_trusted_construction() -> bool:
+    """Return whether objects are currently being built from trusted, already-validated data."""
+    return _TRUSTED_CONSTRUCTION.get()
+
 
-    # Restore previous value
-    BOUNDS_VALIDATION = old_value
+@contextmanager
+def trusted_construction():
+    """
+    Provide a context for building objects from data that is known to be valid.
+
+    This is intended for reloading data that gemd itself produced.  Within this context, lists
+    are not type-checked element by element and their triggers are not run, unit strings are
+    assumed to already be in canonical form, and bounds are not checked (as with
+    WarningLevel.IGNORE).  Lists built this way still validate elements added to them later.
+    """
+    token = _TRUSTED_CONSTRUCTION.set(True)
+    try:
+        with validation_level(WarningLevel.IGNORE):
+            yield
+    finally:
+        _TRUSTED_CONSTRUCTION.reset(token)
+
+
+@contextmanager
+def deferred_validation():
+    """
+    Provide a context for building objects without validating them until it exits.
+
+    Within this context, setting attribute values and templates, adding attributes to objects
+    and setting quantities do not check bounds.  Instead, the objects involved are recorded
+    (once each, however many times they change) and checked in one pass when the context
+    exits, grouped by template and against their final state.  All of the violations are
+    then reported together, according to the validation level at exit: ignored, logged as a
+    single warning, or raised as a single ValueError.  Changes made while the level is
+    IGNORE are not recorded.  Nested contexts are validated when the outermost one exits.
+    Nothing is validated if the context exits with an exception.
+
+    Yields
+    ------
+    List[str]
+        A list that is filled with a message for each violation when the context exits.
+
+    """
+    outer = _DEFERRED.get()
+    if outer is not None:  # The outer context will validate everything
+        yield outer.violations
+        return
+
+    deferred = _Deferred(pending={}, violations=[])
+    token = _DEFERRED.set(deferred)
+    try:
+        yield deferred.violations
+    finally:
+        _DEFERRED.reset(token)
+
+    level = get_validation_level()
+    if level == WarningLevel.IGNORE:
+        return
+    for check, items in deferred.pending.items():
+        deferred.violations.extend(check(list(items.values())))
+    if deferred.violations:
+        message = f"{len(deferred.violations)} validation failures:\n" \
+            + "\n".join(deferred.violations)
+        if level == WarningLevel.WARNING:
+            logger.warning(message)
+        else:
+            raise ValueError(message)
+
+
+def _deferred_validation(check: Callable[[List[Any]], List[str]], key: Hashable, item: Any
+                         ) -> bool:
+    """
+    Record `item` for `check` if validation is currently deferred.
+
+    Parameters
+    ----------
+    check: Callable[[List[Any]], List[str]]
+        A function that checks a list of items at once, returning a message for each violation
+    key: Hashable
+        Identifies the item, so that it is only checked once however often it is recorded
+    item: Any
+        The item to pass to `check`
+
+    Returns
+    -------
+    bool
+        Whether validation is deferred, in which case the caller should not validate now
+
+    """
+    deferred = _DEFERRED.get()
+    if deferred is None:
+        return False
+    deferred.pending.setdefault(check, {})[key] = item
+    return True
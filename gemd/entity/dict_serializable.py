@@ -3,7 +3,10 @@ from logging import getLogger
 
 import inspect
 import functools
-from typing import TypeVar, Union, Iterable, List, Mapping, Dict, Set, Any
+from operator import attrgetter
+from typing import TypeVar, Union, Iterable, List, Mapping, Dict, Set, Any, Callable, \
+    FrozenSet, Tuple
+from uuid import UUID
 
 __all__ = ["DictSerializable"]
 
@@ -18,6 +21,7 @@ class DictSerializableMeta(ABCMeta):
     """Metaclass for tracking DictSerializable type string to class mappings."""
 
     _class: Dict[str, type] = {}
+    _registry_version: int = 0
 
     def __new__(mcs, name, bases, *args,  # noqa: D102
                 typ: str = None, skip: Set[str] = frozenset(),
@@ -32,6 +36,7 @@ class DictSerializableMeta(ABCMeta):
                                  f"which is not its ancestor.")
             cls.typ = typ
             cls._class[typ] = cls
+            DictSerializableMeta._registry_version += 1
         elif not hasattr(cls, "typ"):
             cls.typ = NotImplementedError
         cls.skip = {x for b in bases for x in getattr(b, 'skip', {})} | skip
@@ -84,6 +89,38 @@ class DictSerializable(ABC, metaclass=DictSerializableMeta):
         # but all of its children will use from_dict like this.
         return cls(**kwargs)
 
+    @classmethod
+    def _decoder(cls) -> Callable[[Dict[str, Any]], "DictSerializable"]:
+        """
+        Return the function that builds an instance of this class from its field dictionary.
+
+        The decoder is compiled once per class.  Unless `from_dict` has been overridden, a
+        dictionary whose keys are all constructor arguments is passed directly to the
+        constructor, and anything else goes through `from_dict` so that unexpected keys are
+        reported as usual.  The dictionary must not contain a ``type`` key.
+
+        Returns
+        -------
+        Callable[[Dict[str, Any]], DictSerializable]
+            A function equivalent to `from_dict` for this class.
+
+        """
+        decoder = cls.__dict__.get("_decode_plan")
+        if decoder is None:
+            from_dict = cls.from_dict
+            if from_dict.__func__ is not DictSerializable.from_dict.__func__:
+                decoder = from_dict
+            else:
+                arg_names = frozenset(cls._init_sig()) - {"self"}
+
+                def decoder(d: Dict[str, Any]) -> DictSerializable:
+                    if d.keys() <= arg_names:
+                        return cls(**d)
+                    return from_dict(d)
+
+            cls._decode_plan = decoder
+        return decoder
+
     @classmethod
     @functools.lru_cache(maxsize=1024)
     def _init_sig(cls) -> List[str]:
@@ -102,10 +139,57 @@ class DictSerializable(ABC, metaclass=DictSerializableMeta):
             A dictionary representation of the object, where the keys are its fields.
 
         """
-        keys = {x.lstrip('_') for x in vars(self) if x not in self.skip}
-        attributes = {k: self.__getattribute__(k) for k in keys}
-        attributes["type"] = self.typ
-        return attributes
+        fields = vars(self)
+        plan = type(self).__dict__.get("_as_dict_plan")
+        if plan is None or fields.keys() != plan[0]:
+            plan = type(self)._compile_as_dict(fields)
+        return plan[1](self)
+
+    @classmethod
+    def _compile_as_dict(
+            cls,
+            fields: Mapping[str, Any]
+    ) -> Tuple[FrozenSet[str], Callable[["DictSerializable"], Dict[str, Any]]]:
+        """
+        Generate and cache the serializer that :func:`as_dict` uses for this class.
+
+        The serializer is built from the instance fields (less those in `skip`, and with
+        leading underscores stripped so that the public accessors are used) once per class,
+        and stored on the class along with the field names it was built from.  Instances
+        with a different set of fields get a freshly compiled serializer.
+
+        Parameters
+        ----------
+        fields: Mapping[str, Any]
+            The instance fields, as returned by `vars()`.
+
+        Returns
+        -------
+        Tuple[FrozenSet[str], Callable]
+            The field names the serializer applies to, and the serializer itself.
+
+        """
+        keys = tuple(sorted({x.lstrip('_') for x in fields if x not in cls.skip}))
+        typ = cls.typ
+        if len(keys) == 0:
+            def serializer(obj: DictSerializable) -> Dict[str, Any]:
+                return {"type": typ}
+        elif len(keys) == 1:
+            getter = attrgetter(keys[0])
+
+            def serializer(obj: DictSerializable) -> Dict[str, Any]:
+                return {keys[0]: getter(obj), "type": typ}
+        else:
+            getter = attrgetter(*keys)
+
+            def serializer(obj: DictSerializable) -> Dict[str, Any]:
+                attributes = dict(zip(keys, getter(obj)))
+                attributes["type"] = typ
+                return attributes
+
+        plan = (frozenset(fields), serializer)
+        cls._as_dict_plan = plan
+        return plan
 
     def dump(self) -> Dict[str, Any]:
         """
@@ -144,9 +228,52 @@ class DictSerializable(ABC, metaclass=DictSerializableMeta):
             The deserialized object.
 
         """
-        from gemd.json import GEMDJson
-        encoder = GEMDJson()
-        return encoder.raw_loads(encoder.raw_dumps(d))
+        return DictSerializable._build_native(d, copy=True)
+
+    @staticmethod
+    def _build_native(thing: Any, *, copy: bool) -> Any:
+        """
+        Recursively build objects from nested dictionaries without a JSON round trip.
+
+        Any dictionary with a ``type`` key is turned into an instance of the registered class,
+        after its values have been built.  Lists and tuples become lists and UUIDs become
+        strings, matching what a serialize/deserialize cycle would produce.
+
+        Parameters
+        ----------
+        thing: Any
+            The (possibly nested) structure to build.
+        copy: bool
+            Whether DictSerializable objects encountered in `thing` should be rebuilt from
+            their dictionary representations (as serialization would) or used as-is.
+
+        Returns
+        -------
+        Any
+            The built structure.
+
+        """
+        if isinstance(thing, DictSerializable):
+            if not copy:
+                return thing
+            thing = thing.as_dict()
+
+        if isinstance(thing, dict):
+            built = {key: DictSerializable._build_native(value, copy=copy)
+                     for key, value in thing.items()}
+            if "type" not in built:
+                return built
+            typ = built.pop("type")
+            clazz = DictSerializableMeta._class.get(typ)
+            if clazz is None:
+                raise TypeError("Unexpected base object type: {}".format(typ))
+            return clazz._decoder()(built)
+        elif isinstance(thing, (list, tuple)):
+            return [DictSerializable._build_native(x, copy=copy) for x in thing]
+        elif isinstance(thing, UUID):
+            return str(thing)
+        else:
+            return thing
 
     def __repr__(self) -> str:
         object_dict = self.as_dict()
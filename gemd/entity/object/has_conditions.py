@@ -31,6 +31,11 @@ class HasConditions(HasTemplateCheckGenerator, HasDependencies, ABC):
         checker = self._generate_template_check(HasConditionTemplates.validate_condition)
         self._conditions = validate_list(conditions, Condition, trigger=checker)
 
+    def _template_checks(self):
+        """Each list of attributes that the object template constrains, with its check."""
+        return [*super()._template_checks(),
+                (HasConditionTemplates.validate_condition, self.conditions)]
+
     def _local_dependencies(self) -> Set[Union[BaseEntity, LinkByUID]]:
         """Return a set of all immediate dependencies (no recursion)."""
         return {cond.template for cond in self.conditions if cond.template is not None}
@@ -31,6 +31,11 @@ class HasParameters(HasTemplateCheckGenerator, HasDependencies, ABC):
         checker = self._generate_template_check(HasParameterTemplates.validate_parameter)
         self._parameters = validate_list(parameters, Parameter, trigger=checker)
 
+    def _template_checks(self):
+        """Each list of attributes that the object template constrains, with its check."""
+        return [*super()._template_checks(),
+                (HasParameterTemplates.validate_parameter, self.parameters)]
+
     def _local_dependencies(self) -> Set[Union[BaseEntity, LinkByUID]]:
         """Return a set of all immediate dependencies (no recursion)."""
         return {param.template for param in self.parameters if param.template is not None}
@@ -31,6 +31,11 @@ class HasProperties(HasTemplateCheckGenerator, HasDependencies, ABC):
         checker = self._generate_template_check(HasPropertyTemplates.validate_property)
         self._properties = validate_list(properties, Property, trigger=checker)
 
+    def _template_checks(self):
+        """Each list of attributes that the object template constrains, with its check."""
+        return [*super()._template_checks(),
+                (HasPropertyTemplates.validate_property, self.properties)]
+
     def _local_dependencies(self) -> Set[Union[BaseEntity, LinkByUID]]:
         """Return a set of all immediate dependencies (no recursion)."""
         return {prop.template for prop in self.properties if prop.template is not None}
@@ -1,15 +1,44 @@
 """For entities that hve quantities."""
+from functools import lru_cache
 from sys import float_info
+from typing import Iterable, List, Tuple
 
 from gemd.entity.bounds.real_bounds import RealBounds
 from gemd.entity.value.continuous_value import ContinuousValue
 from gemd.entity.value.base_value import BaseValue
-from gemd.entity.bounds_validation import get_validation_level, WarningLevel
+from gemd.entity.bounds_validation import get_validation_level, WarningLevel, \
+    _deferred_validation
 from gemd.entity.dict_serializable import logger
 
 __all__ = ["HasQuantities"]
 
 
+@lru_cache(maxsize=None)
+def _fraction_bounds() -> RealBounds:
+    """The bounds of a dimensionless fraction, built once and shared by every check."""
+    return RealBounds(lower_bound=0.0, upper_bound=1.0, default_units='')
+
+
+def _absolute_quantity_violations(absolute_quantity: ContinuousValue) -> List[str]:
+    """Describe the ways in which an absolute quantity is invalid, if any."""
+    max_bounds = RealBounds(
+        lower_bound=0.0,
+        upper_bound=float_info.max,
+        default_units=absolute_quantity.units
+    )
+    dimensionless = RealBounds(
+        lower_bound=0.0,
+        upper_bound=float_info.max,
+        default_units=''
+    )
+    messages = []
+    if not max_bounds.contains(absolute_quantity):
+        messages.append(f"Value {absolute_quantity} is less than 0.0.")
+    if dimensionless.contains(absolute_quantity):
+        messages.append(f"Value {absolute_quantity} is dimensionless.")
+    return messages
+
+
 class HasQuantities(object):
     """Mixin-trait that includes the mass, volume, number fraction, and absolute quantity."""
 
@@ -33,9 +62,8 @@ class HasQuantities(object):
 
     @staticmethod
     def _check(value: BaseValue):
-        fraction_bounds = RealBounds(lower_bound=0.0, upper_bound=1.0, default_units='')
         level = get_validation_level()
-        accept = level == WarningLevel.IGNORE or fraction_bounds.contains(value)
+        accept = level == WarningLevel.IGNORE or _fraction_bounds().contains(value)
         if not accept:
             message = f"Value {value} is not a dimensionless value between 0 and 1."
             if level == WarningLevel.WARNING:
@@ -43,6 +71,55 @@ class HasQuantities(object):
             else:
                 raise ValueError(message)
 
+    @staticmethod
+    def _check_all(objects: List["HasQuantities"]) -> List[str]:
+        """Check the quantities of many objects at once."""
+        messages = []
+        for name, pairs, passed in HasQuantities._check_groups(objects):
+            failures = [value for (_, value), ok in zip(pairs, passed) if not ok]
+            if name == "absolute_quantity":
+                for value in failures:
+                    messages.extend(_absolute_quantity_violations(value))
+            else:
+                messages.extend(f"Value {value} is not a dimensionless value between 0 and 1."
+                                for value in failures)
+        return messages
+
+    @staticmethod
+    def _check_groups(objects: Iterable["HasQuantities"]
+                      ) -> List[Tuple[str, List[Tuple["HasQuantities", ContinuousValue]],
+                                      List[bool]]]:
+        """
+        Check the quantities of many objects, a kind of quantity at a time.
+
+        Each group is returned with the name of the quantity, the (object, value) pairs and
+        whether each value is valid.  Quantities that are not set are not checked.
+        """
+        names = ("mass_fraction", "volume_fraction", "number_fraction", "absolute_quantity")
+        by_name = {name: [] for name in names}
+        for obj in objects:
+            for name in names:
+                value = getattr(obj, name)
+                if value is not None:
+                    by_name[name].append((obj, value))
+
+        groups = []
+        for name, pairs in by_name.items():
+            if not pairs:
+                continue
+            values = [value for _, value in pairs]
+            if name == "absolute_quantity":
+                passed = [not _absolute_quantity_violations(value) for value in values]
+            else:
+                passed = _fraction_bounds()._contains_each(values)
+            groups.append((name, pairs, passed))
+        return groups
+
+    def _defer_check(self) -> bool:
+        """Record this object to be checked later, if validation is deferred."""
+        return get_validation_level() != WarningLevel.IGNORE \
+            and _deferred_validation(HasQuantities._check_all, id(self), self)
+
     @property
     def mass_fraction(self) -> ContinuousValue:
         """The mass fraction of the material."""
@@ -55,7 +132,8 @@ class HasQuantities(object):
         elif not isinstance(mass_fraction, ContinuousValue):
             raise TypeError("mass_fraction was not given as a continuous value")
         else:
-            self._check(mass_fraction)
+            if not self._defer_check():
+                self._check(mass_fraction)
             self._mass_fraction = mass_fraction
 
     @property
@@ -70,7 +148,8 @@ class HasQuantities(object):
         elif not isinstance(volume_fraction, ContinuousValue):
             raise TypeError("volume_fraction was not given as a continuous value")
         else:
-            self._check(volume_fraction)
+            if not self._defer_check():
+                self._check(volume_fraction)
             self._volume_fraction = volume_fraction
 
     @property
@@ -85,7 +164,8 @@ class HasQuantities(object):
         elif not isinstance(number_fraction, ContinuousValue):
             raise TypeError("number_fraction was not given as a continuous value")
         else:
-            self._check(number_fraction)
+            if not self._defer_check():
+                self._check(number_fraction)
             self._number_fraction = number_fraction
 
     @property
@@ -100,26 +180,12 @@ class HasQuantities(object):
         elif not isinstance(absolute_quantity, ContinuousValue):
             raise TypeError("absolute_quantity was not given as a continuous value")
         else:
-            max_bounds = RealBounds(
-                lower_bound=0.0,
-                upper_bound=float_info.max,
-                default_units=absolute_quantity.units
-            )
-            dimensionless = RealBounds(
-                lower_bound=0.0,
-                upper_bound=float_info.max,
-                default_units=''
-            )
             level = get_validation_level()
-            if level != WarningLevel.IGNORE:
-                messages = []
-                if not max_bounds.contains(absolute_quantity):
-                    messages.append(f"Value {absolute_quantity} is less than 0.0.")
-                if dimensionless.contains(absolute_quantity):
-                    messages.append(f"Value {absolute_quantity} is dimensionless.")
+            if level != WarningLevel.IGNORE and not self._defer_check():
+                messages = _absolute_quantity_violations(absolute_quantity)
                 if level == WarningLevel.WARNING:
                     for message in messages:
                         logger.warning(message)
-                else:
+                elif messages:
                     raise ValueError("; ".join(messages))
             self._absolute_quantity = absolute_quantity
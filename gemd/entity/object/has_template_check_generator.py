@@ -1,12 +1,14 @@
 """For entities that have specs."""
 from gemd.entity.template.base_template import BaseTemplate
 from gemd.entity.link_by_uid import LinkByUID
-from gemd.entity.bounds_validation import get_validation_level, WarningLevel
+from gemd.entity.bounds_validation import get_validation_level, WarningLevel, \
+    _deferred_validation
 from gemd.entity.dict_serializable import logger
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from inspect import getmodule, getmembers, isclass, signature
-from typing import Union, Callable, TypeVar
+from typing import Union, Callable, Iterable, List, Tuple, Type, TypeVar
 
 __all__ = ["HasTemplateCheckGenerator"]
 
@@ -21,6 +23,10 @@ class HasTemplateCheckGenerator(ABC):
     def template(self) -> Union[BaseTemplate, LinkByUID]:
         """Get the object template associated with this object."""
 
+    def _template_checks(self) -> List[Tuple[Callable[[BaseTemplate, T], bool], Iterable[T]]]:
+        """Each list of attributes that the object template constrains, with its check."""
+        return []
+
     def _generate_template_check(self,
                                  validate: Callable[["HasTemplateCheckGenerator", T], bool]
                                  ) -> Callable[[T], None]:
@@ -55,31 +61,15 @@ class HasTemplateCheckGenerator(ABC):
             If `value` is not one of the allowed types or if mapping types fails.
 
         """
-        # The attribute, validation routine and mixin are all related and required to make sure the
-        # types line up.  Rather than require the user to specify 3 different pieces of
-        # information, we ask them to provide 1 and then use introspection to determine the other
-        # two.  We get `cls` by figuring out which class implemented `validate` and we get `attr`
-        # by looking at the typehints of the arguments to `validate`.
-
-        # Determine which class `validate` is from, so we can type check the object template
-        module = getmodule(validate)  # Get the module that contains `validate`
-        # Get the class that was defined in this module (a.k.a. not imported)
-        cls = next((y for x, y in getmembers(module, isclass) if getmodule(y) == module), None)
-        if cls is None:
-            raise ValueError(f"Could not map class for function {validate}.")
-
-        # Grab the type of validate's argument so we know what kind of attribute we are validating
-        arguments = list(signature(validate).parameters.values())  # List of arguments to validate
-        attr = arguments[1].annotation if len(arguments) == 2 else None  # First self, then attr
-        if attr is None:
-            raise ValueError(f"Could not map attribute for function {validate}.")
+        cls, attr = _resolve_template_check(validate)
 
         def template_check(x: attr):
             """Given an attribute, check it against this object's template."""
             level = get_validation_level()
-            reject = level != WarningLevel.IGNORE \
-                and isinstance(self.template, cls) \
-                and not validate(self.template, x)
+            if level == WarningLevel.IGNORE or _deferred_validation(
+                    HasTemplateCheckGenerator._check_all, (id(self), validate), (self, validate)):
+                return
+            reject = isinstance(self.template, cls) and not validate(self.template, x)
 
             if reject:
                 message = f"Value {x.value} is inconsistent with template {self.template.name}"
@@ -89,3 +79,82 @@ class HasTemplateCheckGenerator(ABC):
                     raise ValueError(message)
 
         return template_check
+
+    @staticmethod
+    def _check_all(checks: List[Tuple["HasTemplateCheckGenerator", Callable]]) -> List[str]:
+        """Check the attributes of objects against their templates at once, grouped by template."""
+        messages = []
+        for template, pairs, passed in HasTemplateCheckGenerator._check_groups(checks):
+            messages.extend(f"Value {x.value} is inconsistent with template {template.name}"
+                            for (_, x), ok in zip(pairs, passed) if not ok)
+        return messages
+
+    @staticmethod
+    def _check_groups(checks: Iterable[Tuple["HasTemplateCheckGenerator", Callable]]
+                      ) -> List[Tuple[BaseTemplate, List[Tuple["HasTemplateCheckGenerator", T]],
+                                      List[bool]]]:
+        """
+        Check the attributes of objects against their templates, a template at a time.
+
+        Each object's attributes and template are read as they are now, so an attribute that
+        has been removed since it was added is not checked.  Each group is returned with its
+        template, the (object, attribute) pairs and whether each attribute is consistent.
+        """
+        by_template = {}
+        for obj, validate in checks:
+            template = obj.template
+            attributes = dict(obj._template_checks())[validate]
+            if attributes and isinstance(template, _resolve_template_check(validate)[0]):
+                key = id(template), validate
+                group = by_template.setdefault(key, (template, validate, []))[2]
+                group.extend((obj, x) for x in attributes)
+
+        return [(template, group, [validate(template, x) for _, x in group])
+                for template, validate, group in by_template.values()]
+
+
+@lru_cache(maxsize=None)
+def _resolve_template_check(
+        validate: Callable[["HasTemplateCheckGenerator", T], bool]) -> Tuple[Type, Type]:
+    """
+    Determine the object template class and attribute type that `validate` applies to.
+
+    The introspection is relatively expensive and its answer never changes, so it is done once
+    per validation routine rather than every time a checker is generated.
+
+    Parameters
+    ----------
+    validate: function(HasTemplateCheckGenerator, Attribute) -> bool
+        A method that checks if the attribute is consistent with the object template.
+
+    Returns
+    -------
+    Tuple[Type, Type]
+        The class that implements `validate` and the type of attribute that it validates.
+
+    Raises
+    ------
+    ValueError
+        If either the class or the attribute type cannot be determined.
+
+    """
+    # The attribute, validation routine and mixin are all related and required to make sure the
+    # types line up.  Rather than require the user to specify 3 different pieces of
+    # information, we ask them to provide 1 and then use introspection to determine the other
+    # two.  We get `cls` by figuring out which class implemented `validate` and we get `attr`
+    # by looking at the typehints of the arguments to `validate`.
+
+    # Determine which class `validate` is from, so we can type check the object template
+    module = getmodule(validate)  # Get the module that contains `validate`
+    # Get the class that was defined in this module (a.k.a. not imported)
+    cls = next((y for x, y in getmembers(module, isclass) if getmodule(y) == module), None)
+    if cls is None:
+        raise ValueError(f"Could not map class for function {validate}.")
+
+    # Grab the type of validate's argument so we know what kind of attribute we are validating
+    arguments = list(signature(validate).parameters.values())  # List of arguments to validate
+    attr = arguments[1].annotation if len(arguments) == 2 else None  # First self, then attr
+    if attr is None:
+        raise ValueError(f"Could not map attribute for function {validate}.")
+
+    return cls, attr
@@ -1,4 +1,5 @@
 """Methods for setting and validating."""
+from gemd.entity.bounds_validation import is_trusted_construction
 from gemd.entity.valid_list import ValidList
 
 from typing import Union, Iterable, Optional, Callable, Type, TypeVar
@@ -33,6 +34,8 @@ def validate_list(obj: Optional[Union[Iterable[T], T]],
     """
     if obj is None:
         return ValidList([], typ, trigger)
+    elif type(obj) is list and is_trusted_construction():
+        return ValidList._trusted(obj, typ, trigger)
     elif isinstance(obj, Iterable) and not isinstance(obj, str):
         return ValidList(obj, typ, trigger)
     else:
@@ -28,6 +28,8 @@ class AttributeTemplate(BaseEntity):
 
     """
 
+    _keys_version = 0  # Counts changes to names and uids, which object templates index
+
     def __init__(self, name, *, description=None, bounds=None, uids=None, tags=None):
         BaseEntity.__init__(self, uids, tags)
         self.name = name
@@ -39,6 +41,26 @@ class AttributeTemplate(BaseEntity):
         self._bounds = None
         self.bounds = bounds
 
+    def __setattr__(self, key, value):
+        if key in ("name", "_uids"):
+            AttributeTemplate._keys_version += 1
+        super().__setattr__(key, value)
+
+    def add_uid(self, scope: str, uid: str):
+        """
+        Add a uid.
+
+        Parameters
+        ----------
+        scope: str
+            scope of the uid
+        uid: str
+            Unique identifier
+
+        """
+        AttributeTemplate._keys_version += 1
+        super().add_uid(scope, uid)
+
     @property
     def bounds(self):
         """Bounds circumscribe the values that are valid according to this attribute template."""
@@ -3,11 +3,18 @@ from gemd.entity.base_entity import BaseEntity
 from gemd.entity.bounds.base_bounds import BaseBounds
 from gemd.entity.link_by_uid import LinkByUID
 from gemd.entity.template.attribute_template import AttributeTemplate
+from gemd.entity.valid_list import ValidList
 
-from typing import Union, Iterable, Mapping
+from typing import Union, Iterable, Mapping, Dict, Hashable, List, Optional, Sequence, Tuple
+import weakref
 
 __all__ = ["BaseTemplate"]
 
+# The attribute template index of each ValidList of (template, bounds) pairs, by the id of the
+# list, with the versions of the list and of the attribute templates' names and uids that it was
+# built from.  Entries are dropped with their lists.
+_ATTRIBUTE_INDEXES: Dict[int, Tuple[Tuple[int, int], Dict[Hashable, List[int]]]] = {}
+
 
 class BaseTemplate(BaseEntity):
     """
@@ -78,3 +85,91 @@ class BaseTemplate(BaseEntity):
                         raise ValueError("Range and template are inconsistent")
                 return [first, second]
         raise TypeError("Expected a template or (template, bounds) tuple")  # pragma: no cover
+
+    @staticmethod
+    def _find_attribute_template(
+            pairs: Sequence[Sequence],
+            template: Union[AttributeTemplate, LinkByUID, None],
+            name: str
+    ) -> Tuple[Union[AttributeTemplate, LinkByUID, None], Optional[BaseBounds]]:
+        """
+        Find the first (template, bounds) pair that applies to an attribute.
+
+        The pair is the first whose template equals `template` or, if the attribute has no
+        template, the first whose template is named `name`.  The candidates are looked up in
+        an index of the pairs by template identity, uid and name, which is kept for each
+        :class:`~gemd.entity.valid_list.ValidList` and rebuilt whenever the list is changed or
+        an attribute template is renamed or given new uids.  Candidates are always confirmed
+        against the list, but a template that is not in the index is not in the list.
+
+        Parameters
+        ----------
+        pairs: List[List[AttributeTemplate or LinkByUID, BaseBounds]]
+            The attribute templates and bounds of an object template.
+        template: AttributeTemplate or LinkByUID, optional
+            The template of the attribute.
+        name: str
+            The name of the attribute.
+
+        Returns
+        -------
+        Tuple[AttributeTemplate or LinkByUID, BaseBounds]
+            The matching template and bounds, or (None, None) if there is no match.
+
+        """
+        index = BaseTemplate._attribute_index(pairs)
+
+        def matches(pair: Sequence) -> bool:
+            if template is not None:
+                return template == pair[0]
+            return name == pair[0].name
+
+        if template is None:
+            keys = [name]
+        elif isinstance(template, LinkByUID):
+            keys = [(template.scope.lower(), template.id)]
+        else:
+            keys = [id(template), *BaseTemplate._uid_keys(template)]
+            if len(template.uids) == 0:
+                keys.append(None)  # Equal to other entities without uids
+
+        candidates = sorted({i for key in keys for i in index.get(key, ())})
+        found = next((pairs[i] for i in candidates if matches(pairs[i])), None)
+        if found is None:
+            return None, None
+        return found[0], found[1]
+
+    @staticmethod
+    def _attribute_index(pairs: Sequence[Sequence]) -> Dict[Hashable, List[int]]:
+        """Index (template, bounds) pairs, reusing the index while a ValidList is unchanged."""
+        if not isinstance(pairs, ValidList):
+            return BaseTemplate._index_attribute_templates(pairs)
+        version = (pairs._version, AttributeTemplate._keys_version)
+        cached = _ATTRIBUTE_INDEXES.get(id(pairs))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if cached is None:
+            weakref.finalize(pairs, _ATTRIBUTE_INDEXES.pop, id(pairs), None)
+        index = BaseTemplate._index_attribute_templates(pairs)
+        _ATTRIBUTE_INDEXES[id(pairs)] = (version, index)
+        return index
+
+    @staticmethod
+    def _index_attribute_templates(pairs: Sequence[Sequence]) -> Dict[Hashable, List[int]]:
+        """Map the identity, uids and names of attribute templates to their positions."""
+        index = {}
+        for i, (template, _) in enumerate(pairs):
+            if isinstance(template, LinkByUID):
+                keys = [(template.scope.lower(), template.id)]
+            else:
+                keys = [id(template), template.name, *BaseTemplate._uid_keys(template)]
+                if len(template.uids) == 0:
+                    keys.append(None)
+            for key in keys:
+                index.setdefault(key, []).append(i)
+        return index
+
+    @staticmethod
+    def _uid_keys(template: AttributeTemplate) -> List[Tuple[str, str]]:
+        """Key the uids of a template as links would match them, with case-insensitive scopes."""
+        return [(scope.lower(), uid) for scope, uid in template.uids.items()]
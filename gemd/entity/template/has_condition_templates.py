@@ -73,12 +73,9 @@ class HasConditionTemplates(HasDependencies):
 
     def validate_condition(self, condition: ConditionType) -> bool:
         """Check if the condition is consistent w/ this template."""
-        if condition.template is not None:
-            attr, bnd = next((x for x in self.conditions if condition.template == x[0]),
-                             (None, None))
-        else:
-            attr, bnd = next((x for x in self.conditions if condition.name == x[0].name),
-                             (None, None))
+        attr, bnd = BaseTemplate._find_attribute_template(self.conditions,
+                                                          condition.template,
+                                                          condition.name)
 
         if bnd is not None:
             return bnd.contains(condition.value)
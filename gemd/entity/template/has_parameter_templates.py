@@ -73,12 +73,9 @@ class HasParameterTemplates(HasDependencies):
 
     def validate_parameter(self, parameter: ParameterType) -> bool:
         """Check if the parameter is consistent w/ this template."""
-        if parameter.template is not None:
-            attr, bnd = next((x for x in self.parameters if parameter.template == x[0]),
-                             (None, None))
-        else:
-            attr, bnd = next((x for x in self.parameters if parameter.name == x[0].name),
-                             (None, None))
+        attr, bnd = BaseTemplate._find_attribute_template(self.parameters,
+                                                          parameter.template,
+                                                          parameter.name)
 
         if bnd is not None:
             return bnd.contains(parameter.value)
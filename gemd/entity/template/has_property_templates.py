@@ -75,12 +75,9 @@ class HasPropertyTemplates(HasDependencies):
         if isinstance(prop, PropertyAndConditions):
             prop = prop.property
 
-        if prop.template is not None:
-            attr, bnd = next((x for x in self.properties if prop.template == x[0]),
-                             (None, None))
-        else:
-            attr, bnd = next((x for x in self.properties if prop.name == x[0].name),
-                             (None, None))
+        attr, bnd = BaseTemplate._find_attribute_template(self.properties,
+                                                          prop.template,
+                                                          prop.name)
 
         if bnd is not None:
             return bnd.contains(prop.value)
@@ -25,6 +25,7 @@ class ValidList(list):
     """
 
     _content_type = tuple([])
+    _version = 0  # Counts changes to the list, so that anything derived from it can be refreshed
 
     def __init__(self,
                  _list: Iterable,
@@ -58,6 +59,27 @@ class ValidList(list):
 
         list.__init__(self, cache)
 
+    @classmethod
+    def _trusted(cls,
+                 _list: list,
+                 content_type: Union[Iterable[Type], Type],
+                 trigger: Callable[[T], Optional[T]] = None) -> "ValidList":
+        """
+        Wrap a list whose elements are already known to be valid.
+
+        The elements are neither type-checked nor passed to `trigger`, but both still apply
+        to elements added to the list later.  See
+        :func:`~gemd.entity.bounds_validation.trusted_construction`.
+        """
+        result = cls.__new__(cls)
+        list.__init__(result, _list)
+        if isinstance(content_type, Iterable):
+            result._content_type = tuple(content_type)
+        else:
+            result._content_type = (content_type, )
+        result._trigger = trigger
+        return result
+
     def _validate(self, value):
         """
         Validate a value against the allowed types.
@@ -106,6 +128,7 @@ class ValidList(list):
             if result is not None:
                 value = result
         super().__setitem__(index, value)
+        self._version += 1
 
     def append(self, value):
         """
@@ -130,6 +153,7 @@ class ValidList(list):
             if result is not None:
                 value = result
         super().append(value)
+        self._version += 1
 
     def extend(self, list_):
         """
@@ -162,6 +186,7 @@ class ValidList(list):
                     cache[i] = result
 
         super().extend(cache)
+        self._version += 1
 
     def insert(self, i, value):
         """
@@ -189,3 +214,47 @@ class ValidList(list):
             if result is not None:
                 value = result
         super().insert(i, value)
+        self._version += 1
+
+    def __delitem__(self, index):
+        """Delete self[index]."""
+        super().__delitem__(index)
+        self._version += 1
+
+    def __iadd__(self, other):
+        """Implement self += other."""
+        result = super().__iadd__(other)
+        self._version += 1
+        return result
+
+    def __imul__(self, n):
+        """Implement self *= n."""
+        result = super().__imul__(n)
+        self._version += 1
+        return result
+
+    def pop(self, index=-1):
+        """Remove and return the item at `index` (default last)."""
+        result = super().pop(index)
+        self._version += 1
+        return result
+
+    def remove(self, value):
+        """Remove the first occurrence of `value`."""
+        super().remove(value)
+        self._version += 1
+
+    def clear(self):
+        """Remove all items from the list."""
+        super().clear()
+        self._version += 1
+
+    def sort(self, *, key=None, reverse=False):
+        """Sort the list in place."""
+        super().sort(key=key, reverse=reverse)
+        self._version += 1
+
+    def reverse(self):
+        """Reverse the list in place."""
+        super().reverse()
+        self._version += 1
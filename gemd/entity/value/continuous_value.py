@@ -1,9 +1,11 @@
 """Base class for all continuous values."""
 from gemd.entity.value.base_value import BaseValue
+from gemd.entity.bounds_validation import is_trusted_construction
 from gemd.units import parse_units
 from gemd.entity.bounds import RealBounds
 
 from abc import abstractmethod
+from typing import Tuple
 
 __all__ = ["ContinuousValue"]
 
@@ -39,7 +41,10 @@ class ContinuousValue(BaseValue):
         if units is None:
             raise ValueError("Continuous values must have units. "
                              "Use an empty string for a dimensionless quantity.")
-        self._units = parse_units(units)
+        if isinstance(units, str) and is_trusted_construction():
+            self._units = units  # Already in canonical form
+        else:
+            self._units = parse_units(units)
 
     @abstractmethod
     def _to_bounds(self) -> RealBounds:
@@ -52,3 +57,20 @@ class ContinuousValue(BaseValue):
             The minimally consistent :class:`~gemd.entity.bounds.real_bounds.RealBounds`.
 
         """
+
+    def _to_range(self) -> Tuple[float, float, str]:
+        """
+        Return the endpoints and units of the smallest bounds consistent with the Value.
+
+        This is the content of :func:`_to_bounds` without building a bounds object, which lets
+        containment checks avoid the allocation.  Subclasses should override it with a cheaper
+        implementation.
+
+        Returns
+        -------
+        Tuple[float, float, str]
+            The lower endpoint, upper endpoint and units.
+
+        """
+        bounds = self._to_bounds()
+        return bounds.lower_bound, bounds.upper_bound, bounds.default_units
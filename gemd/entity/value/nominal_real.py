@@ -2,6 +2,8 @@
 from gemd.entity.value.continuous_value import ContinuousValue
 from gemd.entity.bounds import RealBounds
 
+from typing import Tuple
+
 __all__ = ["NominalReal"]
 
 
@@ -39,3 +41,15 @@ class NominalReal(ContinuousValue, typ="nominal_real"):
         return RealBounds(lower_bound=self.nominal,
                           upper_bound=self.nominal,
                           default_units=self.units)
+
+    def _to_range(self) -> Tuple[float, float, str]:
+        """
+        Return the endpoints and units of the smallest bounds consistent with the Value.
+
+        Returns
+        -------
+        Tuple[float, float, str]
+            The lower endpoint, upper endpoint and units.
+
+        """
+        return self.nominal, self.nominal, self.units
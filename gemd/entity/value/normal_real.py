@@ -2,6 +2,8 @@
 from gemd.entity.value.continuous_value import ContinuousValue
 from gemd.entity.bounds import RealBounds
 
+from typing import Tuple
+
 __all__ = ["NormalReal"]
 
 
@@ -40,3 +42,15 @@ class NormalReal(ContinuousValue, typ="normal_real"):
         return RealBounds(lower_bound=self.mean,
                           upper_bound=self.mean,
                           default_units=self.units)
+
+    def _to_range(self) -> Tuple[float, float, str]:
+        """
+        Return the endpoints and units of the smallest bounds consistent with the Value.
+
+        Returns
+        -------
+        Tuple[float, float, str]
+            The lower endpoint, upper endpoint and units.
+
+        """
+        return self.mean, self.mean, self.units
@@ -2,6 +2,8 @@
 from gemd.entity.value.continuous_value import ContinuousValue
 from gemd.entity.bounds import RealBounds
 
+from typing import Tuple
+
 __all__ = ["UniformReal"]
 
 
@@ -48,3 +50,15 @@ class UniformReal(ContinuousValue, typ="uniform_real"):
         return RealBounds(lower_bound=self.lower_bound,
                           upper_bound=self.upper_bound,
                           default_units=self.units)
+
+    def _to_range(self) -> Tuple[float, float, str]:
+        """
+        Return the endpoints and units of the smallest bounds consistent with the Value.
+
+        Returns
+        -------
+        Tuple[float, float, str]
+            The lower endpoint, upper endpoint and units.
+
+        """
+        return self.lower_bound, self.upper_bound, self.units
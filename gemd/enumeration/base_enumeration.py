@@ -59,6 +59,8 @@ class BaseEnumeration(str, Enum):
         """
         if val is None:
             result = None
+        elif val in cls._value2member_map_:  # Exact matches need no scan
+            result = cls._value2member_map_[val]
         else:
             result = next((x for x in cls if str.lower(val).strip() in x.matches), None)
         if exception and result is None:
@@ -7,6 +7,16 @@ This module provides the four main python json methods:
 * :func:`dumps` for serializing python and gemd objects into a String
 * :func:`loads` for deserializing python and gemd objects from a String
 
+as well as :func:`dump_stream` and :func:`load_stream`, which write and read a JSON Lines
+representation with one entity per line for graphs that are too large to handle as a single
+document.
+
+All of these methods accept a ``backend`` argument to select the JSON library, such as
+``"orjson"`` if it is installed (see :class:`~gemd.json.backend.JSONBackend`), and the
+loading methods accept ``trusted=True`` for data that is known to be valid, such as
+data that gemd wrote itself, in which case objects are built without re-validating their
+contents.
+
 These methods should provide drop-in support for serialization and deserialization of
 gemd-containing data structures by replacing imports of ``json`` with those of ``gemd.json``.
 
@@ -16,18 +26,24 @@ These classes can be used by developers to integrate gemd with other tools by ex
 JSON support provided here to those tools.
 """
 
+from functools import lru_cache
+
 from .gemd_encoder import GEMDEncoder  # noqa: F401
 from .gemd_json import GEMDJson
 
 __all__ = [
     "GEMDEncoder", "GEMDJson",
-    "loads", "dumps", "load", "dump"
+    "loads", "dumps", "load", "dump", "load_stream", "dump_stream"
 ]
 
-__default = GEMDJson()
 
+@lru_cache(maxsize=32)
+def _get_instance(trusted: bool, backend) -> GEMDJson:
+    """Return a shared GEMDJson for the module-level functions."""
+    return GEMDJson(trusted=trusted, backend=backend)
 
-def loads(json_str, **kwargs):
+
+def loads(json_str, *, trusted: bool = False, backend=None, **kwargs):
     """
     Deserialize a json-formatted string into a gemd object.
 
@@ -35,6 +51,11 @@ def loads(json_str, **kwargs):
     ----------
     json_str: str
         A string representing the serialized objects, such as what is produced by :func:`dumps`.
+    trusted: bool, optional
+        Whether the data is known to be valid, so that objects can be built without
+        re-validating their contents.  Default: False.
+    backend: str or JSONBackend, optional
+        The JSON library to use.  Default: the standard library.
     **kwargs: keyword args, optional
         Optional keyword arguments to pass to `json.loads()`.
 
@@ -45,10 +66,10 @@ def loads(json_str, **kwargs):
         back into python object references.
 
     """
-    return __default.loads(json_str, **kwargs)
+    return _get_instance(trusted, backend).loads(json_str, **kwargs)
 
 
-def dumps(obj, **kwargs):
+def dumps(obj, *, backend=None, **kwargs):
     """
     Serialize a gemd object, or container of them, into a json-formatting string.
 
@@ -56,6 +77,8 @@ def dumps(obj, **kwargs):
     ----------
     obj: DictSerializable or List[DictSerializable]
         The object(s) to serialize to a string.
+    backend: str or JSONBackend, optional
+        The JSON library to use.  Default: the standard library.
     **kwargs: keyword args, optional
         Optional keyword arguments to pass to `json.dumps()`.
 
@@ -65,10 +88,10 @@ def dumps(obj, **kwargs):
         A string version of the serialized objects.
 
     """
-    return __default.dumps(obj, **kwargs)
+    return _get_instance(False, backend).dumps(obj, **kwargs)
 
 
-def load(fp, **kwargs):
+def load(fp, *, trusted: bool = False, backend=None, **kwargs):
     """
     Load serialized string representation of an object from a file.
 
@@ -76,6 +99,11 @@ def load(fp, **kwargs):
     ----------
     fp: file
         File to read.
+    trusted: bool, optional
+        Whether the data is known to be valid, so that objects can be built without
+        re-validating their contents.  Default: False.
+    backend: str or JSONBackend, optional
+        The JSON library to use.  Default: the standard library.
     **kwargs: keyword args, optional
         Optional keyword arguments to pass to `json.loads()`.
 
@@ -85,10 +113,10 @@ def load(fp, **kwargs):
         Deserialized object(s).
 
     """
-    return __default.load(fp, **kwargs)
+    return _get_instance(trusted, backend).load(fp, **kwargs)
 
 
-def dump(obj, fp, **kwargs):
+def dump(obj, fp, *, backend=None, **kwargs):
     """
     Dump an object to a file, as a serialized string.
 
@@ -98,6 +126,56 @@ def dump(obj, fp, **kwargs):
         Object(s) to dump
     fp: file
         File to write to.
+    backend: str or JSONBackend, optional
+        The JSON library to use.  Default: the standard library.
+    **kwargs: keyword args, optional
+        Optional keyword arguments to pass to `json.dumps()`.
+
+    Returns
+    -------
+    None
+
+    """
+    return _get_instance(False, backend).dump(obj, fp, **kwargs)
+
+
+def load_stream(fp, *, trusted: bool = False, backend=None, **kwargs):
+    """
+    Load an object from a file in JSON Lines format, as written by :func:`dump_stream`.
+
+    Parameters
+    ----------
+    fp: file
+        File to read.
+    trusted: bool, optional
+        Whether the data is known to be valid, so that objects can be built without
+        re-validating their contents.  Default: False.
+    backend: str or JSONBackend, optional
+        The JSON library to use.  Default: the standard library.
+    **kwargs: keyword args, optional
+        Optional keyword arguments to pass to `json.loads()`.
+
+    Returns
+    -------
+    DictSerializable or List[DictSerializable]
+        Deserialized object(s).
+
+    """
+    return _get_instance(trusted, backend).load_stream(fp, **kwargs)
+
+
+def dump_stream(obj, fp, *, backend=None, **kwargs):
+    """
+    Dump an object to a file in JSON Lines format, one entity per line.
+
+    Parameters
+    ----------
+    obj: DictSerializable or List[DictSerializable]
+        Object(s) to dump
+    fp: file
+        File to write to.
+    backend: str or JSONBackend, optional
+        The JSON library to use.  Default: the standard library.
     **kwargs: keyword args, optional
         Optional keyword arguments to pass to `json.dumps()`.
 
@@ -106,4 +184,4 @@ def dump(obj, fp, **kwargs):
     None
 
     """
-    return __default.dump(obj, fp, **kwargs)
+    return _get_instance(False, backend).dump_stream(obj, fp, **kwargs)
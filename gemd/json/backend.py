@@ -0,0 +1,217 @@
+"""Pluggable JSON encoding/decoding backends for gemd serialization."""
+from abc import ABC, abstractmethod
+import json
+import math
+from typing import Any, Callable, Dict, Optional, Union
+
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.json.gemd_encoder import GEMDEncoder
+
+__all__ = ["JSONBackend", "StdlibBackend", "OrjsonBackend", "get_backend"]
+
+
+class JSONBackend(ABC):
+    """
+    The JSON library that :class:`~gemd.json.gemd_json.GEMDJson` uses to encode and decode text.
+
+    A backend must encode gemd objects (and containers of them) with their keys sorted, so that
+    the output is deterministic, and must call `object_hook` on every decoded JSON object, from
+    the innermost outwards and in document order, as :func:`json.loads` does.
+    """
+
+    name: str = None
+
+    @abstractmethod
+    def dumps(self, obj: Any, **kwargs) -> str:
+        """
+        Serialize `obj`, which may contain gemd objects, with sorted keys.
+
+        Parameters
+        ----------
+        obj: Any
+            The object to serialize.
+        **kwargs: keyword args, optional
+            Optional keyword arguments in the style of `json.dumps()`.
+
+        Returns
+        -------
+        str
+            The serialized object.
+
+        """
+
+    @abstractmethod
+    def loads(self,
+              json_str: Union[str, bytes],
+              *,
+              object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+              **kwargs) -> Any:
+        """
+        Deserialize a string, calling `object_hook` on every decoded JSON object.
+
+        Parameters
+        ----------
+        json_str: str or bytes
+            The text to deserialize.
+        object_hook: Callable[[Dict[str, Any]], Any], optional
+            A function to replace each decoded JSON object with.
+        **kwargs: keyword args, optional
+            Optional keyword arguments in the style of `json.loads()`.
+
+        Returns
+        -------
+        Any
+            The deserialized object.
+
+        """
+
+
+class StdlibBackend(JSONBackend):
+    """The standard library :mod:`json` module, which supports all of its keyword arguments."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        """Serialize `obj` with :func:`json.dumps` and :class:`GEMDEncoder`."""
+        return json.dumps(obj, cls=GEMDEncoder, sort_keys=True, **kwargs)
+
+    def loads(self,
+              json_str: Union[str, bytes],
+              *,
+              object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+              **kwargs) -> Any:
+        """Deserialize `json_str` with :func:`json.loads`."""
+        return json.loads(json_str, object_hook=object_hook, **kwargs)
+
+
+class OrjsonBackend(JSONBackend):
+    """
+    The `orjson <https://github.com/ijl/orjson>`_ library, if it is installed.
+
+    Everything except gemd objects is encoded natively by orjson; each gemd object is handed
+    back to orjson as its :func:`~gemd.entity.dict_serializable.DictSerializable.as_dict`
+    primitives.  The output is semantically equivalent to that of :class:`StdlibBackend` but
+    compact, except that ``indent=2`` is supported.  No other keyword arguments are supported.
+    orjson would write non-finite floats as ``null``, so any object that contains them is
+    encoded by the standard library instead, as ``NaN`` or ``Infinity``, which :meth:`loads`
+    also hands to the standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson  # Raises an ImportError if orjson is not installed
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, **kwargs) -> str:
+        """Serialize `obj` with :func:`orjson.dumps`."""
+        option = self._orjson.OPT_SORT_KEYS | self._orjson.OPT_NON_STR_KEYS
+        indent = kwargs.pop("indent", None)
+        if indent == 2:
+            option |= self._orjson.OPT_INDENT_2
+        elif indent is not None:
+            raise ValueError(f"The orjson backend only supports an indent of 2, not {indent}.")
+        if kwargs:
+            raise TypeError(f"The orjson backend does not support arguments {sorted(kwargs)}.")
+
+        non_finite = []
+
+        def default(value: Any) -> Dict[str, Any]:
+            primitives = _as_primitives(value)
+            if not _all_finite(primitives):
+                non_finite.append(value)
+                raise ValueError("orjson cannot encode non-finite floats")
+            return primitives
+
+        try:
+            if _all_finite(obj):
+                return self._orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            if not non_finite:
+                raise
+        return json.dumps(obj, cls=GEMDEncoder, sort_keys=True, indent=indent)
+
+    def loads(self,
+              json_str: Union[str, bytes],
+              *,
+              object_hook: Optional[Callable[[Dict[str, Any]], Any]] = None,
+              **kwargs) -> Any:
+        """Deserialize `json_str` with :func:`orjson.loads`, then apply `object_hook`."""
+        if kwargs:
+            raise TypeError(f"The orjson backend does not support arguments {sorted(kwargs)}.")
+        try:
+            result = self._orjson.loads(json_str)
+        except self._orjson.JSONDecodeError:
+            # orjson rejects the NaN and Infinity that the standard library writes
+            return json.loads(json_str, object_hook=object_hook)
+        if object_hook is None:
+            return result
+        return _apply_object_hook(result, object_hook)
+
+
+def _as_primitives(obj: Any) -> Dict[str, Any]:
+    """Convert a gemd object that orjson does not natively support into a dict."""
+    if isinstance(obj, DictSerializable):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _all_finite(obj: Any) -> bool:
+    """Check that no float in `obj` is NaN or infinite, leaving gemd objects to `default`."""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    elif isinstance(obj, dict):
+        return all(_all_finite(value) for value in obj.values())
+    elif isinstance(obj, (list, tuple)):
+        return all(_all_finite(value) for value in obj)
+    return True
+
+
+def _apply_object_hook(obj: Any, object_hook: Callable[[Dict[str, Any]], Any]) -> Any:
+    """Call `object_hook` on every dict in `obj`, innermost first and in document order."""
+    if type(obj) is dict:
+        for key, value in obj.items():
+            if type(value) is dict or type(value) is list:
+                obj[key] = _apply_object_hook(value, object_hook)
+        return object_hook(obj)
+    elif type(obj) is list:
+        for i, value in enumerate(obj):
+            if type(value) is dict or type(value) is list:
+                obj[i] = _apply_object_hook(value, object_hook)
+    return obj
+
+
+_BACKENDS = {StdlibBackend.name: StdlibBackend, OrjsonBackend.name: OrjsonBackend}
+
+
+def get_backend(backend: Union[str, JSONBackend, None] = None) -> JSONBackend:
+    """
+    Resolve a JSON backend by name.
+
+    Parameters
+    ----------
+    backend: str or JSONBackend, optional
+        The name of a backend (``"json"`` or ``"orjson"``) or a backend instance, which is
+        returned as-is.  Default: the standard library backend.
+
+    Returns
+    -------
+    JSONBackend
+        The backend.
+
+    Raises
+    ------
+    ValueError
+        If the name is not recognized.
+    ImportError
+        If the library for the named backend is not installed.
+
+    """
+    if backend is None:
+        backend = StdlibBackend.name
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unrecognized JSON backend {backend}; "
+                         f"valid choices are {sorted(_BACKENDS)}")
+    return _BACKENDS[backend]()
@@ -1,11 +1,16 @@
+import codecs
 import json
-from typing import Dict, Any, Type
+import re
+from contextlib import nullcontext
+from typing import Dict, Any, Type, Callable, Optional, Tuple, Union
 
-from gemd.entity.dict_serializable import DictSerializable
+from gemd.entity.dict_serializable import DictSerializable, DictSerializableMeta
 from gemd.entity.base_entity import BaseEntity
+from gemd.entity.bounds_validation import trusted_construction
 from gemd.entity.link_by_uid import LinkByUID
-from gemd.json import GEMDEncoder
+from gemd.json.backend import JSONBackend, get_backend, _apply_object_hook
 from gemd.util import flatten, substitute_links, set_uuids
+from gemd.util.impl import _flatten_entities
 
 __all__ = ["GEMDJson"]
 
@@ -18,17 +23,41 @@ class GEMDJson(object):
     :ref:`Serialization In Depth`
 
     scope: defines the scope to use for autogenerated UUIDs for objects without uids
+    trusted: whether the data to be loaded is known to be valid (e.g., because gemd wrote it),
+    in which case objects are built without re-validating their contents.  See
+    :func:`~gemd.entity.bounds_validation.trusted_construction`.
+    backend: the JSON library to encode and decode with, either the name of a backend (``"json"``
+    for the standard library, the default, or ``"orjson"``) or a
+    :class:`~gemd.json.backend.JSONBackend`.  :func:`load` always decodes incrementally with
+    the standard library.
     """
 
-    def __init__(self, scope: str = 'auto'):
+    def __init__(self,
+                 scope: str = 'auto',
+                 *,
+                 trusted: bool = False,
+                 backend: Union[str, JSONBackend, None] = None):
         self._scope = scope
+        self._trusted = trusted
+        self._backend = get_backend(backend)
         self._clazz_index = dict()
+        self._type_plan_cache = None
 
     @property
     def scope(self) -> str:
         """Return the default scope value."""
         return self._scope
 
+    @property
+    def backend(self) -> JSONBackend:
+        """Return the JSON backend used to encode and decode text."""
+        return self._backend
+
+    @property
+    def trusted(self) -> bool:
+        """Return whether loaded data is built without re-validation."""
+        return self._trusted
+
     def dumps(self, obj, **kwargs) -> str:
         """
         Serialize a gemd object, or container of them, into a json-formatting string.
@@ -52,7 +81,7 @@ class GEMDJson(object):
         additional = flatten(res, self.scope)
         res = substitute_links(res)
         res["context"] = additional
-        return json.dumps(res, cls=GEMDEncoder, sort_keys=True, **kwargs)
+        return self._backend.dumps(res, **kwargs)
 
     def loads(self, json_str: str, **kwargs):
         """
@@ -75,15 +104,11 @@ class GEMDJson(object):
         # Create an index to hold the objects by their uid reference
         # so we can replace links with pointers
         index = {}
-        clazz_index = DictSerializable.class_mapping
-        clazz_index.update(self._clazz_index)
-        raw = json.loads(
-            json_str,
-            object_hook=lambda x: self._load_and_index(x,
-                                                       index,
-                                                       clazz_index=clazz_index,
-                                                       substitute=True),
-            **kwargs)
+        with self._construction():
+            raw = self._backend.loads(
+                json_str,
+                object_hook=self._object_hook(index, substitute=True),
+                **kwargs)
         # the return value is in the 2nd position.
         return raw["object"]
 
@@ -91,6 +116,12 @@ class GEMDJson(object):
         """
         Load serialized string representation of an object from a file.
 
+        Unlike :func:`loads`, the file is not read into memory all at once.  The entries of
+        the ``"context"`` array are read, deserialized and indexed one at a time, so that the
+        raw text of each entity can be released as soon as the entity is built.  `fp` may be
+        any object with a ``read`` method, such as a text or binary file or a
+        :class:`mmap.mmap`.
+
         Parameters
         ----------
         fp: file
@@ -104,7 +135,16 @@ class GEMDJson(object):
             Deserialized object(s).
 
         """
-        return self.loads(fp.read(), **kwargs)
+        # Create an index to hold the objects by their uid reference
+        # so we can replace links with pointers
+        index = {}
+        reader = _IncrementalReader(fp)
+        with self._construction():
+            raw = reader.load_document(
+                object_hook=self._object_hook(index, substitute=True),
+                **kwargs)
+        # the return value is in the 2nd position.
+        return raw["object"]
 
     def dump(self, obj, fp, **kwargs):
         """
@@ -127,6 +167,80 @@ class GEMDJson(object):
         fp.write(self.dumps(obj, **kwargs))
         return
 
+    def dump_stream(self, obj, fp, **kwargs):
+        """
+        Dump an object to a file in JSON Lines format, one entity per line.
+
+        The output contains the same information as :func:`dump`, but rather than a single
+        ``{"context": [...], "object": ...}`` document, each entity from the context is written
+        on its own line, in writable sort order, followed by a final ``{"object": ...}`` line.
+        Entities are link-substituted one at a time as they are written, so the memory
+        overhead beyond the object graph itself is a list of references to its entities.
+        Use :func:`load_stream` to read the output back.
+
+        Parameters
+        ----------
+        obj: DictSerializable or List[DictSerializable]
+            Object(s) to dump
+        fp: file
+            File to write to.
+        **kwargs: keyword args, optional
+            Optional keyword arguments to pass to `json.dumps()`.  Since every record must
+            fit on a single line, `indent` is not supported.
+
+        Returns
+        -------
+        None
+
+        """
+        if kwargs.get("indent") is not None:
+            raise ValueError("dump_stream writes one record per line and cannot indent.")
+
+        res = {"object": obj}
+        for entity in _flatten_entities(res, self.scope):
+            fp.write(self._backend.dumps(substitute_links(entity), **kwargs))
+            fp.write("\n")
+        fp.write(self._backend.dumps(substitute_links(res), **kwargs))
+        fp.write("\n")
+        return
+
+    def load_stream(self, fp, **kwargs):
+        """
+        Load an object from a file in JSON Lines format, as written by :func:`dump_stream`.
+
+        Each line is deserialized and indexed as soon as it is read, so only one line of raw
+        text is held in memory at a time.
+
+        Parameters
+        ----------
+        fp: file
+            File to read; any iterable of lines (str or bytes) is accepted.
+        **kwargs: keyword args, optional
+            Optional keyword arguments to pass to `json.loads()`.
+
+        Returns
+        -------
+        DictSerializable or List[DictSerializable]
+            Deserialized object(s).
+
+        """
+        index = {}
+        hook = self._object_hook(index, substitute=True)
+        found = False
+        result = None
+        with self._construction():
+            for line in fp:
+                if not line.strip():
+                    continue
+                raw = self._backend.loads(line, object_hook=hook, **kwargs)
+                if not isinstance(raw, DictSerializable):
+                    # Anything that isn't an entity is the closing object record
+                    found = True
+                    result = raw["object"]
+        if not found:
+            raise ValueError("Stream did not contain an object record.")
+        return result
+
     def copy(self, obj):
         """
         Copy an object by dumping and then loading it.
@@ -161,7 +275,7 @@ class GEMDJson(object):
             A serialized string of `obj`, which could be nested
 
         """
-        return json.dumps(obj, cls=GEMDEncoder, sort_keys=True, **kwargs)
+        return self._backend.dumps(obj, **kwargs)
 
     def thin_dumps(self, obj, **kwargs):
         """
@@ -182,7 +296,7 @@ class GEMDJson(object):
         """
         set_uuids(obj, self.scope)
         res = substitute_links(obj)
-        return json.dumps(res, cls=GEMDEncoder, sort_keys=True, **kwargs)
+        return self._backend.dumps(res, **kwargs)
 
     def raw_loads(self, json_str, **kwargs):
         """
@@ -204,55 +318,216 @@ class GEMDJson(object):
         # Create an index to hold the objects by their uid reference
         # so we can replace links with pointers
         index = {}
-        clazz_index = DictSerializable.class_mapping
-        clazz_index.update(self._clazz_index)
-        return json.loads(
-            json_str,
-            object_hook=lambda x: self._load_and_index(x, index, clazz_index=clazz_index),
-            **kwargs)
-
-    @staticmethod
-    def _load_and_index(
-            d: Dict[str, Any],
-            object_index: Dict[str, DictSerializable],
-            clazz_index: Dict[str, Type],
-            substitute: bool = False) -> DictSerializable:
+        with self._construction():
+            return self._backend.loads(
+                json_str,
+                object_hook=self._object_hook(index),
+                **kwargs)
+
+    def _construction(self):
+        """Return the context in which objects should be deserialized."""
+        return trusted_construction() if self._trusted else nullcontext()
+
+    def _type_plan(self) -> Dict[str, Tuple[Callable[[Dict[str, Any]], Any], bool, bool]]:
         """
-        Load the class based on the type string and index it, if a BaseEntity.
+        Return the type plan for the classes currently registered with this object.
 
-        This function is used as the object hook when deserializing gemd objects
+        The plan maps each type string to the decoder for its class (see
+        :func:`DictSerializable._decoder`), whether instances should be indexed by their uids,
+        and whether instances are links that may be substituted.  It is rebuilt only when
+        new classes have been registered.
+
+        Returns
+        -------
+        Dict[str, Tuple[Callable, bool, bool]]
+            The type plan, keyed by type string.
+
+        """
+        key = (DictSerializableMeta._registry_version, tuple(self._clazz_index.items()))
+        if self._type_plan_cache is None or self._type_plan_cache[0] != key:
+            clazz_index = DictSerializable.class_mapping
+            clazz_index.update(self._clazz_index)
+            plan = {typ: (clz._decoder(), issubclass(clz, BaseEntity), issubclass(clz, LinkByUID))
+                    for typ, clz in clazz_index.items()}
+            self._type_plan_cache = (key, plan)
+        return self._type_plan_cache[1]
+
+    def _object_hook(self,
+                     object_index: Dict[str, DictSerializable],
+                     substitute: bool = False) -> Callable[[Dict[str, Any]], Any]:
+        """
+        Generate an object hook for `json.loads` that uses the current type plan.
+
+        Each dictionary with a type string is deserialized into its registered class, which is
+        found with a single lookup into the precompiled plan, and BaseEntities are indexed by
+        their uids.
 
         Parameters
         ----------
-        d: dict
-            dictionary to try to load into a registered class instance
         object_index: dict
-            to add the object to if it is a BaseEntity
+            to add the deserialized objects to if they are BaseEntities
         substitute: bool
             whether to substitute LinkByUIDs when they are found in the index
 
         Returns
         -------
-        object
-            the deserialized object, or the input dict if it wasn't recognized
+        Callable[[Dict[str, Any]], Any]
+            The object hook.
 
         """
-        if "type" not in d:
-            return d
-        typ = d.pop("type")
+        plan = self._type_plan()
 
-        if typ not in clazz_index:
-            raise TypeError("Unexpected base object type: {}".format(typ))
+        def hook(d: Dict[str, Any]) -> Any:
+            if "type" not in d:
+                return d
+            typ = d.pop("type")
+            try:
+                decoder, indexed, link = plan[typ]
+            except KeyError:
+                raise TypeError("Unexpected base object type: {}".format(typ)) from None
 
-        clz = clazz_index[typ]
-        obj = clz.from_dict(d)
+            obj = decoder(d)
+            if indexed:  # Add it to the object index
+                for (scope, uid) in obj.uids.items():
+                    object_index[(scope.lower(), uid)] = obj
+            elif substitute and link:  # sub it if possible
+                obj = object_index.get((obj.scope.lower(), obj.id), obj)
+            return obj
 
-        if isinstance(obj, BaseEntity):  # Add it to the object index
-            for (scope, uid) in obj.uids.items():
-                object_index[(scope.lower(), uid)] = obj
+        return hook
 
-        if substitute and issubclass(clz, LinkByUID):  # sub it if possible
-            if (obj.scope.lower(), obj.id) in object_index:
-                obj = object_index[(obj.scope.lower(), obj.id)]
 
-        return obj
+class _IncrementalReader(object):
+    """
+    Read a serialized ``{"context": [...], "object": ...}`` document a piece at a time.
+
+    The document is read from `fp` in chunks, and each element of the ``"context"`` array is
+    decoded as soon as it is complete.  Consumed text is discarded, so only the current
+    element (and at most one chunk of lookahead) is ever held in memory as text.
+    """
+
+    _WHITESPACE = re.compile(r'[ \t\n\r]*')
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, fp, *, chunk_size: int = CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+        self._bytes_decoder = None
+
+    def _fill(self, minimum: int = 0) -> bool:
+        """Read at least another chunk into the buffer; return False at end of file."""
+        if self._eof:
+            return False
+        if self._pos > 0:  # Release everything we have already consumed
+            self._text = self._text[self._pos:]
+            self._pos = 0
+        chunk = self._fp.read(max(self._chunk_size, minimum))
+        if len(chunk) == 0:
+            self._eof = True
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if self._bytes_decoder is None:
+                self._bytes_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self._bytes_decoder.decode(bytes(chunk), final=self._eof)
+        self._text += chunk
+        return not self._eof
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or '' at end of file."""
+        while True:
+            self._pos = self._WHITESPACE.match(self._text, self._pos).end()
+            if self._pos < len(self._text) or not self._fill():
+                break
+        return self._text[self._pos:self._pos + 1]
+
+    def _expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of `chars`."""
+        char = self._peek()
+        if char == "" or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {list(chars)}", self._text, self._pos)
+        self._pos += 1
+        return char
+
+    def _next_value(self, decoder: json.JSONDecoder) -> Any:
+        """Decode the next value, reading until it is entirely in the buffer."""
+        self._peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self._text, self._pos)
+                # A number at the very end of the buffer may be continued in the next chunk
+                if end < len(self._text) or not self._fill():
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                # Grow the read geometrically so that large values parse in linear time
+                if not self._fill(minimum=len(self._text) - self._pos):
+                    raise
+
+    def load_document(self,
+                      *,
+                      object_hook: Callable[[Dict[str, Any]], Any],
+                      cls: Optional[Type[json.JSONDecoder]] = None,
+                      **kwargs) -> Dict[str, Any]:
+        """
+        Decode the top-level document, streaming through the ``"context"`` array.
+
+        Parameters
+        ----------
+        object_hook: Callable
+            The object hook used to build each decoded dictionary.
+        cls: Type[JSONDecoder], optional
+            The decoder class, as for `json.loads()`.
+        **kwargs: keyword args, optional
+            Optional keyword arguments to pass to the decoder, as for `json.loads()`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The top-level dictionary.  The ``"context"`` entry is not retained.
+
+        """
+        if cls is None:
+            cls = json.JSONDecoder
+        # Values are decoded without the hook, so that it never sees one that is cut off by the
+        # end of the buffer (and so never builds and indexes objects twice), and then built.
+        decoder = cls(**kwargs)
+
+        result = {}
+        deferred = {}  # Values that may contain links to entities not yet loaded
+        context_seen = False
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+        else:
+            while True:
+                key = self._next_value(decoder)
+                if not isinstance(key, str):
+                    raise json.JSONDecodeError("Expecting property name enclosed in double "
+                                               "quotes", self._text, self._pos)
+                self._expect(":")
+                if key == "context" and self._peek() == "[":
+                    self._pos += 1
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        while True:
+                            _apply_object_hook(self._next_value(decoder), object_hook)  # Indexed
+                            if self._expect(",]") == "]":
+                                break
+                    result[key] = None
+                    context_seen = True
+                elif context_seen:
+                    result[key] = _apply_object_hook(self._next_value(decoder), object_hook)
+                else:
+                    deferred[key] = self._next_value(decoder)
+                if self._expect(",}") == "}":
+                    break
+
+        if self._peek() != "":
+            raise json.JSONDecodeError("Extra data", self._text, self._pos)
+
+        for key, value in deferred.items():
+            result[key] = _apply_object_hook(value, object_hook)
+        return result
@@ -1,8 +1,10 @@
 # flake8: noqa
-from .impl import parse_units, convert_units, get_base_units, change_definitions_file, \
+from .impl import parse_units, convert_units, convert_units_array, get_base_units, \
+    change_definitions_file, UnitsSnapshot, snapshot_units, restore_units, \
     UndefinedUnitError, IncompatibleUnitsError, DefinitionSyntaxError
 
 __all__ = [
-    "parse_units", "convert_units", "get_base_units", "change_definitions_file",
+    "parse_units", "convert_units", "convert_units_array", "get_base_units",
+    "change_definitions_file", "UnitsSnapshot", "snapshot_units", "restore_units",
     "UndefinedUnitError", "IncompatibleUnitsError", "DefinitionSyntaxError"
 ]
@@ -1,12 +1,14 @@
 """Implementation of units."""
 from deprecation import deprecated
 import functools
+import hashlib
 from importlib.resources import files
 import os
 from pathlib import Path
 import re
-from tempfile import TemporaryDirectory
-from typing import Union, List, Tuple, Generator, Any
+from tempfile import NamedTemporaryFile, TemporaryDirectory
+import threading
+from typing import Union, Iterable, List, NamedTuple, Optional, Tuple, Generator, Any
 try:
     from typing import TypeAlias  # Python 3.10+
 except ImportError:  # pragma nocover
@@ -21,28 +23,93 @@ from pint.errors import DimensionalityError as IncompatibleUnitsError
 from pint.errors import UndefinedUnitError, DefinitionSyntaxError
 from pint.registry import GenericUnitRegistry
 
-# Store directories so they don't get auto-cleaned until exit
-_TEMP_DIRECTORY = TemporaryDirectory()
-
 __all__ = [
-    "parse_units", "convert_units", "get_base_units", "change_definitions_file",
+    "parse_units", "convert_units", "convert_units_array", "get_base_units",
+    "change_definitions_file", "UnitsSnapshot", "snapshot_units", "restore_units",
     "UndefinedUnitError", "IncompatibleUnitsError", "DefinitionSyntaxError"
 ]
 
 
+# Environment variable for the folder that parsed unit definitions are cached in, if any
+CACHE_ENVIRONMENT_VARIABLE = "GEMD_UNITS_CACHE"
+
+
+@functools.lru_cache(maxsize=None)
+def _cache_folder() -> Optional[Path]:
+    """
+    Find the folder to cache parsed unit definitions in, once per process.
+
+    The cache is opt-in: the folder is taken from the `GEMD_UNITS_CACHE` environment variable,
+    and there is no cache if it is unset or empty, or if the folder cannot be created.
+
+    Pint stores the parsed definitions as pickles and loads whatever it finds in its subfolder,
+    so the folder must not be writable by anyone who should not be able to run code as you.
+
+    """
+    folder = os.environ.get(CACHE_ENVIRONMENT_VARIABLE, "")
+    if folder == "":
+        return None
+    try:
+        folder = Path(folder).expanduser().resolve()
+        folder.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return folder if os.access(folder, os.W_OK) else None
+
+
+@functools.lru_cache(maxsize=None)
+def _pickle_folder() -> Optional[Path]:
+    """
+    Find the folder in the cache that Pint stores parsed definitions in, once per process.
+
+    It is a subfolder of its own, so that only gemd's pickles are cleared if they are unusable.
+
+    """
+    cache_folder = _cache_folder()
+    if cache_folder is None:
+        return None
+    folder = cache_folder / "pint"
+    try:
+        folder.mkdir(exist_ok=True)
+    except OSError:
+        return None
+    return folder
+
+
+@functools.lru_cache(maxsize=None)
 def _deploy_default_files() -> Tuple[Path, Path]:
-    """Copy the units & constants file into a temporary directory."""
+    """
+    Copy the units & constants file into a folder they can be loaded from, once per process.
+
+    Pint caches a parsed definitions file by its content, but also remembers the paths that it
+    imports, so the files are copied to a folder in the cache that is named for their content.
+    Without a cache, they are copied to a temporary directory.
+
+    """
+    global _TEMP_DIRECTORY
     resources = files("gemd.units")
-    target_dir = Path(_TEMP_DIRECTORY.name)
-    target_paths = tuple(target_dir / f for f in ("citrine_en.txt", "constants_en.txt"))
-    for target in target_paths:
-        source = resources.joinpath(target.name)
-        target.write_bytes(source.read_bytes())
+    names = ("citrine_en.txt", "constants_en.txt")
+    contents = [resources.joinpath(name).read_bytes() for name in names]
+
+    cache_folder = _cache_folder()
+    if cache_folder is None:
+        # Store directories so they don't get auto-cleaned until exit
+        _TEMP_DIRECTORY = TemporaryDirectory()
+        target_dir = Path(_TEMP_DIRECTORY.name)
+    else:
+        target_dir = cache_folder / hashlib.sha256(b"".join(contents)).hexdigest()[:16]
+        target_dir.mkdir(exist_ok=True)
+    target_paths = tuple(target_dir / name for name in names)
+    for target, content in zip(target_paths, contents):
+        if not target.is_file() or target.read_bytes() != content:
+            # Write atomically, since other processes may be loading the same file
+            with NamedTemporaryFile(dir=target_dir, delete=False) as handle:
+                handle.write(content)
+            os.replace(handle.name, target)
 
     return target_paths
 
 
-DEFAULT_FILE, DEFAULT_CONSTANTS = _deploy_default_files()
 _ALLOWED_OPERATORS = {".", "+", "-", "*", "/", "//", "^", "**", "(", ")"}
 
 
@@ -167,6 +234,7 @@ def _scaling_store_and_mangle(input_string: str, todo: List[Tuple[str, str, str]
 
     """
     for scaled_term, number_string, unit_string in todo:
+        registry = _registry()
         regex = rf"(?<![-+0-9.]){re.escape(scaled_term)}(?![0-9.])"
         stripped = re.sub(
             r"(?<=\d)_(?=\d)", "", re.sub(r"[+\s]+", "", scaled_term).replace("--", "")
@@ -176,8 +244,8 @@ def _scaling_store_and_mangle(input_string: str, todo: List[Tuple[str, str, str]
             stripped_unit = re.sub(
                 r"(?<!0)(?=\.)", "0", re.sub(r"[+\s]+", "", unit_string)
             ).replace("--", "")
-            long_unit = f"{_REGISTRY.parse_units(stripped_unit)}"
-            short_unit = f"{_REGISTRY.parse_units(stripped_unit):~}"
+            long_unit = f"{registry.parse_units(stripped_unit)}"
+            short_unit = f"{registry.parse_units(stripped_unit):~}"
             long = stripped.replace(stripped_unit, "_" + long_unit)
             short = stripped.replace(stripped_unit, " " + short_unit)
         else:
@@ -186,15 +254,22 @@ def _scaling_store_and_mangle(input_string: str, todo: List[Tuple[str, str, str]
 
         underscored = re.sub(r"[-.]", "_", long)
         valid = f"_{underscored}"
-        if valid not in _REGISTRY:
-            # Parse subexpression to clean things up for define
-            value = f"{_REGISTRY.parse_expression(scaled_term)}"
-            _REGISTRY.define(f"{valid} = {value} = {short}")
+        with _REGISTRY_LOCK:  # Check and define atomically, so each unit is defined once
+            if valid not in registry:
+                # Parse subexpression to clean things up for define
+                value = f"{registry.parse_expression(scaled_term)}"
+                _define_scaling(registry, f"{valid} = {value} = {short}")
         input_string = re.sub(regex, valid, input_string)
 
     return input_string
 
 
+def _define_scaling(registry: "_ScaleFactorRegistry", definition: str):
+    """Define a scaling-factor unit, recording it so that it can be snapshot."""
+    registry.define(definition)
+    _SCALING_DEFINITIONS.append(definition)
+
+
 def _scaling_preprocessor(input_string: str) -> str:
     """Preprocessor that turns scaling factors into non-dimensional units."""
     blocks = _scaling_find_blocks(tokenizer(input_string))
@@ -242,10 +317,61 @@ class _ScaleFactorRegistry(GenericUnitRegistry[_ScaleFactorQuantity, _ScaleFacto
     Unit: TypeAlias = _ScaleFactorUnit
 
 
-_REGISTRY: _ScaleFactorRegistry = None  # global requires it be defined in this scope
+# The registry is built on first use (see _registry), so that importing gemd stays fast
+_REGISTRY: _ScaleFactorRegistry
+_REGISTRY_LOCK = threading.RLock()
+_DEFINITIONS_FILE: Optional[Path] = None  # None for the default file
+_SCALING_DEFINITIONS: List[str] = []  # Defined while parsing, in order
+_GENERATION = 0  # Incremented whenever the registry is replaced
+
+
+def _registry() -> _ScaleFactorRegistry:
+    """Return the unit registry, building it from the default definitions on first use."""
+    try:
+        return _REGISTRY
+    except NameError:
+        with _REGISTRY_LOCK:
+            if "_REGISTRY" not in globals():  # Another thread may have just built it
+                change_definitions_file()
+        return _REGISTRY
+
+
+def _registry_cache(maxsize: int):
+    """
+    Cache a function of the unit registry, calling it under the registry lock on a miss.
+
+    Results are keyed on the generation of the registry, so that one computed against a
+    registry that has since been replaced is never returned, even if it is stored after the
+    cache was cleared.  The cache controls of ``functools.lru_cache`` are kept.
+    """
+    def decorator(func):
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(generation, *args, **kwargs):
+            with _REGISTRY_LOCK:
+                return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(_GENERATION, *args, **kwargs)
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+def __getattr__(name: str):
+    """Resolve the lazily-built module attributes."""
+    if name == "_REGISTRY":
+        return _registry()
+    elif name == "DEFAULT_FILE":
+        return _deploy_default_files()[0]
+    elif name == "DEFAULT_CONSTANTS":
+        return _deploy_default_files()[1]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-@functools.lru_cache(maxsize=1024 * 1024)
 def convert_units(value: float, starting_unit: str, final_unit: str) -> float:
     """
     Convert the value from the starting_unit to the final_unit.
@@ -267,21 +393,138 @@ def convert_units(value: float, starting_unit: str, final_unit: str) -> float:
     """
     if starting_unit == final_unit:
         return value  # skip computation
-    else:
-        resolved_value = _REGISTRY.Quantity(value, starting_unit)
-        resolved_final_unit = _REGISTRY.parse_units(final_unit)
-        # Make sure count, radian, bit, and non-dimensional don't accidentally interconvert
-        # https://pint.readthedocs.io/en/0.23/user/angular_frequency.html
-        root1 = _REGISTRY.get_root_units(resolved_value)[1]
-        root2 = _REGISTRY.get_root_units(resolved_final_unit)[1]
-        if root1 != root2:
-            raise IncompatibleUnitsError(
-                units1=resolved_value.units,
-                dim1=_REGISTRY.get_dimensionality(resolved_final_unit),
-                units2=final_unit,
-                dim2=_REGISTRY.get_dimensionality(resolved_final_unit)
-            )
-        return resolved_value.to(resolved_final_unit).magnitude
+    factor = _conversion_factor(starting_unit, final_unit)
+    if isinstance(factor, _Incompatible):
+        raise factor.error()
+    elif factor is None:
+        with _REGISTRY_LOCK:
+            return _registry().Quantity(value, starting_unit).to(final_unit).magnitude
+    return value * factor  # The same arithmetic as Pint uses for multiplicative units
+
+
+def convert_units_array(values: Iterable[float], starting_unit: str, final_unit: str):
+    """
+    Convert many values from the starting_unit to the final_unit at once.
+
+    The conversion is the same as :func:`convert_units`, but it is looked up once and, if the
+    values are a NumPy array or a pandas object, applied in a single vectorized operation.
+    NumPy and pandas are optional; see :func:`~gemd.entity.util.array_like`.
+
+    Parameters
+    ----------
+    values: numpy.ndarray, pandas.Series, or Iterable[float]
+        magnitudes to convert
+    starting_unit: str
+        unit that the magnitudes are currently in
+    final_unit: str
+        unit that the magnitudes should be returned in
+
+    Returns
+    -------
+    numpy.ndarray, pandas.Series, or List[float]
+        The converted numbers: an object of the same type for NumPy and pandas input, and a
+        list otherwise
+
+    """
+    from gemd.entity.util import array_like
+
+    vectorized = isinstance(values, array_like()) and not isinstance(values, (list, tuple))
+    if starting_unit == final_unit:
+        return values.copy() if vectorized else list(values)  # skip computation
+    factor = _conversion_factor(starting_unit, final_unit)
+    if isinstance(factor, _Incompatible):
+        raise factor.error()
+    elif factor is None:
+        if not vectorized:
+            return [convert_units(x, starting_unit, final_unit) for x in values]
+        import numpy as np
+
+        # Pint converts a whole array of offset or logarithmic values in one call
+        result = values.astype(float)  # A copy, of the same type
+        with _REGISTRY_LOCK:
+            quantity = _registry().Quantity(np.asarray(result), starting_unit)
+            result[:] = quantity.to(final_unit).magnitude
+        return result
+    return values * factor if vectorized else [x * factor for x in values]
+
+
+class _Incompatible(NamedTuple):
+    """
+    The cached outcome of converting between incompatible units.
+
+    A fresh error is raised from it on each call, since an exception that is raised more than
+    once (possibly by several threads at a time) has its traceback and context overwritten.
+    """
+
+    units1: Any
+    units2: Any
+    dim1: str = ""
+    dim2: str = ""
+    extra_msg: str = ""
+
+    def error(self) -> IncompatibleUnitsError:
+        """Build the error to raise."""
+        return IncompatibleUnitsError(*self)
+
+
+@_registry_cache(maxsize=1024)
+def _conversion_factor(starting_unit: str,
+                       final_unit: str) -> Union[float, None, _Incompatible]:
+    """
+    Compile the conversion between two units into a multiplicative factor, if it is one.
+
+    A conversion between multiplicative units is resolved through Pint once per pair of units
+    and then applied arithmetically to any number of values.  Offset units (such as degrees
+    Celsius) and logarithmic units (such as dBm) are not, and are left to Pint for each value.
+    As with Pint's own conversion factor cache, an incompatible pair returns (rather than
+    raises) a description of the error, so that it is cached as well.
+
+    Parameters
+    ----------
+    starting_unit: str
+        unit that the magnitudes are in
+    final_unit: str
+        unit that the magnitudes should be converted to
+
+    Returns
+    -------
+    float, None or _Incompatible
+        The factor that magnitudes are multiplied by, None if the conversion is not
+        multiplicative, or a description of the error if the units cannot be interconverted.
+
+    """
+    registry = _registry()
+    resolved_one = registry.Quantity(1.0, starting_unit)
+    resolved_final_unit = registry.parse_units(final_unit)
+    # Make sure count, radian, bit, and non-dimensional don't accidentally interconvert
+    # https://pint.readthedocs.io/en/0.23/user/angular_frequency.html
+    root1 = registry.get_root_units(resolved_one)[1]
+    root2 = registry.get_root_units(resolved_final_unit)[1]
+    if root1 != root2:
+        return _Incompatible(
+            units1=resolved_one.units,
+            dim1=registry.get_dimensionality(resolved_final_unit),
+            units2=final_unit,
+            dim2=registry.get_dimensionality(resolved_final_unit)
+        )
+    try:
+        converted = resolved_one.to(resolved_final_unit)
+    except IncompatibleUnitsError as err:
+        return _Incompatible(err.units1, err.units2, err.dim1, err.dim2, err.extra_msg)
+    if not (resolved_one._is_multiplicative and converted._is_multiplicative):
+        return None
+    return float(converted.magnitude)  # Pint's own conversion factor
+
+
+# convert_units used to be an lru_cache itself; keep its cache controls working
+convert_units.cache_info = _conversion_factor.cache_info
+convert_units.cache_clear = _conversion_factor.cache_clear
+
+
+def _is_convertible(starting_unit: str, final_unit: str) -> bool:
+    """Whether :func:`convert_units` can convert values between the two units."""
+    return starting_unit == final_unit \
+        or not isinstance(_conversion_factor(starting_unit, final_unit), _Incompatible)
 
 
 @register_unit_format("clean")
@@ -312,7 +555,7 @@ def _format_clean(unit, registry, **options):
     return formatter(unit, registry, **options)
 
 
-@functools.lru_cache(maxsize=1024)
+@_registry_cache(maxsize=1024)
 def parse_units(units: Union[str, UnitRegistry.Unit, None],
                 *,
                 return_unit: bool = False
@@ -335,12 +578,12 @@ def parse_units(units: Union[str, UnitRegistry.Unit, None],
     """
     if units is None:
         if return_unit:
-            return _REGISTRY.parse_units("")
+            return _registry().parse_units("")
         else:
             return None
     elif isinstance(units, str):
         # SPT-1311 Protect against leaked mangled strings
-        parsed = _REGISTRY.parse_units(_unmangle_scaling(units))
+        parsed = _registry().parse_units(_unmangle_scaling(units))
         if return_unit:
             return parsed
         else:
@@ -351,7 +594,7 @@ def parse_units(units: Union[str, UnitRegistry.Unit, None],
         raise UndefinedUnitError("Units must be given as a recognized unit string or Units object")
 
 
-@functools.lru_cache(maxsize=1024)
+@_registry_cache(maxsize=1024)
 def get_base_units(units: Union[str, UnitRegistry.Unit]) -> Tuple[UnitRegistry.Unit, float, float]:
     """
     Get the base units and conversion factors for the given unit.
@@ -368,10 +611,11 @@ def get_base_units(units: Union[str, UnitRegistry.Unit]) -> Tuple[UnitRegistry.U
         additive offset, in that order.
 
     """
+    registry = _registry()
     if isinstance(units, str):
-        units = _REGISTRY.parse_units(units)
-    ratio, base_unit = _REGISTRY.get_base_units(units)
-    offset = _REGISTRY.Quantity(0, units).to(_REGISTRY.Quantity(0, base_unit)).magnitude
+        units = registry.parse_units(units)
+    ratio, base_unit = registry.get_base_units(units)
+    offset = registry.Quantity(0, units).to(registry.Quantity(0, base_unit)).magnitude
     return base_unit, float(ratio), offset
 
 
@@ -385,28 +629,107 @@ def change_definitions_file(filename: str = None):
         The file to use
 
     """
-    global _REGISTRY
-    convert_units.cache_clear()  # Units will change
-    parse_units.cache_clear()
-    get_base_units.cache_clear()
+    global _REGISTRY, _DEFINITIONS_FILE, _GENERATION
     if filename is None:
-        target = DEFAULT_FILE
+        target = _deploy_default_files()[0]
     else:
         target = Path(filename).expanduser().resolve(strict=True)
 
-    current_dir = Path.cwd()
-    try:
-        os.chdir(target.parent)
-        # Need to re-verify path because of some slippiness around tmp on macOS
-        updated = (Path.cwd() / target.name).resolve(strict=True)
-        _REGISTRY = _ScaleFactorRegistry(filename=updated,
-                                         preprocessors=[_scientific_notation_preprocessor,
-                                                        _scaling_preprocessor
-                                                        ],
-                                         autoconvert_offset_to_baseunit=True
-                                         )
-    finally:
-        os.chdir(current_dir)
-
-
-change_definitions_file()  # initialize to default
+    with _REGISTRY_LOCK:
+        current_dir = Path.cwd()
+        try:
+            os.chdir(target.parent)
+            # Need to re-verify path because of some slippiness around tmp on macOS
+            updated = (Path.cwd() / target.name).resolve(strict=True)
+            pickle_folder = _pickle_folder()
+            try:
+                registry = _build_registry(updated, pickle_folder)
+            except Exception:
+                if pickle_folder is None:
+                    raise
+                # The cache may be partially written or corrupt, so try again without it
+                registry = _build_registry(updated, None)
+                for stale in pickle_folder.glob("*.pickle"):
+                    stale.unlink(missing_ok=True)
+        finally:
+            os.chdir(current_dir)
+
+        _REGISTRY = registry
+        _DEFINITIONS_FILE = None if filename is None else target
+        _SCALING_DEFINITIONS.clear()
+        # Units have changed; results for the old registry are keyed on the old generation
+        _GENERATION += 1
+        _conversion_factor.cache_clear()
+        parse_units.cache_clear()
+        get_base_units.cache_clear()
+
+
+def _build_registry(filename: Path, cache_folder: Optional[Path]) -> _ScaleFactorRegistry:
+    """Build a registry from a definitions file, using Pint's on-disk cache if there is one."""
+    return _ScaleFactorRegistry(filename=filename,
+                                preprocessors=[_scientific_notation_preprocessor,
+                                               _scaling_preprocessor
+                                               ],
+                                autoconvert_offset_to_baseunit=True,
+                                cache_folder=cache_folder
+                                )
+
+
+class UnitsSnapshot(NamedTuple):
+    """
+    The state of the unit registry, as returned by :func:`snapshot_units`.
+
+    It holds only strings, so it is cheap to pickle and send to another process.
+    """
+
+    filename: Optional[str]
+    """The definitions file, or None for the default file."""
+    scaling_definitions: Tuple[str, ...]
+    """The definitions of the scaling-factor units created while parsing, in order."""
+
+
+def snapshot_units() -> UnitsSnapshot:
+    """
+    Capture the state of the unit registry, so that it can be restored in another process.
+
+    The state includes the units that were defined on the fly for scaling factors (e.g.,
+    ``g / 2.5 cm``), so that a process which restores it resolves exactly the same units.
+    A typical use is to initialize the workers of a process pool:
+    ``ProcessPoolExecutor(initializer=restore_units, initargs=(snapshot_units(),))``.
+
+    Returns
+    -------
+    UnitsSnapshot
+        The definitions file in use and the scaling-factor units defined so far
+
+    """
+    with _REGISTRY_LOCK:
+        return UnitsSnapshot(
+            filename=None if _DEFINITIONS_FILE is None else str(_DEFINITIONS_FILE),
+            scaling_definitions=tuple(_SCALING_DEFINITIONS)
+        )
+
+
+def restore_units(snapshot: UnitsSnapshot):
+    """
+    Restore the state of the unit registry from a snapshot taken by :func:`snapshot_units`.
+
+    The registry is only rebuilt if it uses a different definitions file than the snapshot
+    (or has not been built yet), in which case the parsed definitions are usually loaded from
+    the on-disk cache.  Scaling-factor units that are missing are then defined directly,
+    without parsing any unit strings.
+
+    Parameters
+    ----------
+    snapshot: UnitsSnapshot
+        The state to restore
+
+    """
+    filename = None if snapshot.filename is None else Path(snapshot.filename)
+    with _REGISTRY_LOCK:
+        if "_REGISTRY" not in globals() or _DEFINITIONS_FILE != filename:
+            change_definitions_file(filename)
+        registry = _registry()
+        for definition in snapshot.scaling_definitions:
+            if definition.split("=", 1)[0].strip() not in registry:
+                _define_scaling(registry, definition)
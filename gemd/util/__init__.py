@@ -1,8 +1,8 @@
 # flake8: noqa
 from .impl import set_uuids, cached_isinstance, make_index, substitute_links, \
-    substitute_objects, flatten, recursive_foreach, recursive_flatmap, \
+    substitute_objects, flatten, recursive_foreach, recursive_flatmap, iter_entities, \
     writable_sort_order
 
 __all__ = ["set_uuids", "cached_isinstance", "make_index", "substitute_links",
            "substitute_objects", "flatten", "recursive_foreach", "recursive_flatmap",
-           "writable_sort_order"]
+           "iter_entities", "writable_sort_order"]
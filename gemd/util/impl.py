@@ -1,13 +1,16 @@
 """Utility functions."""
 import uuid
 import functools
+from enum import Enum
 from typing import Optional, Union, Type, Iterable, MutableSequence, List, Tuple, Mapping, \
-    Callable, Any, Reversible, ByteString
+    Callable, Any, Reversible, ByteString, Dict, Generator, FrozenSet, Iterator, NamedTuple
 
 from gemd.entity.base_entity import BaseEntity
 from gemd.entity.dict_serializable import DictSerializable
 from gemd.entity.link_by_uid import LinkByUID
 
+_SCALARS = frozenset([str, bytes, int, float, bool, type(None)])
+
 
 def set_uuids(obj, scope):
     """
@@ -85,15 +88,124 @@ def _cached_issubclass(
     return issubclass(cls, class_or_tuple)
 
 
+_PENDING = object()  # Marker for a trampoline step that cannot be short-circuited
+
+
+def _trampoline(step: Callable[[Any], Generator[Any, Any, Any]],
+                root: Any,
+                shortcut: Callable[[Any], Any] = None) -> Any:
+    """
+    Evaluate a recursive algorithm with an explicit stack instead of the call stack.
+
+    The algorithm is written as a generator function `step`.  Wherever it would recurse on
+    some argument, it instead yields that argument and receives the result of the recursive
+    evaluation back from the yield; it returns its own result.  Since the pending evaluations
+    are kept in a list rather than in Python frames, arbitrarily deep structures can be
+    processed without reaching the recursion limit.  Exceptions propagate up through the
+    pending evaluations exactly as they would through recursive calls.
+
+    Parameters
+    ----------
+    step: Callable[[Any], Generator]
+        The generator function that implements one level of the algorithm.
+    root: Any
+        The argument to start the evaluation from.
+    shortcut: Callable[[Any], Any], optional
+        A function that returns the result for a trivial argument directly, or `_PENDING`
+        if `step` must be invoked; this avoids creating generators for leaves.
+
+    Returns
+    -------
+    Any
+        The result of `step(root)`.
+
+    """
+    stack = [step(root)]
+    value = None
+    error = None
+    while True:
+        try:
+            if error is None:
+                arg = stack[-1].send(value)
+            else:
+                error, arg = None, stack[-1].throw(error)
+        except StopIteration as done:
+            stack.pop()
+            value = done.value
+            if not stack:
+                return value
+            continue
+        except BaseException as exc:
+            stack.pop()
+            if not stack:
+                raise
+            error = exc
+            continue
+
+        value = _PENDING if shortcut is None else shortcut(arg)
+        if value is _PENDING:
+            stack.append(step(arg))
+            value = None
+
+
+class _VisitedIndex(object):
+    """
+    The record of objects that a substitution has already processed, and their results.
+
+    With the ``"hash"`` strategy, hashable objects are looked up by hash and equality, which
+    shares results between equal objects; unhashable objects are tracked by identity only if
+    `id_fallback` is set, and are otherwise processed every time they are encountered.  With
+    the ``"id"`` strategy, every object is tracked by identity, which also covers unhashable
+    objects (including tuples that contain them) and avoids calls to `__hash__` and `__eq__`.
+    Scalars are never tracked.
+    """
+
+    STRATEGIES = ("hash", "id")
+
+    def __init__(self, strategy: str = "hash", *, id_fallback: bool = False):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unrecognized visited strategy {strategy}; "
+                             f"valid choices are {list(self.STRATEGIES)}")
+        self._by_id = strategy == "id"
+        self._id_fallback = id_fallback
+        self._results = {}
+
+    def key(self, obj: Any) -> Any:
+        """Return the key to record `obj` under, or None if it should not be recorded."""
+        if type(obj) in _SCALARS:
+            return None
+        elif self._by_id:
+            return id(obj)
+        elif obj.__hash__ is not None:
+            return obj
+        elif self._id_fallback and cached_isinstance(obj, Iterable):
+            return id(obj)
+        else:
+            return None
+
+    def __contains__(self, key: Any) -> bool:
+        return key is not None and key in self._results
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._results[key][1]
+
+    def record(self, key: Any, obj: Any, result: Any):
+        """Record the `result` for `obj`, keeping `obj` alive so its id remains unique."""
+        if key is not None:
+            self._results[key] = (obj, result)
+
+
 def _substitute(thing: Any,
                 sub: Callable[[object], object],
                 applies: Callable[[object], bool],
-                visited: Mapping[object, object] = None) -> object:
+                *,
+                visited_strategy: str = "hash") -> object:
     """
     Generic recursive substitute function.
 
     Generates a new instance of thing by traversing its contents recursively, substituting
-    values for which the sub function applies.
+    values for which the sub function applies.  The traversal uses an explicit stack, so
+    arbitrarily deep structures are supported.
 
     Parameters
     ----------
@@ -103,49 +215,69 @@ def _substitute(thing: Any,
         Function which provides substitute for value; should not have side effects.
     applies: Callable[[object], bool]
         Function which defines the domain for the sub function to be invoked.
+    visited_strategy: str
+        How to recognize objects that have already been substituted: "hash" or "id".
+        See :class:`_VisitedIndex`.
 
     """
-    if visited is None:
-        visited = {}
-    if thing.__hash__ is not None and thing in visited:
-        return visited[thing]
+    visited = _VisitedIndex(visited_strategy)
 
-    if applies(thing):
-        replacement = sub(thing)
-        if thing.__hash__ is not None:
-            visited[thing] = replacement
-    else:
-        replacement = thing
-
-    if cached_isinstance(replacement, MutableSequence):
-        new = [_substitute(x, sub, applies, visited) for x in replacement]
-    elif cached_isinstance(replacement, Tuple):
-        new = tuple(_substitute(x, sub, applies, visited) for x in replacement)
-    elif cached_isinstance(replacement, Mapping):
-        new = {_substitute(k, sub, applies, visited): _substitute(v, sub, applies, visited)
-               for k, v in replacement.items()}
-    elif cached_isinstance(replacement, DictSerializable):
-        new_attrs = {_substitute(k, sub, applies, visited): _substitute(v, sub, applies, visited)
-                     for k, v in replacement.as_dict().items()}
-        new = replacement.build(new_attrs)
-    else:
-        new = replacement
+    def _step(this: Any) -> Generator[Any, Any, Any]:
+        key = visited.key(this)
+        if key in visited:
+            return visited[key]
 
-    if thing.__hash__ is not None:
-        visited[thing] = new
+        if applies(this):
+            replacement = sub(this)
+            visited.record(key, this, replacement)
+        else:
+            replacement = this
+
+        if cached_isinstance(replacement, MutableSequence):
+            new = []
+            for x in replacement:
+                new.append((yield x))
+        elif cached_isinstance(replacement, Tuple):
+            new = []
+            for x in replacement:
+                new.append((yield x))
+            new = tuple(new)
+        elif cached_isinstance(replacement, (Mapping, DictSerializable)):
+            if cached_isinstance(replacement, DictSerializable):
+                items = replacement.as_dict().items()
+            else:
+                items = replacement.items()
+            new = {}
+            for k, v in items:
+                new_k = yield k
+                new[new_k] = yield v
+            if cached_isinstance(replacement, DictSerializable):
+                new = DictSerializable._build_native(new, copy=False)
+        else:
+            new = replacement
 
-    return new
+        visited.record(key, this, new)
+        return new
+
+    def _shortcut(this: Any) -> Any:
+        if type(this) in _SCALARS and not applies(this):
+            return this  # Nothing to substitute and nothing to copy
+        return _PENDING
+
+    return _trampoline(_step, thing, _shortcut)
 
 
 def _substitute_inplace(thing: Any,
                         sub: Callable[[object], object],
                         applies: Callable[[object], bool],
-                        visited: Mapping[object, object] = None) -> object:
+                        *,
+                        visited_strategy: str = "hash") -> object:
     """
     Generic recursive in-place substitute function.
 
     Iteratively crawls the passed structure, substituting elements with sub(element) when
-    applies(element) is true and the element is mutable.
+    applies(element) is true and the element is mutable.  The traversal uses an explicit
+    stack, so arbitrarily deep structures are supported.
 
     Parameters
     ----------
@@ -155,56 +287,59 @@ def _substitute_inplace(thing: Any,
         Function which provides substitute for value; should not have side effects.
     applies: Callable[[object], bool]
         Function which defines the domain for the sub function to be invoked.
+    visited_strategy: str
+        How to recognize objects that have already been visited: "hash" or "id".
+        See :class:`_VisitedIndex`; unhashable containers are always tracked by identity.
 
     """
-    def _key(obj):
-        if cached_isinstance(obj, (float, int, str)):
-            return None
-        elif obj.__hash__ is not None:
-            return obj
-        elif cached_isinstance(obj, Iterable) and not cached_isinstance(obj, ByteString):
-            return id(obj)
-        else:
-            return None  # pragma: no cover  Fallback for caution's sake
-
-    orig_key = _key(thing)
-    if visited is None:
-        visited = {}
-    if orig_key is not None and orig_key in visited:
-        return visited[orig_key]
-
-    if applies(thing):
-        thing = sub(thing)
-    if orig_key is not None:
-        visited[orig_key] = thing  # Store before we start recursing
-
-    if cached_isinstance(thing, MutableSequence):  # Change list in place
-        for i, x in enumerate(thing):
-            thing[i] = _substitute_inplace(x, sub, applies, visited)
-    elif cached_isinstance(thing, Tuple):  # Tuples are immutable; regenerate
-        thing = tuple(_substitute_inplace(x, sub, applies, visited) for x in thing)
-        visited[orig_key] = thing  # We mutated it
-    elif cached_isinstance(thing, Mapping):  # Change dict in place, both keys & values
-        remove = set()  # Store todos because can't mutate a dict in a loop
-        update = dict()
-        for k, v in thing.items():
-            new_k = _substitute_inplace(k, sub, applies, visited)
-            new_v = _substitute_inplace(v, sub, applies, visited)
-            if id(k) != id(new_k):
-                remove.add(k)
-                update[new_k] = v
-            if id(v) != id(new_v):
-                update[new_k] = new_v
-        for k in remove:
-            thing.pop(k, None)
-        thing.update(update)
-    elif cached_isinstance(thing, DictSerializable):
-        for k, v in thing.as_dict().items():  # Assume key can't change b/c it's an attribute
-            new_v = _substitute_inplace(v, sub, applies, visited)
-            if id(v) != id(new_v):
-                _setter_by_attribute(type(thing), k)(thing, new_v)
-
-    return thing
+    visited = _VisitedIndex(visited_strategy, id_fallback=True)
+
+    def _step(this: Any) -> Generator[Any, Any, Any]:
+        orig, orig_key = this, visited.key(this)
+        if orig_key in visited:
+            return visited[orig_key]
+
+        if applies(this):
+            this = sub(this)
+        visited.record(orig_key, orig, this)  # Store before we start recursing
+
+        if cached_isinstance(this, MutableSequence):  # Change list in place
+            for i, x in enumerate(this):
+                this[i] = yield x
+        elif cached_isinstance(this, Tuple):  # Tuples are immutable; regenerate
+            new = []
+            for x in this:
+                new.append((yield x))
+            this = tuple(new)
+            visited.record(orig_key, orig, this)  # We mutated it
+        elif cached_isinstance(this, Mapping):  # Change dict in place, both keys & values
+            remove = set()  # Store todos because can't mutate a dict in a loop
+            update = dict()
+            for k, v in list(this.items()):
+                new_k = yield k
+                new_v = yield v
+                if id(k) != id(new_k):
+                    remove.add(k)
+                    update[new_k] = v
+                if id(v) != id(new_v):
+                    update[new_k] = new_v
+            for k in remove:
+                this.pop(k, None)
+            this.update(update)
+        elif cached_isinstance(this, DictSerializable):
+            for k, v in this.as_dict().items():  # Assume key can't change b/c it's an attribute
+                new_v = yield v
+                if id(v) != id(new_v):
+                    _setter_by_attribute(type(this), k)(this, new_v)
+
+        return this
+
+    def _shortcut(this: Any) -> Any:
+        if type(this) in _SCALARS and not applies(this):
+            return this
+        return _PENDING
+
+    return _trampoline(_step, thing, _shortcut)
 
 
 @functools.lru_cache(maxsize=1024)
@@ -271,7 +406,8 @@ def substitute_links(obj: Any,
                      scope: Optional[str] = None,
                      *,
                      allow_fallback: bool = True,
-                     inplace: bool = False
+                     inplace: bool = False,
+                     visited_strategy: str = "hash"
                      ):
     """
     Recursively replace pointers to BaseEntity with LinkByUID objects.
@@ -289,6 +425,10 @@ def substitute_links(obj: Any,
         whether to grab another scope/id if chosen scope is missing (Default: True).
     inplace: bool, optional
         whether to replace objects in place, as opposed to returning a copy (Default: False).
+    visited_strategy: str, optional
+        how to recognize objects that have already been visited: "hash" to compare hashable
+        objects by equality, or "id" to compare all objects, including unhashable ones, by
+        identity (Default: "hash").
 
     """
     if inplace:
@@ -298,13 +438,15 @@ def substitute_links(obj: Any,
 
     return method(obj,
                   sub=lambda o: o.to_link(scope=scope, allow_fallback=allow_fallback),
-                  applies=lambda o: o is not obj and cached_isinstance(o, BaseEntity))
+                  applies=_other_entity_test(obj),
+                  visited_strategy=visited_strategy)
 
 
 def substitute_objects(obj,
                        index,
                        *,
-                       inplace: bool = False):
+                       inplace: bool = False,
+                       visited_strategy: str = "hash"):
     """
     Recursively replace LinkByUID objects with pointers to the objects with that UID in the index.
 
@@ -319,6 +461,10 @@ def substitute_objects(obj,
         containing the objects that the uids point to
     inplace: bool, optional
         whether to replace objects in place, as opposed to returning a copy (Default: False).
+    visited_strategy: str, optional
+        how to recognize objects that have already been visited: "hash" to compare hashable
+        objects by equality, or "id" to compare all objects, including unhashable ones, by
+        identity (Default: "hash").
 
     """
     if inplace:
@@ -328,7 +474,8 @@ def substitute_objects(obj,
 
     return method(obj,
                   sub=lambda link: index.get(link, link),
-                  applies=lambda o: cached_isinstance(o, LinkByUID))
+                  applies=lambda o: cached_isinstance(o, LinkByUID),
+                  visited_strategy=visited_strategy)
 
 
 def flatten(obj, scope=None) -> List[BaseEntity]:
@@ -359,33 +506,160 @@ def flatten(obj, scope=None) -> List[BaseEntity]:
         a list of BaseEntity with LinkByUIDs to any BaseEntity members
 
     """
-    # The ids should be set in the actual object so they are consistent
-    if scope is not None:
-        set_uuids(obj, scope)
+    return _flatten_entities(obj, scope, substitute=True)
+
+
+def _flatten_entities(obj, scope=None, *, substitute: bool = False) -> List[BaseEntity]:
+    """
+    Collect the unique BaseEntities reachable from obj, in writable sort order.
+
+    This is the engine behind :func:`flatten`.  A single traversal of the graph assigns uids,
+    drops entities whose uids have already been seen, optionally link-substitutes each new
+    entity and files it under its :func:`writable_sort_order` rank, so the cost is linear in
+    the size of the graph.  Without `substitute`, the entities are returned as-is (with uids
+    assigned if `scope` was passed) so that callers can substitute them one at a time.
+
+    Parameters
+    ----------
+    obj: Any
+        the object where the graph traversal starts
+    scope: str, optional
+        the scope of the autogenerated ids.
+        If omitted, encountering a BaseEntity without an UIDs is fatal.
+    substitute: bool, optional
+        whether to return link-substituted copies of the entities (Default: False)
+
+    Returns
+    -------
+    List[BaseEntity]
+        a list of the unique BaseEntity objects, sorted by :func:`writable_sort_order`
+
+    """
+    ranks = _writable_ranks()
+    by_rank = [[] for _ in range(max(ranks.values()) + 1)]
+
+    def _ensure_uid(entity: BaseEntity):
+        # The ids should be set in the actual object so they are consistent
+        if len(entity.uids) == 0:
+            if scope is None:
+                raise ValueError(f"No UID for {entity}; pass `flatten` a `scope` to set one")
+            entity.add_uid(scope, str(uuid.uuid4()))
+
+    def _link(entity: BaseEntity) -> LinkByUID:
+        _ensure_uid(entity)  # Links may be made before the traversal reaches the entity
+        return entity.to_link(allow_fallback=True)
 
     # list of uids that we've seen, to avoid returning duplicates
     known_uids = set()
+    seen = set()
+    queue = [obj]
+    while queue:
+        this = queue.pop()
+        if type(this) in _SCALARS:
+            continue  # Nothing to collect; also avoids walking strings character by character
+        if this.__hash__ is not None:
+            if this in seen:
+                continue
+            seen.add(this)
+
+        if cached_isinstance(this, BaseEntity):
+            _ensure_uid(this)
+            uids = list(this.uids.items())
+            # if none of the uids are known, then it's a new object and we should return it
+            if not any(uid in known_uids for uid in uids):
+                if this.typ not in ranks:
+                    raise ValueError("Unrecognized type string: {}".format(this.typ))
+                if substitute:
+                    entry = _substitute(this, sub=_link, applies=_other_entity_test(this))
+                else:
+                    entry = this
+                by_rank[ranks[this.typ]].append(entry)
+            # add all of the uids of this object into the known uid list
+            known_uids.update(uids)
+
+        if cached_isinstance(this, Mapping):
+            queue.extend(this.keys())
+            queue.extend(this.values())
+        elif cached_isinstance(this, DictSerializable):
+            fields = this.__dict__
+            queue.extend([fields[k] for k in _traversal_schema(this).ordered])
+        elif cached_isinstance(this, Reversible):
+            queue.extend(reversed(this))  # Preserve order of the list/tuple
+        elif cached_isinstance(this, Iterable):
+            queue.extend(this)  # No control over order
+
+    return [x for group in by_rank for x in group]
+
+
+def _other_entity_test(root: BaseEntity) -> Callable[[object], bool]:
+    """Generate a test for BaseEntities other than `root`, for link substitution."""
+    return lambda o: o is not root and cached_isinstance(o, BaseEntity)
+
+
+class _TraversalSchema(NamedTuple):
+    """The fields of a DictSerializable class that a graph traversal must descend into."""
+
+    fields: FrozenSet[str]  # The instance fields that the schema was compiled for
+    ordered: Tuple[str, ...]  # The fields to walk, sorted
+    writable: Tuple[str, ...]  # ordered, less the skipped fields of a BaseEntity
+
+
+_TRAVERSAL_SCHEMAS: Dict[type, _TraversalSchema] = {}
+
+
+def _traversal_schema(obj: DictSerializable) -> _TraversalSchema:
+    """
+    Look up the traversal schema for obj, compiling it the first time its class is seen.
+
+    Every field is walked, except that instances of classes that never contain a BaseEntity
+    or a LinkByUID (values, bounds, enums, file links and links themselves) have no fields to
+    walk.  Annotations are not consulted, since nothing enforces them: an entity stored in a
+    field annotated as a string must still be found.  Instead, the traversals drop primitive
+    values as they meet them.  As with
+    :func:`~gemd.entity.dict_serializable.DictSerializable.as_dict`, an instance with an
+    unexpected set of fields gets a freshly compiled schema.
+
+    Parameters
+    ----------
+    obj: DictSerializable
+        The object being traversed.
+
+    Returns
+    -------
+    _TraversalSchema
+        The schema for the fields of obj.
+
+    """
+    clazz = type(obj)
+    fields = obj.__dict__
+    schema = _TRAVERSAL_SCHEMAS.get(clazz)
+    if schema is None or fields.keys() != schema.fields:
+        if issubclass(clazz, _leaf_types()):
+            ordered = ()
+        else:
+            ordered = tuple(sorted(fields))
+        if issubclass(clazz, BaseEntity):
+            writable = tuple(k for k in ordered if k not in clazz.skip)
+        else:
+            writable = ordered
+        schema = _TraversalSchema(frozenset(fields), ordered, writable)
+        _TRAVERSAL_SCHEMAS[clazz] = schema
+    return schema
 
-    def _flatten(base_obj: BaseEntity):
-        nonlocal known_uids
-        to_return = []
-        # get all the uids of this object
-        uids = list(base_obj.uids.items())
-        if len(uids) == 0:
-            raise ValueError(f"No UID for {base_obj}; pass `flatten` a `scope` to set one")
 
-        # if none of the uids are known, then it's a new object and we should return it
-        if not any(uid in known_uids for uid in uids):
-            to_return = [base_obj]
+def _walkable(fields: Dict[str, Any], names: Iterable[str]) -> List[Any]:
+    """Collect the named fields, less primitives, which cannot contain entities or links."""
+    return [x for x in (fields[k] for k in names) if type(x) not in _SCALARS]
 
-        # add all of the uids of this object into the known uid list
-        for uid in uids:
-            known_uids.add(uid)
 
-        return to_return
+@functools.lru_cache(maxsize=None)
+def _leaf_types() -> Tuple[type, ...]:
+    """Classes whose instances never contain BaseEntities or links."""
+    from gemd.entity.bounds.base_bounds import BaseBounds
+    from gemd.entity.file_link import FileLink
+    from gemd.entity.value.base_value import BaseValue
 
-    res = recursive_flatmap(obj, _flatten, unidirectional=False)
-    return sorted([substitute_links(x) for x in res], key=lambda x: writable_sort_order(x))
+    return BaseBounds, BaseValue, Enum, FileLink, LinkByUID
 
 
 def recursive_foreach(obj: Union[Iterable, DictSerializable],
@@ -397,7 +671,8 @@ def recursive_foreach(obj: Union[Iterable, DictSerializable],
 
     Only :class:`BaseEntity` objects will have the function applied, but the recursion will walk
     through all objects.  For example, BaseEntity -> list -> BaseEntity will have func applied
-    to both base entities.
+    to both base entities.  Primitive fields of DictSerializable objects and values, bounds and
+    file links (see :func:`_traversal_schema`) are not walked.
 
     Parameters
     ----------
@@ -431,8 +706,7 @@ def recursive_foreach(obj: Union[Iterable, DictSerializable],
             queue.extend(this.keys())
             queue.extend(this.values())
         elif cached_isinstance(this, DictSerializable):
-            for k, x in this.__dict__.items():
-                queue.append(x)
+            queue.extend(_walkable(this.__dict__, _traversal_schema(this).ordered))
         elif cached_isinstance(this, Iterable) \
                 and not cached_isinstance(this, (str, ByteString)):
             for x in this:
@@ -453,7 +727,8 @@ def recursive_flatmap(obj: Union[Iterable, DictSerializable],
 
     Only :class:`BaseEntity` objects will have the function applied, but the recursion will walk
     through all objects.  For example, BaseEntity -> list -> BaseEntity will have func applied
-    to both base entities.
+    to both base entities.  Primitive fields of DictSerializable objects and values, bounds and
+    file links (see :func:`_traversal_schema`) are not walked.
 
     Parameters
     ----------
@@ -490,10 +765,10 @@ def recursive_flatmap(obj: Union[Iterable, DictSerializable],
             queue.extend(this.keys())
             queue.extend(this.values())
         elif cached_isinstance(this, DictSerializable):
-            for k, x in sorted(this.__dict__.items()):
-                if unidirectional and cached_isinstance(this, BaseEntity) and k in this.skip:
-                    continue
-                queue.append(x)
+            schema = _traversal_schema(this)
+            fields = this.__dict__
+            queue.extend(_walkable(fields, schema.writable if unidirectional
+                                   else schema.ordered))
         elif cached_isinstance(this, Reversible):
             queue.extend(reversed(this))  # Preserve order of the list/tuple
         elif cached_isinstance(this, Iterable) \
@@ -503,13 +778,101 @@ def recursive_flatmap(obj: Union[Iterable, DictSerializable],
     return res
 
 
-def writable_sort_order(key: Union[BaseEntity, str]) -> int:
-    """Sort order for flattening such that the objects can be read back and re-nested."""
+def iter_entities(obj: Union[Iterable, DictSerializable],
+                  *,
+                  unidirectional: bool = True,
+                  types: Union[Type, Tuple[Type, ...], None] = None,
+                  max_depth: Optional[int] = None) -> Iterator[BaseEntity]:
+    """
+    Lazily walk a graph, yielding each BaseEntity the first time it is found.
+
+    Entities are yielded in the same order as :func:`recursive_flatmap` applies its function,
+    and each one is yielded before its members are walked, so the consumer may stop early
+    without the rest of the graph being visited.
+
+    Parameters
+    ----------
+    obj: DictSerializable or Iterable[DictSerializable], or Iterable[...]
+        where the graph traversal starts
+    unidirectional: bool
+        only recurse through the writeable direction of bidirectional links (default: True)
+    types: type or Tuple[type], optional
+        only yield entities that are instances of these types; the walk still passes through
+        entities of other types
+    max_depth: int, optional
+        how many entities deep to walk.  Entities reachable from obj without passing through
+        another entity are at depth 0, their members at depth 1 and so on; members of entities
+        at `max_depth` are not walked.  Default: no limit
+
+    Yields
+    ------
+    BaseEntity
+        the entities reachable from obj
+
+    """
+    if max_depth is not None and max_depth < 0:
+        raise ValueError(f"max_depth must be non-negative, not {max_depth}")
+
+    seen = dict()  # The shallowest depth each hashable object was reached at
+    yielded = set()
+    queue = [(obj, 0)]
+
+    while queue:
+        this, depth = queue.pop()
+        if type(this) in _SCALARS:
+            continue  # Nothing to yield; also avoids walking strings character by character
+
+        if this.__hash__ is not None:
+            if this in seen and seen[this] <= depth:
+                continue
+            seen[this] = depth
+
+        if cached_isinstance(this, BaseEntity):
+            if this not in yielded:
+                yielded.add(this)
+                if types is None or cached_isinstance(this, types):
+                    yield this
+            if max_depth is not None:
+                if depth >= max_depth:
+                    continue
+                depth += 1
+
+        if cached_isinstance(this, Mapping):
+            queue.extend([(x, depth) for x in this.keys()])
+            queue.extend([(x, depth) for x in this.values()])
+        elif cached_isinstance(this, DictSerializable):
+            schema = _traversal_schema(this)
+            fields = this.__dict__
+            queue.extend([(fields[k], depth) for k in (schema.writable if unidirectional
+                                                       else schema.ordered)])
+        elif cached_isinstance(this, Reversible):
+            queue.extend([(x, depth) for x in reversed(this)])  # Preserve order of the list/tuple
+        elif cached_isinstance(this, Iterable) \
+                and not cached_isinstance(this, (str, ByteString)):
+            queue.extend([(x, depth) for x in this])  # No control over order
+
+
+@functools.lru_cache(maxsize=None)
+def _writable_ranks() -> Dict[str, int]:
+    """Map each flattenable type string to its :func:`writable_sort_order` rank."""
     from gemd.entity.object import MeasurementSpec, ProcessSpec, MaterialSpec, IngredientSpec, \
         MeasurementRun, IngredientRun, MaterialRun, ProcessRun
     from gemd.entity.template import ConditionTemplate, MaterialTemplate, MeasurementTemplate, \
         ParameterTemplate, ProcessTemplate, PropertyTemplate
 
+    ordering = [
+        [ConditionTemplate, ParameterTemplate, PropertyTemplate],
+        [MaterialTemplate, ProcessTemplate, MeasurementTemplate],
+        [ProcessSpec, MeasurementSpec],
+        [ProcessRun, MaterialSpec],
+        [IngredientSpec, MaterialRun],
+        [IngredientRun, MeasurementRun],
+    ]
+    return {clazz.typ: rank for rank, group in enumerate(ordering) for clazz in group}
+
+
+def writable_sort_order(key: Union[BaseEntity, str]) -> int:
+    """Sort order for flattening such that the objects can be read back and re-nested."""
     if cached_isinstance(key, BaseEntity):
         typ = key.typ
     elif cached_isinstance(key, str):
@@ -517,17 +880,7 @@ def writable_sort_order(key: Union[BaseEntity, str]) -> int:
     else:
         raise ValueError("Can ony sort BaseEntities and type strings, not {}".format(key))
 
-    if typ in [ConditionTemplate.typ, ParameterTemplate.typ, PropertyTemplate.typ]:
-        return 0
-    if typ in [MaterialTemplate.typ, ProcessTemplate.typ, MeasurementTemplate.typ]:
-        return 1
-    if typ in [ProcessSpec.typ, MeasurementSpec.typ]:
-        return 2
-    if typ in [ProcessRun.typ, MaterialSpec.typ]:
-        return 3
-    if typ in [IngredientSpec.typ, MaterialRun.typ]:
-        return 4
-    if typ in [IngredientRun.typ, MeasurementRun.typ]:
-        return 5
-
-    raise ValueError("Unrecognized type string: {}".format(typ))
+    rank = _writable_ranks().get(typ)
+    if rank is None:
+        raise ValueError("Unrecognized type string: {}".format(typ))
+    return rank
@@ -0,0 +1,4 @@
+# flake8: noqa
+from .impl import ValidationSummary, ValidationReport, validate_graph
+
+__all__ = ["ValidationSummary", "ValidationReport", "validate_graph"]
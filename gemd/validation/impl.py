@@ -0,0 +1,171 @@
+"""Validate whole graphs of gemd objects at once."""
+from typing import Any, Iterable, List, NamedTuple, Tuple, Union
+
+from gemd.entity.attribute.base_attribute import BaseAttribute
+from gemd.entity.attribute.property_and_conditions import PropertyAndConditions
+from gemd.entity.base_entity import BaseEntity
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object.has_quantities import HasQuantities
+from gemd.entity.object.has_template_check_generator import HasTemplateCheckGenerator
+from gemd.entity.template.attribute_template import AttributeTemplate
+from gemd.entity.template.base_template import BaseTemplate
+from gemd.util.impl import iter_entities
+
+__all__ = ["ValidationSummary", "ValidationReport", "validate_graph"]
+
+
+class ValidationSummary(NamedTuple):
+    """The outcome of checking every value in a graph that is subject to one constraint."""
+
+    subject: Union[AttributeTemplate, BaseTemplate, str]
+    """The template whose bounds were checked, or the name of the quantity."""
+    checked: int
+    """How many values were checked."""
+    failed: int
+    """How many values were out of bounds."""
+    samples: List[Union[LinkByUID, BaseEntity]]
+    """Some of the objects with values out of bounds, as links if they have uids."""
+
+
+class ValidationReport(NamedTuple):
+    """The outcome of :func:`validate_graph`."""
+
+    entities: int
+    """How many entities were walked."""
+    attribute_templates: List[ValidationSummary]
+    """Attribute values checked against the bounds of their own attribute templates."""
+    object_templates: List[ValidationSummary]
+    """Attribute values checked against the bounds set by their objects' templates."""
+    quantities: List[ValidationSummary]
+    """Ingredient fractions and absolute quantities checked against their limits."""
+
+    @property
+    def failed(self) -> int:
+        """The total number of values that were out of bounds."""
+        return sum(summary.failed for summary in self._summaries())
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether every value was in bounds."""
+        return self.failed == 0
+
+    def _summaries(self) -> Iterable[ValidationSummary]:
+        yield from self.attribute_templates
+        yield from self.object_templates
+        yield from self.quantities
+
+    def __str__(self):
+        lines = [f"{self.failed} values out of bounds in {self.entities} entities"]
+        for summary in self._summaries():
+            if summary.failed > 0:
+                subject = summary.subject
+                if not isinstance(subject, str):
+                    subject = f"{type(subject).__name__} {subject.name!r}"
+                lines.append(f"{subject}: {summary.failed} of {summary.checked} "
+                             f"(e.g. {', '.join(map(_describe, summary.samples))})")
+        return "\n".join(lines)
+
+
+def validate_graph(obj: Any, *, max_samples: int = 5) -> ValidationReport:
+    """
+    Check every value in a graph against its bounds, and summarize the violations.
+
+    The whole graph is walked once, following links in both directions, as by
+    :func:`~gemd.util.iter_entities`.  Its attribute values are grouped by the template that
+    bounds them and checked as by :func:`~gemd.entity.bounds_validation.deferred_validation`,
+    so that problems are counted rather than logged one at a time.  Three kinds of checks are
+    made:
+
+    * each attribute's value against the bounds of its attribute template;
+    * each attribute's value against the bounds that its object's template sets for it;
+    * each ingredient's fractions (between 0 and 1) and absolute quantity (positive, and not
+      dimensionless).
+
+    Templates that are only referenced by a :class:`~gemd.entity.link_by_uid.LinkByUID` cannot
+    be checked, and are skipped.  The validation level does not apply: nothing is logged or
+    raised, whatever the problems.
+
+    Parameters
+    ----------
+    obj: DictSerializable or Iterable[DictSerializable]
+        where the graph traversal starts
+    max_samples: int
+        how many offending objects to keep as samples for each template or quantity
+
+    Returns
+    -------
+    ValidationReport
+        A summary of the checks, per template and per kind of quantity
+
+    """
+    attributes = []
+    checks = []
+    quantities = []
+    entities = 0
+    for entity in iter_entities(obj, unidirectional=False):
+        entities += 1
+        if isinstance(entity, HasTemplateCheckGenerator):
+            for validate, members in entity._template_checks():
+                checks.append((entity, validate))
+                attributes.extend((entity, x) for x in _attributes(members))
+        if isinstance(entity, HasQuantities):
+            quantities.append(entity)
+
+    attribute_summaries = [_summarize(template, pairs, passed, max_samples)
+                           for template, pairs, passed in BaseAttribute._check_groups(attributes)]
+
+    by_object_template = {}  # A template may constrain several kinds of attribute
+    for template, pairs, passed in HasTemplateCheckGenerator._check_groups(checks):
+        merged = by_object_template.setdefault(id(template), (template, [], []))
+        merged[1].extend(pairs)
+        merged[2].extend(passed)
+    object_summaries = [_summarize(template, pairs, passed, max_samples)
+                        for template, pairs, passed in by_object_template.values()]
+
+    quantity_summaries = [_summarize(name, pairs, passed, max_samples)
+                          for name, pairs, passed in HasQuantities._check_groups(quantities)]
+
+    return ValidationReport(entities=entities,
+                            attribute_templates=attribute_summaries,
+                            object_templates=object_summaries,
+                            quantities=quantity_summaries)
+
+
+def _attributes(members: Iterable[Any]) -> Iterable[BaseAttribute]:
+    """Every attribute in a list of them, including those within property-and-conditions."""
+    for member in members:
+        if isinstance(member, PropertyAndConditions):
+            yield member.property
+            yield from member.conditions
+        else:
+            yield member
+
+
+def _summarize(subject: Union[AttributeTemplate, BaseTemplate, str],
+               pairs: List[Tuple[BaseEntity, Any]],
+               passed: List[bool],
+               max_samples: int) -> ValidationSummary:
+    """Count the failures of one group of checks and sample the objects that failed."""
+    failures = [owner for (owner, _), ok in zip(pairs, passed) if not ok]
+    samples = []
+    for owner in failures:
+        if len(samples) >= max_samples:
+            break
+        sample = _sample(owner)
+        if sample not in samples:
+            samples.append(sample)
+    return ValidationSummary(subject=subject, checked=len(passed), failed=len(failures),
+                             samples=samples)
+
+
+def _sample(entity: BaseEntity) -> Union[LinkByUID, BaseEntity]:
+    """Refer to an entity by its first uid, if it has one."""
+    for scope, uid in entity.uids.items():
+        return LinkByUID(scope=scope, id=uid)
+    return entity
+
+
+def _describe(sample: Union[LinkByUID, BaseEntity]) -> str:
+    if isinstance(sample, LinkByUID):
+        return f"{sample.scope}:{sample.id}"
+    return f"{type(sample).__name__} {sample.name!r}"
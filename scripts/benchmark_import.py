@@ -0,0 +1,43 @@
+#!python
+"""Time how long it takes to import gemd in a fresh interpreter."""
+import argparse
+from statistics import median
+import subprocess
+import sys
+
+MODULES = ("gemd", "gemd.json")
+TIMER = "import time; start = time.perf_counter(); import {}; print(time.perf_counter() - start)"
+
+
+def time_import(module: str, repeat: int) -> list:
+    """Import `module` in `repeat` fresh interpreters, returning the times in seconds."""
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", TIMER.format(module)],
+                                check=True, capture_output=True, text=True)
+        times.append(float(result.stdout))
+    return times
+
+
+def main():
+    """Time each module, optionally failing if it is slower than a threshold."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="Number of fresh interpreters to time each import in")
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="Fail if the median import time of any module exceeds this")
+    args = parser.parse_args()
+
+    code = 0
+    for module in MODULES:
+        times = time_import(module, args.repeat)
+        print(f"import {module}: median {median(times) * 1000:.0f} ms, "
+              f"best {min(times) * 1000:.0f} ms over {args.repeat} runs")
+        if args.max_seconds is not None and median(times) > args.max_seconds:
+            print(f"import {module} exceeded {args.max_seconds} s")
+            code = 1
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
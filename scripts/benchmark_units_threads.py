@@ -0,0 +1,74 @@
+#!python
+"""Parse many unit strings concurrently from many threads, and check the results."""
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
+import time
+
+from gemd.units import parse_units, convert_units, snapshot_units
+
+COMMON_UNITS = ["m", "cm", "kg", "g / cm^3", "degC", "K", "J / mol / K", "N * m", "Pa", "mL"]
+
+
+def unit_strings(distinct: int) -> list:
+    """Unit strings with `distinct` different scaling factors, plus common units."""
+    scaled = []
+    for i in range(distinct):
+        factor = f"{i / 4 + 1.25:g}"
+        scaled.extend([f"g / {factor} cm", f"mol / {factor} L"])
+    return scaled + COMMON_UNITS * (len(scaled) // len(COMMON_UNITS))
+
+
+def hammer(strings: list, threads: int, rounds: int) -> tuple:
+    """Parse & convert every string in every thread, started together; return results and time."""
+    barrier = threading.Barrier(threads)
+
+    def work(offset):
+        barrier.wait()
+        # Each thread walks the strings from a different starting point
+        ordered = strings[offset:] + strings[:offset]
+        for _ in range(rounds):
+            parsed = {units: parse_units(units) for units in ordered}
+            for units in ordered:
+                convert_units(1.0, units, parsed[units])
+        return parsed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results = list(pool.map(work, [i * len(strings) // threads for i in range(threads)]))
+    return results, time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark, exiting with an error if any thread saw an inconsistent result."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--distinct", type=int, default=500,
+                        help="Number of different scaling factors to parse")
+    parser.add_argument("--rounds", type=int, default=5,
+                        help="Number of times each thread parses every string")
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    strings = unit_strings(args.distinct)
+    calls = len(strings) * args.threads * args.rounds
+
+    results, cold = hammer(strings, args.threads, args.rounds)
+    print(f"cold: {calls} parses in {cold:.2f} s ({calls / cold:,.0f} per second)")
+    _, warm = hammer(strings, args.threads, args.rounds)
+    print(f"warm: {calls} parses in {warm:.2f} s ({calls / warm:,.0f} per second)")
+
+    parse_units.cache_clear()
+    expected = {units: parse_units(units) for units in strings}
+    errors = sum(result != expected for result in results)
+    definitions = snapshot_units().scaling_definitions
+    duplicates = len(definitions) - len(set(definitions))
+    print(f"{errors} threads saw inconsistent results; "
+          f"{duplicates} of {len(definitions)} scaled units were defined more than once")
+    return 1 if errors or duplicates else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
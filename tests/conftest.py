@@ -0,0 +1,15 @@
+"""Fixtures shared by all tests."""
+import pytest
+
+import gemd.units.impl
+
+
+@pytest.fixture(autouse=True, scope="session")
+def units_cache(tmp_path_factory):
+    """Keep the parsed unit definitions that tests cache out of the user's own folders."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        folder = tmp_path_factory.mktemp("units_cache")
+        monkeypatch.setenv(gemd.units.impl.CACHE_ENVIRONMENT_VARIABLE, str(folder))
+        gemd.units.impl._cache_folder.cache_clear()
+        yield folder
+    gemd.units.impl._cache_folder.cache_clear()
@@ -0,0 +1,123 @@
+"""Tests of the containment checks shared by all bounds."""
+import pytest
+
+from gemd.entity.bounds import CategoricalBounds, CompositionBounds, IntegerBounds, \
+    RealBounds, ContainmentCacheInfo, memoized_containment
+from gemd.entity.bounds.base_bounds import _deep_fingerprint
+from gemd.entity.value import DiscreteCategorical, NominalCategorical, NominalComposition, \
+    NominalInteger, NominalReal, UniformInteger, UniformReal
+
+
+def test_memoized_containment():
+    """Equal values share one result, and nothing is remembered outside the context."""
+    bounds = RealBounds(0, 100, "degC")
+    with memoized_containment(maxsize=8) as memo:
+        assert memo.cache_info() == ContainmentCacheInfo(hits=0, misses=0, maxsize=8, currsize=0)
+        assert all(bounds.contains(NominalReal(25, "degC")) for _ in range(10))
+        assert not any(bounds.contains(NominalReal(500, "K")) for _ in range(10))
+        assert memo.cache_info() == ContainmentCacheInfo(hits=18, misses=2, maxsize=8, currsize=2)
+
+        with memoized_containment(maxsize=1) as inner:
+            assert inner is memo  # Nested contexts share the outermost memo
+            assert bounds.contains(NominalReal(25, "degC"))
+        assert memo.cache_info().hits == 19
+
+    bounds.contains(NominalReal(25, "degC"))
+    assert memo.cache_info().hits == 19
+
+    with pytest.raises(ValueError):
+        with memoized_containment(maxsize=0):
+            pass  # pragma: no cover
+
+
+def test_memoized_containment_mutation():
+    """Mutating either the bounds or the value is never answered from the old contents."""
+    bounds = RealBounds(0, 10, "degC")
+    value = NominalReal(20, "degC")
+    categories = CategoricalBounds(["a", "b"])
+    with memoized_containment() as memo:
+        assert not bounds.contains(value)
+        bounds.update(RealBounds(0, 30, "degC"))
+        assert bounds.contains(value)
+        value.nominal = 50
+        assert not bounds.contains(value)
+
+        assert not categories.contains(NominalCategorical("c"))
+        categories.update(NominalCategorical("c"))
+        assert categories.contains(NominalCategorical("c"))
+        assert memo.cache_info().hits == 0
+
+
+def test_memoized_containment_eviction():
+    """The least recently used results are dropped first."""
+    bounds = RealBounds(0, 100, "m")
+    with memoized_containment(maxsize=2) as memo:
+        bounds.contains(NominalReal(1, "m"))
+        bounds.contains(NominalReal(2, "m"))
+        bounds.contains(NominalReal(1, "m"))  # So 2 m is now the least recently used
+        bounds.contains(NominalReal(3, "m"))
+        assert memo.cache_info() == ContainmentCacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+        bounds.contains(NominalReal(1, "m"))
+        assert memo.cache_info().hits == 2
+        bounds.contains(NominalReal(2, "m"))
+        assert memo.cache_info().misses == 4
+
+
+def test_memoized_containment_unhashable():
+    """Sets and dicts in the fields are frozen, and anything else is passed through."""
+    components = CompositionBounds(["a", "b"])
+    with memoized_containment() as memo:
+        for _ in range(3):
+            assert components.contains(NominalComposition({"a": 0.5, "b": 0.5}))
+            assert not components.contains(NominalComposition({"c": 1}))
+        assert memo.cache_info() == ContainmentCacheInfo(hits=4, misses=2, maxsize=4096,
+                                                         currsize=2)
+
+        for bad in ("a", ["a"]):
+            with pytest.raises(TypeError):
+                components.contains(bad)
+        assert memo.cache_info().currsize == 2
+
+    value = NominalReal(1, "m")
+    value.extra = [{"x": {1, 2}}, NominalReal(2, "m"), bytearray(b"y")]
+    assert _deep_fingerprint(value)[1][-1] == (
+        "extra",
+        (frozenset({("x", frozenset({1, 2}))}),
+         (NominalReal, (("_units", "meter"), ("nominal", 2.0))),
+         bytearray(b"y"))
+    )
+
+
+def test_memoized_containment_subclass():
+    """Implementations that chain through super() are remembered separately."""
+    class ShortBounds(RealBounds):
+        def contains(self, bounds):
+            return super().contains(bounds) and bounds.nominal < 10
+
+    bounds = ShortBounds(0, 100, "m")
+    with memoized_containment() as memo:
+        assert not bounds.contains(NominalReal(50, "m"))
+        assert not bounds.contains(NominalReal(50, "m"))
+        assert RealBounds(0, 100, "m").contains(NominalReal(50, "m"))
+        assert memo.cache_info() == ContainmentCacheInfo(hits=1, misses=3, maxsize=4096,
+                                                         currsize=3)
+
+
+def test_contains_each():
+    """Checking many values at once gives the same answers as checking them one at a time."""
+    cases = [
+        (RealBounds(0, 100, "degC"),
+         [NominalReal(50, "degC"), NominalReal(500, "degC"), NominalReal(300, "K"),
+          NominalReal(50, "m"), UniformReal(10, 20, "degC"), UniformReal(10, 200, "degC")]),
+        (IntegerBounds(0, 10),
+         [NominalInteger(5), NominalInteger(50), UniformInteger(1, 2), UniformInteger(1, 20)]),
+        (CategoricalBounds(["a", "b"]),
+         [NominalCategorical("a"), NominalCategorical("c"), DiscreteCategorical("b")]),
+        (CompositionBounds(["a", "b"]),
+         [NominalComposition({"a": 1}), NominalComposition({"c": 1})]),
+    ]
+    for bounds, values in cases:
+        expected = [bounds.contains(value) for value in values]
+        assert True in expected and False in expected
+        assert bounds._contains_each(values) == expected
+        assert bounds._contains_each([]) == []
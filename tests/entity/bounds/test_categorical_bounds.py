@@ -78,3 +78,21 @@ def test_numpy():
 
         pd_unique = CategoricalBounds(pd.Series(["spam", "eggs"]).unique())
         assert pd_copy == pd_unique
+
+
+def test_contains_many():
+    """Many raw labels are screened at once."""
+    bounds = CategoricalBounds(categories={"spam", "eggs"})
+    labels = ["spam", "ham", "eggs", "Spam"]
+    expected = [True, False, True, False]
+    assert bounds.contains_many(labels) == expected
+    assert bounds.contains_many(labels) == [bounds.contains(NominalCategorical(x))
+                                            for x in labels]
+
+    np = pytest.importorskip("numpy")
+    assert bounds.contains_many(np.array(labels)).tolist() == expected
+    assert bounds.contains_many(np.array(labels, dtype=object)).tolist() == expected
+
+    pd = pytest.importorskip("pandas")
+    assert bounds.contains_many(pd.Series(labels)).tolist() == expected
+    assert bounds.contains_many(pd.Categorical(labels)).tolist() == expected
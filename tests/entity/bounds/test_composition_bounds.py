@@ -78,3 +78,26 @@ def test_numpy():
         pd_bounds = CompositionBounds(components=pd.Series(["spam", "eggs"]))
         pd_copy = loads(dumps(pd_bounds))
         assert pd_copy == pd_bounds
+
+
+def test_contains_many():
+    """Many raw compositions are screened at once."""
+    bounds = CompositionBounds(components={"Fe", "C", "Cr"})
+    compositions = [{"Fe", "C"}, {"Fe": 0.9, "Ni": 0.1}, ["Cr"], set()]
+    expected = [True, False, True, True]
+    assert bounds.contains_many(compositions) == expected
+    assert bounds.contains_many(compositions[1:2]) == [
+        bounds.contains(NominalComposition(compositions[1]))
+    ]
+
+    np = pytest.importorskip("numpy")
+    array = np.empty(len(compositions), dtype=object)
+    array[:] = compositions
+    mask = bounds.contains_many(array)
+    assert mask.dtype == bool
+    assert mask.tolist() == expected
+
+    pd = pytest.importorskip("pandas")
+    mask = bounds.contains_many(pd.Series(compositions))
+    assert mask.dtype == bool
+    assert mask.tolist() == expected
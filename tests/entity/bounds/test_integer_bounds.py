@@ -82,3 +82,18 @@ def test_union():
 
     with pytest.raises(TypeError):
         bounds.union(RealBounds(0, 1, ""))
+
+
+def test_contains_many():
+    """Many raw numbers are screened at once."""
+    bounds = IntegerBounds(lower_bound=1, upper_bound=10)
+    numbers = [0, 1, 5, 5.5, 10, 11, float("nan")]
+    expected = [False, True, True, False, True, False, False]
+    assert bounds.contains_many(numbers) == expected
+
+    np = pytest.importorskip("numpy")
+    assert bounds.contains_many(np.array(numbers)).tolist() == expected
+    assert bounds.contains_many(np.arange(12)).tolist() == [False] + [True] * 10 + [False]
+
+    pd = pytest.importorskip("pandas")
+    assert bounds.contains_many(pd.Series(numbers)).tolist() == expected
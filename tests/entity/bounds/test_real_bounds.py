@@ -1,10 +1,14 @@
 """Test RealBounds."""
+import warnings
+
 import pytest
 
 from gemd.entity.bounds.integer_bounds import IntegerBounds
 from gemd.entity.bounds.real_bounds import RealBounds
+from gemd.entity.value.continuous_value import ContinuousValue
 from gemd.entity.value.nominal_real import NominalReal
-from gemd.units import IncompatibleUnitsError
+from gemd.entity.value.uniform_real import UniformReal
+from gemd.units import IncompatibleUnitsError, convert_units
 
 
 def test_contains():
@@ -55,6 +59,45 @@ def test_contains_incompatible_units():
     assert not dim.contains(dim3)
 
 
+def test_contains_across_units():
+    """Make sure containment across units matches converting the bounds to the value's units."""
+    bounds = RealBounds(lower_bound=0.1, upper_bound=7.3, default_units="MPa")
+    for endpoint in (bounds.lower_bound, bounds.upper_bound):
+        for target in ("psi", "Pa", "kPa", "bar"):
+            value = NominalReal(convert_units(endpoint, "MPa", target), target)
+            assert bounds.contains(value), f"{endpoint} MPa in {target} should be contained"
+    assert bounds.contains(UniformReal(20, 1000, "psi"))
+    assert not bounds.contains(UniformReal(20, 2000, "psi"))
+    assert not bounds.contains(NominalReal(0.09, "MPa"))
+
+    temperature = RealBounds(lower_bound=0, upper_bound=100, default_units="degC")
+    assert not temperature.contains(NominalReal(300, "delta_degC")), "Offsets aren't convertible"
+    assert not RealBounds(0, 1, "").contains(NominalReal(0.5, "rad")), "Radians aren't fractions"
+
+    class CustomReal(ContinuousValue, typ="custom_real"):
+        def __init__(self, value, units):
+            ContinuousValue.__init__(self, units)
+            self.value = value
+
+        def _to_bounds(self):
+            return RealBounds(self.value, self.value, self.units)
+
+    assert CustomReal(50, "degF")._to_range() == (50, 50, "degree_Fahrenheit")
+    assert temperature.contains(CustomReal(50, "degF"))
+    assert not temperature.contains(CustomReal(250, "degF"))
+
+
+def test_contains_logarithmic_units():
+    """Logarithmic units aren't affine, so containment must convert through Pint."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert RealBounds(0, 20, "dBm").contains(NominalReal(50, "milliwatt"))
+        assert not RealBounds(0, 20, "dBm").contains(NominalReal(200, "milliwatt"))
+        assert RealBounds(1, 100, "milliwatt").contains(NominalReal(15, "dBm"))
+        assert not RealBounds(1, 100, "milliwatt").contains(NominalReal(25, "dBm"))
+        assert RealBounds(-10, 10, "dBW").contains(UniformReal(25, 35, "dBm"))
+
+
 def test_constructor_error():
     """Test that invalid real bounds cannot be constructed."""
     with pytest.raises(TypeError):
@@ -88,3 +131,27 @@ def test_type_mismatch():
     assert not bounds.contains(None)
     with pytest.raises(TypeError):
         bounds.contains([.33, .66])
+
+
+def test_contains_many():
+    """Many raw numbers are screened at once, with the units converted once."""
+    bounds = RealBounds(lower_bound=0, upper_bound=100, default_units="degC")
+    kelvin = [273.15, 300, 373.15, 400, 200, float("nan")]
+    expected = [bounds.contains(NominalReal(x, "K")) for x in kelvin]
+    assert expected == [True, True, True, False, False, False]
+    assert bounds.contains_many(kelvin, "K") == expected
+    assert bounds.contains_many(iter([-1, 0, 50, 100, 101])) == [False, True, True, True, False]
+    assert bounds.contains_many([20], "m") == [False]
+    assert bounds.contains_many([20], "delta_degC") == [False]
+
+    np = pytest.importorskip("numpy")
+    mask = bounds.contains_many(np.array(kelvin), "K")
+    assert mask.dtype == bool
+    assert mask.tolist() == expected
+    assert not bounds.contains_many(np.array([20.0, np.inf]), "m").any()
+
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(kelvin, index=list("abcdef"))
+    mask = bounds.contains_many(series, "K")
+    assert mask.tolist() == expected
+    assert list(series[mask].index) == ["a", "b", "c"]
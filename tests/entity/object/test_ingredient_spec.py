@@ -95,6 +95,17 @@ def test_valid_quantities(valid_quantity, caplog):
     assert len(caplog.records) == 0, "Warned on valid values with WARNING."
 
 
+@pytest.mark.parametrize("valid_quantity", VALID_QUANTITIES)
+def test_valid_quantities_fatal(valid_quantity):
+    """Check that valid quantities are accepted, not rejected with no message, under FATAL."""
+    with validation_level(WarningLevel.FATAL):
+        ingred = IngredientSpec(name="name", absolute_quantity=valid_quantity)
+        assert ingred.absolute_quantity == valid_quantity
+        ingred.absolute_quantity = None
+        ingred.absolute_quantity = valid_quantity
+        assert ingred.absolute_quantity == valid_quantity
+
+
 @pytest.mark.parametrize("invalid_fraction", INVALID_FRACTIONS)
 def test_invalid_fractions(invalid_fraction, caplog):
     """
@@ -123,7 +134,7 @@ def test_invalid_quantities(invalid_quantity, caplog):
         IngredientSpec(name="name", absolute_quantity=invalid_quantity)
     assert len(caplog.records) == 1, f"Didn't warn on invalid values with IGNORE: {invalid_quantity}"
     with validation_level(WarningLevel.FATAL):
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="Value"):
             IngredientSpec(name="name", absolute_quantity=invalid_quantity)
 
 
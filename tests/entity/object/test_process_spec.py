@@ -5,6 +5,8 @@ from copy import deepcopy
 from gemd.json import dumps, loads
 from gemd.entity.attribute import PropertyAndConditions, Property
 from gemd.entity.object import ProcessSpec, MaterialSpec, IngredientSpec
+from gemd.entity.object.has_template_check_generator import _resolve_template_check
+from gemd.entity.template.has_condition_templates import HasConditionTemplates
 from gemd.entity.value import DiscreteCategorical
 from gemd.util import flatten
 
@@ -92,3 +94,10 @@ def test_template_check_generator():
 
     with pytest.raises(ValueError):  # Can't find attribute
         spec1._generate_template_check(validate=ProcessSpec.name.fget)
+
+    # The introspection is done once per validation routine
+    resolved = _resolve_template_check(HasConditionTemplates.validate_condition)
+    assert resolved[0] is HasConditionTemplates
+    hits = _resolve_template_check.cache_info().hits
+    ProcessSpec("Another spec")
+    assert _resolve_template_check.cache_info().hits > hits
@@ -1,5 +1,8 @@
+from copy import deepcopy
+
 import pytest
 
+from gemd.entity.base_entity import BaseEntity
 from gemd.entity.bounds import IntegerBounds
 from gemd.entity.value import NominalInteger
 from gemd.entity.attribute import Condition, Property, Parameter, PropertyAndConditions
@@ -8,6 +11,7 @@ from gemd.entity.template import MeasurementTemplate, PropertyTemplate, Conditio
 from gemd.entity.template.attribute_template import AttributeTemplate
 from gemd.entity.bounds.base_bounds import BaseBounds
 from gemd.entity.valid_list import ValidList
+from gemd.entity.link_by_uid import LinkByUID
 
 
 def test_mixins():
@@ -212,3 +216,55 @@ def test_dependencies():
     assert prop in msr_template.all_dependencies()
     assert cond in msr_template.all_dependencies()
     assert param in msr_template.all_dependencies()
+
+
+def test_attribute_template_index(monkeypatch):
+    """Test that attribute templates are found by identity, uid and name, even if changed."""
+    first = ConditionTemplate("First", bounds=IntegerBounds(0, 1), uids={"id": "1"})
+    anonymous = ConditionTemplate("Anonymous", bounds=IntegerBounds(0, 1))
+    template = MeasurementTemplate("Name",
+                                   conditions=[[first, IntegerBounds(0, 0)],
+                                               anonymous,
+                                               [first, IntegerBounds(1, 1)]])
+    find = MeasurementTemplate._find_attribute_template
+    assert find(template.conditions, first, "Any")[1] == IntegerBounds(0, 0), "First match wins"
+    assert find(template.conditions, LinkByUID("id", "1"), "Any")[0] is first
+    copy = ConditionTemplate("Anonymous", bounds=IntegerBounds(0, 1))
+    assert find(template.conditions, copy, "Any")[0] is anonymous, "Equality, not identity"
+    assert find(template.conditions, None, "Anonymous")[0] is anonymous
+    assert find(template.conditions, LinkByUID("id", "2"), "Any") == (None, None)
+    assert find(template.conditions, None, "Other") == (None, None)
+    with monkeypatch.context() as patch:
+        patch.setattr(BaseEntity, "_cached_equals", None)  # A miss needs no deep comparison
+        stranger = ConditionTemplate("Stranger", bounds=IntegerBounds(0, 1), uids={"id": "9"})
+        assert find(template.conditions, stranger, "Any") == (None, None)
+
+    # Names and uids changed after the template was listed are reindexed
+    anonymous.add_uid("id", "anonymous")
+    assert find(template.conditions, LinkByUID("id", "anonymous"), "Any")[0] is anonymous
+    assert find(template.conditions, LinkByUID("ID", "anonymous"), "Any")[0] is anonymous
+    anonymous.uids = {"id": "renamed"}
+    anonymous.name = "Renamed"
+    assert find(template.conditions, LinkByUID("id", "anonymous"), "Any") == (None, None)
+    assert find(template.conditions, LinkByUID("id", "renamed"), "Any")[0] is anonymous
+    assert find(template.conditions, None, "Renamed")[0] is anonymous
+    assert find(template.conditions, None, "Anonymous") == (None, None)
+    replacement = ConditionTemplate("Replacement", bounds=IntegerBounds(0, 1))
+    template.conditions[2] = replacement
+    assert find(template.conditions, replacement, "Any")[0] is replacement
+    assert find(template.conditions, None, "Replacement")[0] is replacement
+    template.conditions.append(ConditionTemplate("Appended", bounds=IntegerBounds(0, 1)))
+    assert find(template.conditions, None, "Appended")[0].name == "Appended"
+
+    assert find([[first, None]], LinkByUID("id", "1"), "Any") == (first, None)
+
+    # Replacing a pair in place must not leave the index pointing at a later match
+    other = ConditionTemplate("Other", bounds=IntegerBounds(0, 1))
+    pairs = MeasurementTemplate("Pairs", conditions=[[other, IntegerBounds(0, 1)],
+                                                     [first, IntegerBounds(1, 1)]]).conditions
+    assert find(pairs, first, "Any")[1] == IntegerBounds(1, 1)
+    pairs[0] = [first, IntegerBounds(0, 0)]
+    assert find(pairs, first, "Any")[1] == IntegerBounds(0, 0)
+    del pairs[0]
+    assert find(pairs, first, "Any")[1] == IntegerBounds(1, 1)
+    assert find(deepcopy(pairs), first, "Any")[1] == IntegerBounds(1, 1)
@@ -1,5 +1,17 @@
+import asyncio
+import threading
+
+import pytest
+
+from gemd.entity.attribute import Condition, Property, PropertyAndConditions
 from gemd.entity.bounds_validation import WarningLevel, set_validation_level, \
-    get_validation_level, validation_level
+    get_validation_level, validation_level, is_trusted_construction, trusted_construction, \
+    deferred_validation
+from gemd.entity.object import IngredientSpec, MaterialSpec, MeasurementSpec
+from gemd.entity.template import MaterialTemplate, MeasurementTemplate, ConditionTemplate
+from gemd.entity.bounds.real_bounds import RealBounds
+from gemd.entity.setters import validate_list
+from gemd.entity.value.nominal_real import NominalReal
 
 
 def test_bounds_validation():
@@ -9,3 +21,160 @@ def test_bounds_validation():
         set_validation_level(WarningLevel.WARNING)
         assert get_validation_level() == WarningLevel.WARNING, "Setter worked."
     assert get_validation_level() == old_level, "Original level restored."
+
+
+def test_trusted_construction():
+    """Verify that trusted construction skips validation and restores state afterwards."""
+    assert not is_trusted_construction()
+    with trusted_construction():
+        assert is_trusted_construction(), "Context worked."
+        assert get_validation_level() == WarningLevel.IGNORE, "Bounds checks are skipped."
+
+        triggered = []
+        trusted = validate_list(["a", 1], str, trigger=triggered.append)
+        assert trusted == ["a", 1], "Contents are taken as-is"
+        assert triggered == [], "Triggers are not run on trusted contents"
+        with pytest.raises(TypeError):
+            trusted.append(2)  # But new elements are still validated
+        trusted.append("b")
+        assert triggered == ["b"]
+
+        assert NominalReal(1, "kg").units == "kg"
+        assert RealBounds(0, 1, "m").default_units == "m"
+    assert not is_trusted_construction(), "Original state restored."
+    assert get_validation_level() == WarningLevel.WARNING, "Original level restored."
+
+    with pytest.raises(RuntimeError):
+        with trusted_construction():
+            raise RuntimeError("Failure during construction")
+    assert not is_trusted_construction(), "State restored after an exception."
+    assert get_validation_level() == WarningLevel.WARNING, "Level restored after an exception."
+
+
+def test_validation_level_is_context_local():
+    """Verify that threads and asyncio tasks do not see each other's validation level."""
+    inside, outside = threading.Event(), threading.Event()
+    seen = {}
+
+    def bulk_load():
+        with trusted_construction():
+            inside.set()
+            outside.wait()
+            seen["worker"] = get_validation_level(), is_trusted_construction()
+
+    worker = threading.Thread(target=bulk_load)
+    worker.start()
+    inside.wait()
+    seen["main"] = get_validation_level(), is_trusted_construction()
+    outside.set()
+    worker.join()
+    assert seen == {"worker": (WarningLevel.IGNORE, True), "main": (WarningLevel.WARNING, False)}
+
+    with validation_level(WarningLevel.FATAL):
+        other = threading.Thread(target=lambda: seen.update(fresh=get_validation_level()))
+        other.start()
+        other.join()
+    assert seen["fresh"] == WarningLevel.WARNING, "New threads start from the default"
+
+    async def task(level, started, finished):
+        with validation_level(level):
+            started.set()
+            await finished.wait()
+            return get_validation_level()
+
+    async def interleave():
+        started = [asyncio.Event(), asyncio.Event()]
+        finished = asyncio.Event()
+        tasks = [asyncio.create_task(task(level, event, finished))
+                 for level, event in zip([WarningLevel.IGNORE, WarningLevel.FATAL], started)]
+        for event in started:
+            await event.wait()
+        finished.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(interleave()) == [WarningLevel.IGNORE, WarningLevel.FATAL]
+    assert get_validation_level() == WarningLevel.WARNING
+
+
+def test_set_validation_level_is_process_wide():
+    """Verify that the level set at startup applies in threads started later."""
+    seen = {}
+    set_validation_level(WarningLevel.FATAL)
+    try:
+        worker = threading.Thread(target=lambda: seen.update(worker=get_validation_level()))
+        worker.start()
+        worker.join()
+        assert seen["worker"] == WarningLevel.FATAL
+    finally:
+        set_validation_level(WarningLevel.WARNING)
+    assert get_validation_level() == WarningLevel.WARNING
+
+
+def test_deferred_validation(caplog):
+    """Verify that deferred validation checks everything once, when the context exits."""
+    length = ConditionTemplate("length", bounds=RealBounds(0, 10, "m"))
+    template = MeasurementTemplate("measure", conditions=[[length, RealBounds(0, 5, "m")]])
+
+    def build():
+        prop = Condition("length", template=length, value=NominalReal(20, "m"))
+        for meters in range(11, 31):
+            prop.value = NominalReal(meters, "m")  # Each change is recorded, but checked once
+        spec = MeasurementSpec("spec", template=template, conditions=[prop])
+        spec.conditions.append(Condition("length", template=length, value=NominalReal(7, "m")))
+        fixed = Condition("length", template=length, value=NominalReal(20, "m"))
+        fixed.value = NominalReal(1, "m")  # Only the final state is checked
+        spec.conditions.append(fixed)
+        IngredientSpec("ingredient", mass_fraction=NominalReal(2, ""),
+                       absolute_quantity=NominalReal(-1, "kg"))
+
+    with validation_level(WarningLevel.FATAL):
+        with pytest.raises(ValueError, match="^5 validation failures"):
+            with deferred_validation() as violations:
+                build()  # Nothing is raised until the context exits
+                assert violations == []
+        assert len(violations) == 5
+        assert sum("does not contain" in v for v in violations) == 1, "Attribute bounds"
+        assert sum("inconsistent with template" in v for v in violations) == 2, "Object bounds"
+        assert sum("between 0 and 1" in v for v in violations) == 1, "Fractions"
+        assert sum("less than 0.0" in v for v in violations) == 1, "Quantities"
+
+        with deferred_validation() as violations:
+            spec = MeasurementSpec("spec", template=template)
+            spec.conditions.append(Condition("length", value=NominalReal(7, "m")))
+            spec.conditions = []  # The out-of-bounds condition is gone before the check
+            MaterialSpec("material", template=MaterialTemplate("material"),
+                         properties=PropertyAndConditions(Property("length",
+                                                                   value=NominalReal(7, "m"))))
+        assert violations == [], "Objects are checked in their final state"
+
+        with pytest.raises(ValueError):
+            build()  # Not deferred
+
+        with pytest.raises(ValueError, match="^5 validation failures"):
+            with deferred_validation() as outer:
+                with deferred_validation() as inner:
+                    build()
+                assert inner is outer and outer == [], "Nested contexts defer to the outer one"
+
+        with pytest.raises(RuntimeError):
+            with deferred_validation() as violations:
+                build()
+                raise RuntimeError("Failure during construction")
+        assert violations == [], "Nothing is validated after an exception"
+
+        with validation_level(WarningLevel.IGNORE):
+            with deferred_validation() as violations:
+                with validation_level(WarningLevel.FATAL):
+                    build()
+        assert violations == [], "The level at exit applies"
+
+        with deferred_validation() as violations:
+            with validation_level(WarningLevel.IGNORE):
+                build()
+        assert violations == [], "Changes made while ignoring validation are not recorded"
+
+    caplog.clear()
+    with deferred_validation() as violations:
+        build()
+    assert len(violations) == 5
+    assert len(caplog.records) == 1, "Violations are reported together"
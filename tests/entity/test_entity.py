@@ -3,9 +3,10 @@ from abc import ABC
 import inspect
 import pytest
 from typing import Generic, TypeVar
+from uuid import uuid4
 
 from gemd import ProcessSpec, IngredientSpec, MaterialSpec, IngredientRun, \
-    LinkByUID, ConditionTemplate, MolecularStructureBounds
+    LinkByUID, ConditionTemplate, MolecularStructureBounds, ProcessTemplate, RealBounds
 from gemd.entity.dict_serializable import DictSerializable
 from gemd.entity.base_entity import BaseEntity
 
@@ -80,6 +81,21 @@ def test_equality():
     assert two == one
 
 
+def test_equality_deep_history():
+    """Test that arbitrarily deep histories can be compared."""
+    def history(length, last_name):
+        material = MaterialSpec("Material 0", process=ProcessSpec("Process 0"))
+        for i in range(1, length):
+            process = ProcessSpec(f"Process {i}")
+            IngredientSpec("Ingredient", material=material, process=process)
+            material = MaterialSpec(last_name if i == length - 1 else f"Material {i}",
+                                    process=process)
+        return material
+
+    assert history(500, "Last") == history(500, "Last")
+    assert history(500, "Last") != history(500, "Other")
+
+
 @pytest.mark.xfail(reason="Entities fail the isabstract test.")
 def test_meta_behaviors():  # pragma: no cover
     """Test the DictSerializable metaclass behaviors."""
@@ -162,3 +178,55 @@ def test_derived_collision():
     with pytest.raises(ValueError, match="mine"):
         class SecondChild(Parent, typ="mine"):
             pass
+
+
+def test_build():
+    """Test that build constructs nested objects the same way a JSON round trip would."""
+    bounds = RealBounds(0, 100, "degC")
+    template = ConditionTemplate("Temperature", bounds=bounds, uids={"scope": "temp"})
+    uid = uuid4()
+    built = DictSerializable.build({
+        "type": "process_template",
+        "name": "Baking",
+        "uids": {"scope": uid},
+        "conditions": ((template, {"type": "real_bounds", "lower_bound": 10,
+                                   "upper_bound": 20, "default_units": "degC"}),),
+    })
+    assert isinstance(built, ProcessTemplate)
+    assert built.uids["scope"] == str(uid), "UUIDs become strings"
+    copied_template, copied_bounds = built.conditions[0]
+    assert copied_template == template
+    assert copied_template is not template, "Nested objects are copied"
+    assert copied_bounds.upper_bound == 20
+
+    assert DictSerializable.build({"not a type": [1, (2, 3)]}) == {"not a type": [1, [2, 3]]}
+    with pytest.raises(TypeError, match="unknown"):
+        DictSerializable.build({"type": "unknown"})
+
+
+def test_as_dict_plan():
+    """Test that the compiled as_dict serializer tracks the fields of each instance."""
+    spec = ProcessSpec("Object", tags=["tags!"], uids={"scope": "id"}, notes="Notes!")
+    expected = {"type": "process_spec", "name": "Object", "tags": ["tags!"],
+                "uids": {"scope": "id"}, "notes": "Notes!", "template": None,
+                "parameters": [], "conditions": [], "file_links": []}
+    assert spec.as_dict() == expected
+    assert "_as_dict_plan" in vars(ProcessSpec), "Serializer is cached on the class"
+    assert "_as_dict_plan" not in vars(BaseEntity), "... and only on that class"
+
+    spec.extra = "extra field"
+    assert spec.as_dict() == dict(expected, extra="extra field"), "New fields are picked up"
+
+    class NoFields(DictSerializable, typ="no_fields"):
+        pass
+
+    class OneField(DictSerializable, typ="one_field"):
+        def __init__(self, value):
+            self._value = value
+
+        @property
+        def value(self):
+            return self._value
+
+    assert NoFields().as_dict() == {"type": "no_fields"}
+    assert OneField(3).as_dict() == {"type": "one_field", "value": 3}
@@ -85,3 +85,39 @@ def test_invalid_content():
         ValidList(_list=tuple([1, 1]), content_type=1)
     with pytest.raises(TypeError):
         ValidList(_list=tuple([1, 1]), content_type=None)
+
+
+def test_version():
+    """Test that every change to the list is counted."""
+    lo_ints = ValidList([3, 1, 2], int)
+    versions = [lo_ints._version]
+
+    def changed():
+        versions.append(lo_ints._version)
+        return versions[-1] > versions[-2]
+
+    lo_ints[0] = 4
+    assert changed()
+    lo_ints.append(5)
+    assert changed()
+    lo_ints.extend([6])
+    assert changed()
+    lo_ints.insert(0, 7)
+    assert changed()
+    del lo_ints[0]
+    assert changed()
+    assert lo_ints.pop() == 6
+    assert changed()
+    lo_ints.remove(5)
+    assert changed()
+    lo_ints.sort()
+    assert changed()
+    lo_ints.reverse()
+    assert changed()
+    lo_ints += [0]
+    assert changed()
+    lo_ints *= 2
+    assert changed()
+    assert lo_ints == [4, 2, 1, 0, 4, 2, 1, 0]
+    lo_ints.clear()
+    assert changed()
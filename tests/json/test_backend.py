@@ -0,0 +1,104 @@
+"""Test the pluggable JSON backends."""
+import json as json_builtin
+import math
+from io import StringIO
+
+import pytest
+
+import gemd.json as gemd_json
+from gemd.demo.cake import make_cake
+from gemd.entity.attribute import Parameter
+from gemd.entity.object import ProcessSpec
+from gemd.entity.value import NominalReal
+from gemd.json import GEMDJson
+from gemd.json.backend import JSONBackend, StdlibBackend, OrjsonBackend, get_backend
+
+
+def test_get_backend():
+    """Test that backends resolve by name or instance."""
+    assert isinstance(get_backend(), StdlibBackend)
+    assert isinstance(get_backend("json"), StdlibBackend)
+    backend = StdlibBackend()
+    assert get_backend(backend) is backend
+    assert GEMDJson(backend=backend).backend is backend
+    with pytest.raises(ValueError):
+        get_backend("not a backend")
+
+
+def test_custom_backend():
+    """Test that any JSONBackend can be plugged in."""
+    class CountingBackend(StdlibBackend):
+        def __init__(self):
+            self.calls = 0
+
+        def dumps(self, obj, **kwargs):
+            self.calls += 1
+            return super().dumps(obj, **kwargs)
+
+    backend = CountingBackend()
+    assert isinstance(backend, JSONBackend)
+    spec = ProcessSpec("A process")
+    assert gemd_json.loads(gemd_json.dumps(spec, backend=backend)) == spec
+    assert backend.calls == 1
+
+
+def test_orjson_backend():
+    """Test that the orjson backend is equivalent to the standard library."""
+    pytest.importorskip("orjson")
+    cake = make_cake(seed=42)
+    standard = GEMDJson()
+    fast = GEMDJson(backend="orjson")
+    assert isinstance(fast.backend, OrjsonBackend)
+
+    standard_text = standard.dumps(cake)
+    fast_text = fast.dumps(cake)
+    assert json_builtin.loads(fast_text) == json_builtin.loads(standard_text)
+    assert fast.dumps(cake) == fast_text, "Output should be deterministic"
+    indented = fast.dumps(cake, indent=2)
+    assert "\n  " in indented
+    assert json_builtin.loads(indented) == json_builtin.loads(fast_text)
+
+    expected = standard.dumps(standard.loads(standard_text))
+    assert standard.dumps(fast.loads(standard_text)) == expected
+    assert standard.dumps(gemd_json.loads(fast_text, backend="orjson")) == expected
+    assert standard.dumps(fast.raw_loads(fast.raw_dumps(cake))) == \
+        standard.dumps(standard.raw_loads(standard.raw_dumps(cake)))
+    assert json_builtin.loads(fast.thin_dumps(cake)) == \
+        json_builtin.loads(standard.thin_dumps(cake))
+
+    stream = StringIO()
+    gemd_json.dump_stream(cake, stream, backend="orjson")
+    stream.seek(0)
+    assert standard.dumps(gemd_json.load_stream(stream, backend="orjson")) == expected
+    assert fast.backend.loads('{"a": [{"b": 1}]}') == {"a": [{"b": 1}]}
+
+
+def test_orjson_backend_errors():
+    """Test that unsupported options and objects are rejected by the orjson backend."""
+    pytest.importorskip("orjson")
+    backend = get_backend("orjson")
+    with pytest.raises(ValueError):
+        backend.dumps({}, indent=4)
+    with pytest.raises(TypeError):
+        backend.dumps({}, separators=(",", ":"))
+    with pytest.raises(TypeError):
+        backend.dumps({"key": object()})
+    with pytest.raises(TypeError):
+        backend.loads("{}", parse_float=float)
+
+
+def test_orjson_backend_non_finite():
+    """Test that non-finite floats, which orjson would write as null, survive a round trip."""
+    pytest.importorskip("orjson")
+    fast = GEMDJson(backend="orjson")
+    for number in (float("nan"), float("inf"), -float("inf")):
+        value = NominalReal(number, "")
+        copy = fast.loads(fast.dumps(value))
+        assert isinstance(copy, NominalReal)
+        assert copy.nominal == number or (math.isnan(number) and math.isnan(copy.nominal))
+        assert fast.dumps(copy) == GEMDJson().dumps(copy)
+
+        spec = ProcessSpec("A process", parameters=[Parameter("Power", value=value)])
+        copy = fast.loads(fast.dumps(spec, indent=2))
+        assert fast.dumps(copy) == GEMDJson().dumps(copy)
+        assert fast.backend.loads(fast.backend.dumps([number]))[0] == number or math.isnan(number)
@@ -1,11 +1,15 @@
 """Test serialization and deserialization of gemd objects."""
 import json as json_builtin
+import mmap
 from copy import deepcopy
+from io import StringIO, BytesIO
 from uuid import uuid4
 
 import pytest
 
 from gemd.json import GEMDJson
+from gemd.json.gemd_encoder import GEMDEncoder
+from gemd.json.gemd_json import _IncrementalReader
 import gemd.json as gemd_json
 from gemd.entity.attribute.property import Property
 from gemd.entity.bounds.real_bounds import RealBounds
@@ -24,6 +28,7 @@ from gemd.entity.value.nominal_real import NominalReal
 from gemd.entity.value.normal_real import NormalReal
 from gemd.enumeration.origin import Origin
 from gemd.util import substitute_objects, substitute_links
+from gemd.demo.cake import make_cake
 
 
 def test_serialize():
@@ -74,6 +79,9 @@ def test_uuid_serde():
     link = LinkByUID(id=uuid4(), scope="mine")
     assert GEMDJson().copy(link).id == str(link.id)
 
+    uid = uuid4()
+    assert json_builtin.dumps([uid], cls=GEMDEncoder) == f'["{uid}"]'
+
 
 def test_scope_control():
     """Serializing a nested object should be identical to individually serializing each piece."""
@@ -180,6 +188,10 @@ def test_unexpected_deserialization():
     # in the substitute_links method
     with pytest.raises(TypeError):
         gemd_json.dumps(ProcessRun("A process", notes={"type": "unknown"}))
+    with pytest.raises(TypeError):
+        gemd_json.loads('{"context": [], "object": {"type": "unknown"}}')
+    with pytest.raises(TypeError):
+        GEMDJson().raw_loads('{"type": "unknown"}')
 
 
 def test_register_classes_override():
@@ -230,8 +242,7 @@ def test_pure_substitutions():
           ]
        '''
     index = {}
-    clazz_index = DictSerializable.class_mapping
-    original = json_builtin.loads(json_str, object_hook=lambda x: GEMDJson()._load_and_index(x, index, clazz_index))
+    original = json_builtin.loads(json_str, object_hook=GEMDJson()._object_hook(index))
     frozen = deepcopy(original)
     loaded = substitute_objects(original, index)
     assert original == frozen
@@ -652,3 +663,132 @@ def test_deeply_nested_rehydration():
     copied = gemd_json.loads(gemd_json.dumps(material_history))
     assert isinstance(copied.process.ingredients[1].spec, IngredientSpec)
     assert isinstance(copied.measurements[0], MeasurementRun)
+
+
+def test_stream_round_trip():
+    """dump_stream / load_stream should round-trip with one entity per line."""
+    cake = make_cake(seed=42)
+    expected = json_builtin.loads(gemd_json.dumps(cake))
+
+    buffer = StringIO()
+    gemd_json.dump_stream(cake, buffer)
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == len(expected["context"]) + 1, "One line per entity, plus the object"
+    assert [json_builtin.loads(x) for x in lines[:-1]] == expected["context"]
+    assert json_builtin.loads(lines[-1]) == {"object": expected["object"]}
+
+    buffer.seek(0)
+    copy = gemd_json.load_stream(buffer)
+    assert copy == cake
+    assert copy is not cake
+
+    # Binary streams and blank lines are fine too
+    binary = BytesIO(("\n".join(lines) + "\n\n").encode("utf-8"))
+    assert GEMDJson().load_stream(binary) == cake
+
+
+def test_stream_errors():
+    """dump_stream cannot indent, and load_stream needs an object record."""
+    with pytest.raises(ValueError):
+        gemd_json.dump_stream(MaterialSpec("spec"), StringIO(), indent=2)
+
+    buffer = StringIO()
+    gemd_json.dump_stream([MaterialSpec("spec")], buffer)
+    truncated = StringIO("\n".join(buffer.getvalue().splitlines()[:-1]))
+    with pytest.raises(ValueError):
+        gemd_json.load_stream(truncated)
+
+
+def test_incremental_load(tmp_path):
+    """Test that load streams the context array rather than reading the whole file."""
+    cake = make_cake(seed=42)
+    text = gemd_json.dumps(cake, indent=2)
+
+    assert gemd_json.load(StringIO(text)) == cake
+    assert gemd_json.load(BytesIO(text.encode("utf-8"))) == cake
+
+    path = tmp_path / "cake.json"
+    path.write_text(text, encoding="utf-8")
+    with open(path, "rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert gemd_json.load(mm) == cake
+
+    # Tiny chunks force every value (and multi-byte characters) to straddle chunk boundaries
+    spec = MaterialSpec("Crème brûlée", tags=["dessert::custard"], notes="12345")
+    encoded = gemd_json.dumps(spec).encode("utf-8")
+    for chunk_size in (1, 3, 7):
+        raw = _IncrementalReader(BytesIO(encoded), chunk_size=chunk_size).load_document(
+            object_hook=GEMDJson()._object_hook({}, substitute=True)
+        )
+        assert raw["object"] == spec
+        assert raw["object"].name == "Crème brûlée"
+
+    # Keys out of the usual order are still resolved against the context
+    document = json_builtin.loads(gemd_json.dumps(cake))
+    reordered = json_builtin.dumps({"object": document["object"],
+                                    "context": document["context"],
+                                    "extra": 1})
+    assert gemd_json.load(StringIO(reordered)) == cake
+    assert gemd_json.load(StringIO('{"context": [], "object": 2.5}')) == 2.5
+    assert gemd_json.load(StringIO('{"object": [], "context": []}')) == []
+    with pytest.raises(KeyError):
+        gemd_json.load(StringIO('{}'))
+
+
+def test_incremental_load_errors():
+    """Malformed documents should fail like json.loads."""
+    for bad in ('[]',
+                '{"context": [], "object": 1',
+                '{"context": [{"type": "link_by_uid", "scope": "a", "id": "b"}',
+                '{"context": [1 2], "object": 1}',
+                '{"context": [], "object": 1} {}',
+                '{1: 2}',
+                '{"object": [}'):
+        with pytest.raises(json_builtin.JSONDecodeError):
+            gemd_json.load(StringIO(bad))
+
+
+def test_type_plan():
+    """Test that the type plan is reused, refreshed for new classes and matches from_dict."""
+    json_obj = GEMDJson()
+    plan = json_obj._type_plan()
+    assert json_obj._type_plan() is plan, "Plan should be cached"
+
+    class PlannedClass(DictSerializable, typ="planned_class"):
+        def __init__(self, value=None):
+            self.value = value
+
+    assert json_obj._type_plan() is not plan, "New registrations should refresh the plan"
+    assert json_obj.raw_loads('{"type": "planned_class", "value": 1}').value == 1
+
+    text = '{"type": "nominal_real", "nominal": 2.5, "units": "m"}'
+    assert json_obj.raw_loads(text) == NominalReal.from_dict(json_builtin.loads(text))
+    assert json_obj.raw_loads(text.replace("}", ', "extra": 1}')) == NominalReal(2.5, "m")
+    assert IngredientRun._decoder() == IngredientRun.from_dict, \
+        "Overridden from_dict methods should be used as-is"
+    with pytest.raises(TypeError):
+        json_obj.raw_loads('{"type": "unplanned_class"}')
+
+
+def test_trusted_loads(tmp_path):
+    """Test that trusted loading produces the same objects as validated loading."""
+    cake = make_cake(seed=42)
+    json_obj = GEMDJson()
+    trusted = GEMDJson(trusted=True)
+    assert trusted.trusted and not json_obj.trusted
+
+    text = json_obj.dumps(cake)
+    expected = json_obj.dumps(json_obj.loads(text))
+    assert json_obj.dumps(trusted.loads(text)) == expected
+    assert json_obj.dumps(gemd_json.loads(text, trusted=True)) == expected
+    assert json_obj.dumps(gemd_json.load(StringIO(text), trusted=True)) == expected
+    stream = StringIO()
+    json_obj.dump_stream(cake, stream)
+    stream.seek(0)
+    assert json_obj.dumps(gemd_json.load_stream(stream, trusted=True)) == expected
+    raw = json_obj.raw_dumps(cake)
+    assert trusted.raw_loads(raw) == json_obj.raw_loads(raw)
+
+    # Trusted objects still validate later changes
+    loaded = trusted.loads(text)
+    with pytest.raises(TypeError):
+        loaded.process.conditions.append("Not a condition")
@@ -1,11 +1,18 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
 from deprecation import DeprecatedWarning
 from importlib.resources import files
+import multiprocessing
+import pickle
 import re
+import subprocess
+import sys
+import threading
 from pint import UnitRegistry
 import pytest
 
 from gemd.units import parse_units, convert_units, get_base_units, change_definitions_file, \
+    snapshot_units, restore_units, UnitsSnapshot, \
     UndefinedUnitError, DefinitionSyntaxError, IncompatibleUnitsError
 
 
@@ -147,12 +154,73 @@ def test_conversion():
     assert -1e-8 < convert_units(100, 'g / 100 mL', 'g/cc') - 1 < 1e-8
     assert -1e-8 < convert_units(1, "g / 2.5 cm", "g / 25 mm") - 1 < 1e-8
 
+    assert convert_units(2.5, "m", "m") == 2.5
+
     # Verify that convert_units throws exceptions
     with pytest.raises(IncompatibleUnitsError):
         convert_units(1, 'mL', 'g')
     with pytest.raises(IncompatibleUnitsError):
         # https://pint.readthedocs.io/en/0.23/user/angular_frequency.html
         convert_units(1, 'Hz', 'rpm')
+    with pytest.raises(IncompatibleUnitsError):
+        convert_units(1, 'Hz', 'rpm')  # Incompatible pairs are cached, but still raise
+    with pytest.raises(IncompatibleUnitsError):
+        convert_units(1, 'degC', 'delta_degC')
+
+
+def test_conversion_factor():
+    """Test that conversions are compiled once per pair of units and applied to any value."""
+    from gemd.units import convert_units_array
+    from gemd.units.impl import _conversion_factor
+
+    assert abs(convert_units(100, "degC", "degF") - 212) < 1e-12
+    assert abs(convert_units(-40, "degF", "degC") + 40) < 1e-12
+    assert convert_units(2, "km", "m") == 2000
+    size = _conversion_factor.cache_info().currsize
+    for i in range(100):
+        assert convert_units(i / 7, "km", "m") == i / 7 * 1000
+        assert abs(convert_units(i / 7, "degC", "K") - (i / 7 + 273.15)) < 1e-9
+    assert _conversion_factor.cache_info().currsize <= size + 2
+    assert convert_units.cache_info().currsize <= size + 2
+    convert_units.cache_clear()
+    assert convert_units.cache_info().currsize == 0
+
+    errors = []
+    for _ in range(2):
+        with pytest.raises(IncompatibleUnitsError, match="Cannot convert") as info:
+            convert_units(1, "m", "s")
+        errors.append(info.value)
+    assert errors[0] is not errors[1], "Each call raises its own error"
+    with pytest.raises(IncompatibleUnitsError):
+        convert_units_array([1], "degC", "delta_degC")
+
+
+def test_non_multiplicative_conversion():
+    """Test that offset and logarithmic units convert exactly as Pint converts them."""
+    from gemd.units.impl import _REGISTRY
+
+    for value, start, final in [(10, "dBm", "milliwatt"), (50, "milliwatt", "dBm"),
+                                (20, "dBW", "dBm"), (3, "dBu", "microwatt"),
+                                (1000, "mK", "degC"), (77, "degF", "degC"),
+                                (25, "degC", "mK")]:
+        expected = _REGISTRY.Quantity(value, start).to(final).magnitude
+        for _ in range(2):  # Both when the pair is first seen, and when it is cached
+            assert convert_units(value, start, final) == expected
+    assert abs(convert_units(10, "dBm", "milliwatt") - 10) < 1e-12
+    assert convert_units(1000, "mK", "degC") == -272.15
+    assert abs(convert_units(77, "degF", "degC") - 25) < 1e-12
+
+
+def test_registry_generation():
+    """Test that cached results are keyed on the registry they were computed with."""
+    from gemd.units import impl
+
+    generation = impl._GENERATION
+    assert parse_units("kg") == "kilogram"
+    with _change_units(impl.DEFAULT_FILE):
+        assert impl._GENERATION == generation + 1
+        assert parse_units("kg") == "kilogram"
+    assert impl._GENERATION == generation + 2
 
 
 def test_get_base_units():
@@ -190,6 +258,193 @@ def test_file_change(tmpdir):
         parse_units('mol : mol')  # Ensure the preprocessor is still there
 
 
+@contextmanager
+def _cache_in(monkeypatch, folder):
+    import gemd.units.impl as impl
+
+    try:
+        if folder is None:
+            monkeypatch.delenv(impl.CACHE_ENVIRONMENT_VARIABLE, raising=False)
+        else:
+            monkeypatch.setenv(impl.CACHE_ENVIRONMENT_VARIABLE, folder)
+        impl._cache_folder.cache_clear()
+        impl._pickle_folder.cache_clear()
+        impl._deploy_default_files.cache_clear()
+        yield impl._cache_folder()
+    finally:
+        monkeypatch.undo()
+        impl._cache_folder.cache_clear()
+        impl._pickle_folder.cache_clear()
+        impl._deploy_default_files.cache_clear()
+        change_definitions_file()
+
+
+def test_definitions_cache(tmp_path, monkeypatch):
+    """Test that parsed definitions are cached on disk, keyed by the files' contents."""
+    import gemd.units.impl as impl
+
+    with _cache_in(monkeypatch, str(tmp_path / "cache")) as cache:
+        assert cache == tmp_path / "cache"
+        assert impl.DEFAULT_FILE.parent.parent == cache
+        change_definitions_file()
+        cached = sorted(cache.glob("pint/*.pickle"))
+        assert len(cached) > 0
+        change_definitions_file()  # From the cache this time
+        assert sorted(cache.glob("pint/*.pickle")) == cached
+        assert convert_units(1, 'm', 'cm') == 100
+        assert parse_units("g / 2.5 cm") == "gram / 2.5 centimeter"
+
+        for stale in cached:
+            stale.write_bytes(b"Not a pickle")
+        unrelated = cache / "unrelated.pickle"
+        unrelated.write_bytes(b"Someone else's pickle")
+        change_definitions_file()  # Falls back to parsing, and clears the stale files
+        assert convert_units(1, 'm', 'cm') == 100
+        assert not any(stale.exists() for stale in cached)
+        assert unrelated.exists(), "Only gemd's own pickles are cleared"
+
+        test_file = tmp_path / "test_units.txt"
+        test_file.write_bytes(files("tests.units").joinpath("test_units.txt").read_bytes())
+        change_definitions_file(test_file)
+        with pytest.raises(UndefinedUnitError):
+            parse_units("cent")
+        with test_file.open("a") as handle:
+            handle.write("cent = 0.01 * usd\n")
+        change_definitions_file(test_file)  # Edits invalidate the cache
+        assert convert_units(1, "usd", "cent") == 100
+
+        test_file.write_text("bogus = [unclosed\n")
+        with pytest.raises(DefinitionSyntaxError):
+            change_definitions_file(test_file)
+
+
+def test_definitions_cache_disabled(tmp_path, monkeypatch):
+    """Test that the cache is opt-in, and is skipped if it is unusable."""
+    import gemd.units.impl as impl
+
+    with _cache_in(monkeypatch, None) as cache:
+        assert cache is None
+
+    with _cache_in(monkeypatch, "") as cache:
+        assert cache is None
+        assert impl.DEFAULT_FILE.is_file()
+        assert not impl.DEFAULT_FILE.parent.is_relative_to(tmp_path)
+        change_definitions_file()
+        assert convert_units(1, 'm', 'cm') == 100
+        bad_file = tmp_path / "bad_units.txt"
+        bad_file.write_text("bogus = [unclosed\n")
+        with pytest.raises(DefinitionSyntaxError):
+            change_definitions_file(bad_file)
+
+    blocker = tmp_path / "blocker"
+    blocker.write_text("A file, not a folder")
+    with _cache_in(monkeypatch, str(blocker / "cache")) as cache:
+        assert cache is None
+
+    (tmp_path / "occupied").mkdir()
+    (tmp_path / "occupied" / "pint").write_text("A file, not a folder")
+    with _cache_in(monkeypatch, str(tmp_path / "occupied")) as cache:
+        assert cache == tmp_path / "occupied"
+        assert impl._pickle_folder() is None
+        change_definitions_file()
+        assert convert_units(1, 'm', 'cm') == 100
+
+
+def _scaling_units_known(names):
+    """Report which units a worker process knows, without parsing any unit strings."""
+    from gemd.units.impl import _registry
+    return [name in _registry() for name in names]
+
+
+def test_snapshot_units(tmp_path):
+    """Test that the registry state, including scaling-factor units, can be restored."""
+    import gemd.units.impl as impl
+
+    change_definitions_file()
+    assert snapshot_units() == UnitsSnapshot(filename=None, scaling_definitions=())
+    assert parse_units("g / 2.5 cm") == "gram / 2.5 centimeter"
+    assert parse_units("g / 25 mm") == "gram / 25 millimeter"
+    snapshot = pickle.loads(pickle.dumps(snapshot_units()))
+    names = [d.split("=", 1)[0].strip() for d in snapshot.scaling_definitions]
+    assert len(names) == 2
+
+    registry = impl._registry()
+    restore_units(snapshot)  # Nothing to do
+    assert impl._registry() is registry
+    assert snapshot_units() == snapshot
+
+    change_definitions_file()
+    assert not any(name in impl._registry() for name in names)
+    registry = impl._registry()
+    restore_units(snapshot)
+    assert impl._registry() is registry, "The same file should not be reloaded"
+    assert all(name in registry for name in names)
+    assert snapshot_units() == snapshot
+    assert parse_units("g / 2.5 cm") == "gram / 2.5 centimeter"
+
+    test_file = tmp_path / "test_units.txt"
+    test_file.write_bytes(files("tests.units").joinpath("test_units.txt").read_bytes())
+    with _change_units(filename=test_file):
+        custom = snapshot_units()
+        assert custom == UnitsSnapshot(filename=str(test_file.resolve()), scaling_definitions=())
+    restore_units(custom)
+    assert convert_units(1, 'usd', 'USD') == 1
+    restore_units(snapshot)
+    assert convert_units(1, 'm', 'cm') == 100
+    assert snapshot_units() == snapshot
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context,
+                             initializer=restore_units, initargs=(snapshot,)) as pool:
+        assert pool.submit(_scaling_units_known, names).result() == [True, True]
+
+
+def test_concurrent_parsing():
+    """Test that parsing from many threads defines each scaling-factor unit once."""
+    change_definitions_file()
+    strings = [f"g / {i / 4 + 1.25:g} cm" for i in range(100)]
+    barrier = threading.Barrier(8)
+
+    def work(offset):
+        barrier.wait()
+        return {units: parse_units(units) for units in strings[offset:] + strings[:offset]}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(work, range(0, 100, 13)))
+    parse_units.cache_clear()
+    expected = {units: parse_units(units) for units in strings}
+    assert all(result == expected for result in results)
+    definitions = snapshot_units().scaling_definitions
+    assert len(definitions) == len(set(definitions)) == len(strings)
+
+
+def test_lazy_registry():
+    """Test that the registry is built on first use rather than on import."""
+    import gemd.units.impl as impl
+
+    assert impl.DEFAULT_FILE.name == "citrine_en.txt"
+    assert impl.DEFAULT_CONSTANTS.parent == impl.DEFAULT_FILE.parent
+    assert impl._registry() is impl._REGISTRY
+    del impl._REGISTRY  # Return to the state before first use
+    assert "_REGISTRY" not in vars(impl)
+    assert isinstance(impl._REGISTRY, impl._ScaleFactorRegistry)
+    assert convert_units(1, 'm', 'cm') == 100
+    with pytest.raises(AttributeError):
+        impl.NOT_AN_ATTRIBUTE
+
+    # A fresh interpreter is needed to observe the state before first use
+    script = "\n".join([
+        "from concurrent.futures import ThreadPoolExecutor",
+        "import gemd, gemd.json, gemd.units.impl as impl",
+        "assert '_REGISTRY' not in vars(impl), 'Registry was built on import'",
+        "with ThreadPoolExecutor(max_workers=8) as pool:",
+        "    built = set(pool.map(lambda _: id(impl._registry()), range(32)))",
+        "assert len(built) == 1, 'Concurrent first use built several registries'",
+        "assert impl.convert_units(1, 'm', 'cm') == 100",
+    ])
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
 def test_punctuation():
     """Test that punctuation parses reasonably."""
     assert parse_units('mol.') == parse_units('moles')
@@ -231,3 +486,55 @@ def test_deprecation():
     from pint import Unit
     with pytest.warns(DeprecatedWarning):
         assert f"{Unit('MPa'):clean}" == stringified
+
+
+def test_convert_units_array():
+    """Test that arrays of values convert just as individual values do."""
+    from gemd.units import convert_units_array
+
+    values = [0.0, 1.5, -40, 1e6]
+    for start, final in (("degC", "degF"), ("km", "inch"), ("m", "m")):
+        expected = [convert_units(x, start, final) for x in values]
+        assert convert_units_array(values, start, final) == expected
+        assert convert_units_array(tuple(values), start, final) == expected
+    with pytest.raises(IncompatibleUnitsError):
+        convert_units_array(values, "mL", "g")
+
+    np = pytest.importorskip("numpy")
+    array = np.array(values)
+    for start, final in (("degC", "degF"), ("km", "inch"), ("m", "m")):
+        converted = convert_units_array(array, start, final)
+        assert isinstance(converted, np.ndarray)
+        assert converted.tolist() == [convert_units(x, start, final) for x in values]
+        assert converted is not array
+    with pytest.raises(IncompatibleUnitsError):
+        convert_units_array(array, "Hz", "rpm")
+
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(values, index=list("abcd"))
+    converted = convert_units_array(series, "degC", "K")
+    assert isinstance(converted, pd.Series)
+    assert list(converted.index) == list("abcd")
+    assert converted.tolist() == [convert_units(x, "degC", "K") for x in values]
+
+
+def test_convert_units_array_non_multiplicative():
+    """Test that arrays of offset and logarithmic values convert as Pint converts them."""
+    from gemd.units import convert_units_array
+
+    values = [-10.0, 0.0, 10.0, 33.5]
+    for start, final in (("dBm", "milliwatt"), ("dBW", "dBu"), ("mK", "degC")):
+        expected = [convert_units(x, start, final) for x in values]
+        assert convert_units_array(values, start, final) == expected
+
+        np = pytest.importorskip("numpy")
+        converted = convert_units_array(np.array(values), start, final)
+        assert isinstance(converted, np.ndarray)
+        assert converted.tolist() == pytest.approx(expected, rel=1e-12)
+
+        pd = pytest.importorskip("pandas")
+        converted = convert_units_array(pd.Series(values, index=list("wxyz")), start, final)
+        assert isinstance(converted, pd.Series)
+        assert list(converted.index) == list("wxyz")
+        assert converted.tolist() == pytest.approx(expected, rel=1e-12)
+    assert convert_units_array([10.0], "dBm", "milliwatt") == [pytest.approx(10, rel=1e-12)]
@@ -119,3 +119,23 @@ def test_more_iterable_types():
     res = recursive_flatmap(dct.values(), lambda x: [x.tags.pop(0)])
     assert "3" in res
     assert "3" not in obj.tags
+
+
+def test_flatten_unrecognized_type():
+    """Test that entities without a writable sort order cannot be flattened."""
+    from gemd.entity.base_entity import BaseEntity
+
+    class Unsortable(BaseEntity, typ="unsortable"):
+        def __init__(self, name="unsortable", uids=None):
+            super().__init__(uids=uids, tags=None)
+            self.name = name
+
+    with pytest.raises(ValueError, match="Unrecognized type"):
+        flatten(Unsortable(), scope="my")
+
+
+def test_flatten_strings_and_bytes():
+    """Test that scalars, strings and bytes are passed over, but their containers are not."""
+    spec = ProcessSpec(name="spec", uids={"my": "spec"})
+    nested = [b"bytes", "string", 1.0, {"key": (spec, None)}, {spec}]
+    assert [x.name for x in flatten(nested)] == ["spec"]
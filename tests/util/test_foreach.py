@@ -1,9 +1,16 @@
+import pytest
+
 from gemd.entity.attribute.property import Property
 from gemd.entity.bounds.real_bounds import RealBounds
-from gemd.entity.object import ProcessRun, MaterialRun, IngredientRun, MeasurementRun
+from gemd.demo.cake import make_cake
+from gemd.entity.object import ProcessRun, MaterialRun, IngredientRun, MeasurementRun, \
+    MaterialSpec, ProcessSpec
 from gemd.entity.template.property_template import PropertyTemplate
 from gemd.entity.value.nominal_real import NominalReal
-from gemd.util.impl import recursive_foreach
+from gemd.entity.dict_serializable import DictSerializable
+from gemd.entity.template.condition_template import ConditionTemplate
+from gemd.util import iter_entities, flatten, substitute_links
+from gemd.util.impl import recursive_foreach, recursive_flatmap, _traversal_schema
 
 
 def test_recursive_foreach():
@@ -46,3 +53,91 @@ def test_more_iterable_types():
     assert "3" in obj.tags
     recursive_foreach(dct.values(), lambda x: x.tags.remove("3"))
     assert "3" not in obj.tags
+
+
+def test_traversal_schema():
+    """Test that traversals descend into every field, except of values, bounds and links."""
+    mat_run = MaterialRun("foo", tags=["tag"], sample_type="experimental")
+    schema = _traversal_schema(mat_run)
+    assert schema.ordered == tuple(sorted(mat_run.__dict__))
+    assert "_measurements" not in schema.writable, "Skipped fields aren't writable"
+    assert "_process" in schema.writable
+    assert _traversal_schema(NominalReal(1.0, "")).ordered == ()
+    assert "name" in _traversal_schema(ConditionTemplate("cond", bounds=RealBounds(0, 1, ""))) \
+        .ordered
+
+    class Holder(DictSerializable, typ="traversal_holder"):
+        def __init__(self, label: str, contents: "UnknownType" = None):  # noqa: F821
+            self.label = label
+            self.contents = contents
+
+    held = MaterialRun("held")
+    holder = Holder("label", [held])
+    assert _traversal_schema(holder).ordered == ("contents", "label")
+    assert recursive_flatmap(holder, lambda x: [x]) == [held]
+    assert recursive_flatmap([holder, holder], lambda x: [x]) == [held], "Visit each once"
+    assert recursive_flatmap({"key": holder}, lambda x: [x]) == [held]
+
+    holder.extra = MaterialRun("extra")
+    assert "extra" in _traversal_schema(holder).ordered, "New fields recompile the schema"
+    assert len(recursive_flatmap(holder, lambda x: [x])) == 2
+
+
+def test_traversal_ignores_annotations():
+    """Test that an entity in a field annotated as a primitive is still visited."""
+    hidden = MaterialRun("hidden", uids={"test": "hidden"})
+    outer = ProcessRun("outer", uids={"test": "outer"}, notes=hidden)
+
+    visited = []
+    recursive_foreach(outer, visited.append)
+    assert hidden in visited
+    assert hidden in recursive_flatmap(outer, lambda x: [x])
+    assert hidden in list(iter_entities(outer))
+    assert hidden in flatten(outer)
+
+    substitute_links(outer, inplace=True)
+    assert outer.notes == hidden.to_link()
+
+
+def test_iter_entities():
+    """Test that iter_entities lazily yields what recursive_flatmap collects."""
+    cake = make_cake(seed=42)
+    for unidirectional in (True, False):
+        expected = recursive_flatmap(cake, lambda x: [x], unidirectional=unidirectional)
+        found = list(iter_entities(cake, unidirectional=unidirectional))
+        assert [id(x) for x in found] == [id(x) for x in expected]
+
+    everything = list(iter_entities(cake, unidirectional=False))
+    runs = list(iter_entities(cake, unidirectional=False, types=(MaterialRun, ProcessRun)))
+    assert runs == [x for x in everything if isinstance(x, (MaterialRun, ProcessRun))]
+
+    mat_run = MaterialRun("first")
+    assert list(iter_entities({"key": mat_run})) == [mat_run]
+    assert list(iter_entities({mat_run})) == [mat_run]
+
+    class Explosive:
+        def __iter__(self):
+            raise AssertionError("The walk should stop when the consumer does")
+
+    assert next(iter_entities([mat_run, Explosive()])) is mat_run
+
+
+def test_iter_entities_depth():
+    """Test that iter_entities respects depth limits."""
+    cake = make_cake(seed=42)
+    unlimited = list(iter_entities(cake, unidirectional=False))
+    assert list(iter_entities(cake, max_depth=0)) == [cake]
+    counts = [len(list(iter_entities(cake, unidirectional=False, max_depth=d)))
+              for d in range(len(unlimited))]
+    assert counts == sorted(counts)
+    assert counts[-1] == len(unlimited)
+
+    # An entity first reached beyond the limit is walked when reached again at a lower depth
+    process = ProcessSpec("process")
+    spec = MaterialSpec("spec", process=process)
+    run = MaterialRun("run", spec=spec)
+    assert set(iter_entities([run, spec], max_depth=1)) == {run, spec, process}
+    assert set(iter_entities([run], max_depth=1)) == {run, spec}
+
+    with pytest.raises(ValueError):
+        next(iter_entities(cake, max_depth=-1))
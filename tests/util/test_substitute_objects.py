@@ -1,3 +1,5 @@
+import pytest
+
 from gemd.util import substitute_objects, recursive_foreach, flatten, make_index, recursive_flatmap
 from gemd.util.impl import _substitute, _substitute_inplace
 from gemd.entity.object import MaterialSpec, MaterialRun, ProcessSpec, ProcessRun, IngredientRun, \
@@ -181,3 +183,57 @@ def test_sub_inplace_objects():
                         sub=lambda x: f"{x}s")
     assert run.name == "strings"
     assert run.notes == "notes"
+
+
+def _sequential_history(length: int) -> MaterialRun:
+    """Build a material history that is `length` process steps deep."""
+    material = MaterialRun("material 0", process=ProcessRun("process 0"))
+    for i in range(1, length):
+        process = ProcessRun(f"process {i}")
+        IngredientRun(material=material, process=process)
+        material = MaterialRun(f"material {i}", process=process)
+    return material
+
+
+def test_deep_histories():
+    """Substitution should not be limited by the recursion limit."""
+    root = _sequential_history(500)
+    links = flatten(root, scope="deep")
+    index = make_index(links)
+
+    flat_root = next(x for x in links if x.name == root.name)
+    ingredient = next(x for x in links
+                      if isinstance(x, IngredientRun) and x.process == flat_root.process)
+    rebuilt = substitute_objects(ingredient, index)
+    assert rebuilt.material.name == "material 498"
+    assert rebuilt.material.process.ingredients == [], "Ingredients are not restored in a copy"
+
+    substitute_objects(links, index, inplace=True)
+    assert flat_root.process.ingredients[0].material.name == "material 498"
+    assert flat_root == root
+
+
+def test_visited_strategies():
+    """Identity-based visiting handles unhashable contents and preserves shared structure."""
+    shared = [1, 2]
+    container = [shared, (shared, 3), shared]
+    with pytest.raises(TypeError):
+        _substitute(container, sub=lambda x: x, applies=lambda x: False)
+
+    result = _substitute(container, sub=lambda x: x + 1, applies=lambda x: isinstance(x, int),
+                         visited_strategy="id")
+    assert result == [[2, 3], ([2, 3], 4), [2, 3]]
+    assert result[0] is result[2] and result[0] is result[1][0]
+
+    inplace = _substitute_inplace(container, sub=lambda x: x + 1,
+                                  applies=lambda x: isinstance(x, int), visited_strategy="id")
+    assert inplace is container and container[0] is shared
+    assert container == [[2, 3], ([2, 3], 4), [2, 3]]
+
+    with pytest.raises(ValueError):
+        _substitute(container, sub=lambda x: x, applies=lambda x: False, visited_strategy="eq")
+
+    proc = ProcessRun("A process", uids={'id': '123'})
+    index = make_index([proc])
+    assert substitute_objects({"key": [proc.to_link()]}, index,
+                              visited_strategy="id") == {"key": [proc]}
@@ -0,0 +1,86 @@
+"""Test whole-graph validation."""
+from gemd.entity.attribute import Condition, Parameter, Property, PropertyAndConditions
+from gemd.entity.bounds import RealBounds
+from gemd.entity.bounds_validation import validation_level, WarningLevel
+from gemd.entity.link_by_uid import LinkByUID
+from gemd.entity.object import IngredientSpec, MaterialSpec, MeasurementRun, ProcessSpec
+from gemd.entity.template import ConditionTemplate, MaterialTemplate, ParameterTemplate, \
+    ProcessTemplate, PropertyTemplate
+from gemd.entity.value import NominalReal
+from gemd.validation import validate_graph, ValidationReport
+
+
+def _build_graph():
+    temperature = ConditionTemplate("temperature", bounds=RealBounds(0, 100, "degC"))
+    speed = ParameterTemplate("speed", bounds=RealBounds(0, 10, "m/s"))
+    density = PropertyTemplate("density", bounds=RealBounds(0, 10, "g/cm^3"))
+    mixing = ProcessTemplate("mixing",
+                             conditions=[[temperature, RealBounds(20, 50, "degC")]],
+                             parameters=[speed])
+    batter = MaterialTemplate("batter", properties=[density])
+
+    process = ProcessSpec("mix", template=mixing, uids={"test": "mix"}, conditions=[
+        Condition("temperature", template=temperature, value=NominalReal(150, "degC")),
+        Condition("temperature", template=temperature, value=NominalReal(70, "degC")),
+        Condition("temperature", template=temperature, value=NominalReal(30, "degC")),
+        Condition("temperature", template=LinkByUID("test", "temp"),
+                  value=NominalReal(999, "degC")),  # Can't be checked
+    ], parameters=[Parameter("speed", template=speed, value=NominalReal(20, "m/s"))])
+    material = MaterialSpec("batter", template=batter, process=process, properties=[
+        PropertyAndConditions(
+            property=Property("density", template=density, value=NominalReal(20, "g/cm^3")),
+            conditions=[Condition("temperature", template=temperature,
+                                  value=NominalReal(-300, "degC"))]
+        )
+    ])
+    flour = MaterialSpec("flour")
+    for i in range(10):
+        IngredientSpec(f"flour {i}", material=flour, process=process,
+                       mass_fraction=NominalReal(2, ""),
+                       absolute_quantity=NominalReal(-1 if i % 2 else 1, "kg"))
+    return material, temperature, mixing
+
+
+def test_validate_graph():
+    """Test that violations are counted per template and per quantity."""
+    with validation_level(WarningLevel.IGNORE):
+        material, temperature, mixing = _build_graph()
+
+    report = validate_graph(material, max_samples=3)
+    assert isinstance(report, ValidationReport)
+    assert report.entities == 18
+    assert not report.is_valid
+
+    attributes = {summary.subject.name: summary for summary in report.attribute_templates}
+    assert attributes["temperature"].subject is temperature
+    assert attributes["temperature"][1:] == (4, 2, [material, LinkByUID("test", "mix")])
+    assert attributes["speed"][1:3] == (1, 1)
+    assert attributes["density"][1:] == (1, 1, [material])
+
+    objects = {summary.subject.name: summary for summary in report.object_templates}
+    assert objects["mixing"].subject is mixing
+    assert objects["mixing"][1:] == (5, 3, [LinkByUID("test", "mix")])
+    assert objects["batter"][1:3] == (1, 1)
+
+    quantities = {summary.subject: summary for summary in report.quantities}
+    assert quantities["mass_fraction"][1:3] == (10, 10)
+    assert len(quantities["mass_fraction"].samples) == 3
+    assert quantities["absolute_quantity"][1:3] == (10, 5)
+    assert report.failed == 2 + 1 + 1 + 3 + 1 + 10 + 5
+
+    text = str(report)
+    assert text.startswith("23 values out of bounds in 18 entities")
+    assert "ConditionTemplate 'temperature': 2 of 4 (e.g. MaterialSpec 'batter', test:mix)" \
+        in text
+    assert "absolute_quantity: 5 of 10" in text
+
+    valid = validate_graph(ProcessSpec("empty", template=mixing))
+    assert valid.is_valid
+    assert str(valid) == "0 values out of bounds in 4 entities"
+
+    density = PropertyTemplate("density", bounds=RealBounds(0, 10, "g/cm^3"))
+    measured = MeasurementRun("weigh", properties=[
+        Property("density", template=density, value=NominalReal(value, "g/cm^3"))
+        for value in (5, 20)
+    ])
+    assert validate_graph(measured).attribute_templates[0][1:] == (2, 1, [measured])